@@ -0,0 +1 @@
+"""Benchmarks run against generated databases (not shipped with the app)."""
@@ -0,0 +1,441 @@
+"""Synthetic club databases at production scale.
+
+    python -m benchmarks.dataset data/bench/club_100000.db --families 100000 --seed 7
+
+generate() fills an empty, migrated database with `families` families
+(1k to 1M) shaped like the club's real data:
+
+- shared numero_socio families of one to five socios - titular, partner,
+  children carrying the family's first surname - with exactly one
+  titular each, and accented Spanish names drawn with realistic skew;
+- `meses` monthly períodos ending with `hasta`'s month, all but the last
+  closed, as rollover leaves them;
+- a cuota Cargo per active family and período (from its alta month,
+  until a baja), and Pagos following a per-family habit - punctual,
+  irregular (sometimes catching up on everything owed) or moroso - with
+  REMESA payments occasionally bounced as a Devolución and the odd
+  partial Reembolso of a Pago;
+- saldos_socios for every family and período, computed here with the
+  balance engine's signs rather than by rebuild_saldos;
+- audit-log rows as the services write them: one per alta, per manual
+  movement and per período's cuota run.
+
+Deterministic: the same arguments and seed always produce the same rows -
+ids included - since every draw comes from one random.Random(seed) and
+`hasta` is explicit (build_database defaults it to the current month).
+
+Rows are loaded with the DB-API cursor's executemany, `_BLOCK` families
+per committed transaction, so memory stays flat at any size. Secondary
+indexes and the socios_fts triggers are dropped for the load and
+recreated once at the end (database/indexes.py, database/socios_fts.py),
+and the derived etiquetas_socio/deudores tables are rebuilt from the
+result. A million families is tens of millions of rows; expect minutes.
+"""
+from __future__ import annotations
+
+import argparse
+import datetime
+import itertools
+import os
+import random
+from decimal import Decimal
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+CUOTA = Decimal("36.00")
+MESES = 12
+
+# Families loaded per committed transaction.
+_BLOCK = 5000
+
+# Family size distribution (socios per numero_socio).
+_TAMANOS = (1, 2, 3, 4, 5)
+_TAMANOS_PESOS = (45, 25, 18, 9, 3)
+
+# Payment habits: (name, weight, chance of paying in a given month,
+# chance that a payment settles everything owed rather than one cuota).
+_HABITOS = (
+    ("puntual", 75, 0.97, 1.0),
+    ("irregular", 18, 0.70, 0.5),
+    ("moroso", 7, 0.25, 0.3),
+)
+# Share of families that join during the generated window, and that
+# leave (baja) before its end.
+_ALTAS_EN_VENTANA = 0.15
+_BAJAS = 0.05
+# Chance a REMESA Pago is bounced (Devolución), and that a Pago is
+# partly refunded (Reembolso).
+_DEVOLUCION = 0.02
+_REEMBOLSO = 0.003
+_REGLA = "Cuota general"
+
+_NOMBRES = (
+    "María", "José", "Lucía", "Antonio", "Carmen", "Manuel", "Ana", "Francisco", "Isabel", "David",
+    "Laura", "Jesús", "Marta", "Javier", "Elena", "Ángel", "Sofía", "Raúl", "Cristina", "Álvaro",
+    "Begoña", "Ramón", "Inés", "Adrián", "Mónica", "Óscar", "Verónica", "Víctor", "Nerea", "Íñigo",
+    "Rocío", "Martín", "Aitor", "Pilar", "Sergio", "Nuria", "Andrés", "Belén", "Julián", "Concepción",
+)
+_APELLIDOS = (
+    "García", "Rodríguez", "González", "Fernández", "López", "Martínez", "Sánchez", "Pérez", "Gómez",
+    "Martín", "Jiménez", "Ruiz", "Hernández", "Díaz", "Moreno", "Muñoz", "Álvarez", "Romero", "Alonso",
+    "Gutiérrez", "Navarro", "Torres", "Domínguez", "Vázquez", "Ramos", "Gil", "Ramírez", "Serrano",
+    "Blanco", "Molina", "Morales", "Suárez", "Ortega", "Delgado", "Castro", "Ortiz", "Rubio", "Marín",
+    "Sanz", "Núñez", "Iglesias", "Medina", "Garrido", "Cortés", "Castillo", "Santos", "Lozano",
+    "Guerrero", "Cano", "Prieto", "Méndez", "Calvo", "Gallego", "Vidal", "León", "Márquez", "Peña",
+)
+
+
+def _zipf(values) -> List[float]:
+    """Cumulative weights falling off like real name frequencies."""
+    return list(itertools.accumulate(1 / (rank + 1) ** 0.8 for rank in range(len(values))))
+
+
+_NOMBRES_PESOS = _zipf(_NOMBRES)
+_APELLIDOS_PESOS = _zipf(_APELLIDOS)
+_HABITOS_PESOS = list(itertools.accumulate(peso for _, peso, _, _ in _HABITOS))
+_TAMANOS_ACUM = list(itertools.accumulate(_TAMANOS_PESOS))
+
+
+def _month_start(fecha: datetime.date, back: int) -> datetime.date:
+    index = fecha.year * 12 + fecha.month - 1 - back
+    return datetime.date(index // 12, index % 12 + 1, 1)
+
+
+class _Generator:
+    """One generation run: the random stream, id counters and the
+    reference rows every family refers to."""
+
+    def __init__(self, rng: random.Random, periodos, metodos: Dict[str, int], cuota: Decimal) -> None:
+        from database.fingerprints import transaccion_fingerprint
+        from features.transactions.service import CUOTA_REFERENCIA
+        from utils.text import normalize_for_match
+
+        self.rng = rng
+        self.periodos = periodos  # [(id_periodo, nombre, fecha_inicio, fecha_fin)]
+        self.metodos = metodos
+        self.cuota = cuota
+        self.fingerprint = transaccion_fingerprint
+        self.normalize = normalize_for_match
+        self.cuota_referencia = CUOTA_REFERENCIA
+        self.next_socio = itertools.count(1)
+        self.next_tx = itertools.count(1)
+        self.next_log = itertools.count(1)
+        self.rows: Dict[str, list] = {"socios": [], "transacciones": [], "saldos_socios": [], "logs": []}
+        # id_periodo -> [cargos, first id, last id], for the cuota-run logs.
+        self.cuotas: Dict[int, list] = {}
+
+    def _nombre(self) -> str:
+        return self.rng.choices(_NOMBRES, cum_weights=_NOMBRES_PESOS)[0]
+
+    def _apellido(self) -> str:
+        return self.rng.choices(_APELLIDOS, cum_weights=_APELLIDOS_PESOS)[0]
+
+    def _log(self, id_socio, accion, tabla, id_registro, descripcion, cuando: datetime.date) -> None:
+        self.rows["logs"].append(
+            (
+                next(self.next_log),
+                id_socio,
+                accion,
+                tabla,
+                id_registro,
+                descripcion,
+                self.normalize(descripcion),
+                f"{cuando.isoformat()} {self.rng.randrange(9, 21):02d}:{self.rng.randrange(60):02d}:00.000000",
+            )
+        )
+
+    def _movimiento(self, numero, id_periodo, tipo, monto: Decimal, metodo, fecha, referencia=None) -> None:
+        id_tx = next(self.next_tx)
+        self.rows["transacciones"].append(
+            (
+                id_tx,
+                numero,
+                id_periodo,
+                metodo,
+                tipo,
+                float(monto),
+                fecha.isoformat(),
+                referencia,
+                self.fingerprint(numero, tipo, monto, id_periodo, metodo, fecha),
+            )
+        )
+        if referencia == self.cuota_referencia:
+            run = self.cuotas.setdefault(id_periodo, [0, id_tx, id_tx])
+            run[0] += 1
+            run[2] = id_tx
+        else:
+            self._log(None, "crear", "transacciones", id_tx, f"Alta de {tipo} de {monto} para numero_socio={numero}", fecha)
+
+    def _socios(self, numero: str, alta: datetime.date, estado: str) -> None:
+        rng = self.rng
+        tamano = rng.choices(_TAMANOS, cum_weights=_TAMANOS_ACUM)[0]
+        primero, segundo = self._apellido(), self._apellido()
+        pareja = (self._apellido(), self._apellido())
+        for miembro in range(tamano):
+            nombre = self._nombre()
+            if miembro == 0:
+                apellidos = f"{primero} {segundo}"
+            elif miembro == 1:
+                apellidos = " ".join(pareja)
+            else:
+                apellidos = f"{primero} {pareja[0]}"
+            # Children share the titular's contact details.
+            email = None
+            if miembro < 2:
+                email = f"{self.normalize(nombre)}.{self.normalize(apellidos.split()[0])}{numero}@example.com"
+            id_socio = next(self.next_socio)
+            self.rows["socios"].append(
+                (
+                    id_socio,
+                    numero,
+                    nombre,
+                    apellidos,
+                    f"6{rng.randrange(10**8):08d}",
+                    email,
+                    alta.isoformat(),
+                    estado,
+                    None,
+                    1 if miembro == 0 else 0,
+                    self.normalize(nombre),
+                    self.normalize(apellidos),
+                    self.normalize(email),
+                )
+            )
+            self._log(
+                id_socio,
+                "crear",
+                "socios",
+                id_socio,
+                f"Alta de socio numero_socio={numero} nombre={nombre} {apellidos}",
+                alta,
+            )
+
+    def familia(self, n: int) -> None:
+        rng = self.rng
+        numero = str(n)
+        meses = len(self.periodos)
+        alta_mes = rng.randrange(1, meses) if meses > 1 and rng.random() < _ALTAS_EN_VENTANA else 0
+        baja_mes = rng.randrange(alta_mes + 1, meses) if alta_mes + 1 < meses and rng.random() < _BAJAS else None
+        _, _, pago_prob, liquida_prob = rng.choices(_HABITOS, cum_weights=_HABITOS_PESOS)[0]
+        metodo_nombre = rng.choices(("REMESA", "TRANSFERENCIA", "EFECTIVO"), weights=(60, 25, 15))[0]
+        metodo = self.metodos[metodo_nombre]
+
+        alta = self.periodos[alta_mes][2]
+        if alta_mes == 0:
+            alta -= datetime.timedelta(days=rng.randrange(1, 3650))
+        self._socios(numero, alta, "activo" if baja_mes is None else "inactivo")
+
+        saldo = Decimal("0.00")
+        for mes in range(alta_mes, meses):
+            id_periodo, _, inicio, fin = self.periodos[mes]
+            totales = {"Cargo": Decimal(0), "Pago": Decimal(0), "Reembolso": Decimal(0), "Devolución": Decimal(0)}
+            activa = baja_mes is None or mes < baja_mes
+            if activa:
+                self._movimiento(numero, id_periodo, "Cargo", self.cuota, None, inicio, self.cuota_referencia)
+                totales["Cargo"] += self.cuota
+                debe = saldo + self.cuota
+                if debe > 0 and rng.random() < pago_prob:
+                    monto = debe if rng.random() < liquida_prob else min(self.cuota, debe)
+                    dia = inicio + datetime.timedelta(days=rng.randrange(0, 10 if pago_prob > 0.9 else (fin - inicio).days))
+                    self._movimiento(numero, id_periodo, "Pago", monto, metodo, dia)
+                    totales["Pago"] += monto
+                    if metodo_nombre == "REMESA" and rng.random() < _DEVOLUCION:
+                        devuelta = min(dia + datetime.timedelta(days=rng.randrange(2, 8)), fin)
+                        self._movimiento(numero, id_periodo, "Devolución", monto, metodo, devuelta)
+                        totales["Devolución"] += monto
+                    elif rng.random() < _REEMBOLSO:
+                        parte = (monto * Decimal(rng.randrange(10, 51)) / 100).quantize(Decimal("0.01"))
+                        self._movimiento(numero, id_periodo, "Reembolso", parte, metodo, min(dia + datetime.timedelta(days=3), fin))
+                        totales["Reembolso"] += parte
+            anterior = saldo
+            saldo = anterior + totales["Cargo"] - totales["Pago"] - totales["Reembolso"] + totales["Devolución"]
+            self.rows["saldos_socios"].append(
+                (
+                    numero,
+                    id_periodo,
+                    float(anterior),
+                    float(totales["Cargo"]),
+                    float(totales["Pago"]),
+                    float(totales["Reembolso"]),
+                    float(totales["Devolución"]),
+                    float(saldo),
+                )
+            )
+
+    def cuota_logs(self, regla: str) -> None:
+        """One log per período's cuota run, as generate_cuotas writes it."""
+        for id_periodo, nombre, inicio, _ in self.periodos:
+            if id_periodo in self.cuotas:
+                creados, primero, ultimo = self.cuotas[id_periodo]
+                self._log(
+                    None,
+                    "crear",
+                    "transacciones",
+                    None,
+                    f"Generación de cuotas de '{nombre}': {creados} cargo(s) de {self.cuota}€ "
+                    f"(regla '{regla}'), ids {primero}-{ultimo}",
+                    inicio,
+                )
+
+    def flush(self, cursor) -> Dict[str, int]:
+        written = {table: len(rows) for table, rows in self.rows.items()}
+        cursor.executemany(
+            "INSERT INTO socios (id_socio, numero_socio, nombre, apellidos, telefono, email, fecha_alta, estado, "
+            "observaciones, es_titular, nombre_norm, apellidos_norm, email_norm) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            self.rows["socios"],
+        )
+        cursor.executemany(
+            "INSERT INTO transacciones (id_transaccion, numero_socio, id_periodo, id_metodo, tipo, monto, fecha, "
+            "referencia, fingerprint) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            self.rows["transacciones"],
+        )
+        cursor.executemany(
+            "INSERT INTO saldos_socios (numero_socio, id_periodo, saldo_anterior, cargos, pagos, reembolsos, "
+            "devoluciones, saldo_actual) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            self.rows["saldos_socios"],
+        )
+        cursor.executemany(
+            "INSERT INTO logs (id_log, id_socio, accion, tabla_afectada, id_registro_afectado, descripcion_cambio, "
+            "descripcion_norm, fecha_hora) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            self.rows["logs"],
+        )
+        for rows in self.rows.values():
+            rows.clear()
+        return written
+
+
+def generate(
+    families: int,
+    seed: int = 0,
+    meses: int = MESES,
+    hasta: Optional[datetime.date] = None,
+    cuota: Decimal = CUOTA,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> Dict[str, int]:
+    """Fill the (empty, migrated) database bound to database.session with
+    `families` families over `meses` períodos ending with `hasta`'s month.
+    Returns the rows written per table. `progress(hechas, total)` is
+    called after each committed block of families."""
+    from sqlalchemy import text
+
+    from database.deudores import rebuild_deudores
+    from database.indexes import ensure_indexes
+    from database.models import Base, MetodoPago, Periodo, ReglaCobro, Socio
+    from database.seed_db import seed_metodos_pago
+    from database.session import engine
+    from database.socio_labels import invalidate_names, rebuild_labels
+    from database.socios_fts import ensure_socios_fts
+    from features.periodos.service import PERIODO_ABIERTO, PERIODO_CERRADO, fecha_fin_mensual, nombre_mensual
+
+    if families < 1 or meses < 1:
+        raise ValueError("families and meses must be positive")
+    hasta = hasta or datetime.date.today()
+    seed_metodos_pago()
+
+    with engine.begin() as conn:
+        if conn.execute(Socio.__table__.select().limit(1)).first() is not None:
+            raise ValueError("generate() needs an empty database")
+        metodos = {row.nombre: row.id_metodo for row in conn.execute(MetodoPago.__table__.select())}
+        periodos = []
+        for back in range(meses - 1, -1, -1):
+            inicio = _month_start(hasta, back)
+            periodos.append(
+                {
+                    "nombre": nombre_mensual(inicio),
+                    "fecha_inicio": inicio,
+                    "fecha_fin": fecha_fin_mensual(inicio),
+                    "estado": PERIODO_ABIERTO if back == 0 else PERIODO_CERRADO,
+                }
+            )
+        conn.execute(Periodo.__table__.insert(), periodos)
+        conn.execute(
+            ReglaCobro.__table__.insert(),
+            {"descripcion": _REGLA, "cuota_mensual": cuota, "plazo_pago": 10, "descuento": Decimal(0)},
+        )
+        filas_periodo = [
+            (row.id_periodo, row.nombre, row.fecha_inicio, row.fecha_fin)
+            for row in conn.execute(Periodo.__table__.select().order_by(Periodo.fecha_inicio))
+        ]
+        # Bulk-load without maintaining secondary indexes or the FTS
+        # triggers row by row; both come back in one pass at the end.
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                conn.execute(text(f"DROP INDEX IF EXISTS {index.name}"))
+        conn.execute(text("DROP TABLE IF EXISTS socios_fts"))
+        for trigger in ("socios_fts_ai", "socios_fts_ad", "socios_fts_au"):
+            conn.execute(text(f"DROP TRIGGER IF EXISTS {trigger}"))
+
+    generator = _Generator(random.Random(seed), filas_periodo, metodos, cuota)
+    written = {"periodo": len(filas_periodo)}
+    for start in range(1, families + 1, _BLOCK):
+        ultima = min(start + _BLOCK, families + 1)
+        for n in range(start, ultima):
+            generator.familia(n)
+        if ultima > families:
+            generator.cuota_logs(_REGLA)
+        with engine.begin() as conn:
+            for table, count in generator.flush(conn.connection.driver_connection.cursor()).items():
+                written[table] = written.get(table, 0) + count
+        if progress is not None:
+            progress(ultima - 1, families)
+
+    ensure_indexes(engine)
+    with engine.begin() as conn:
+        ensure_socios_fts(conn)
+        rebuild_labels(conn)
+        rebuild_deudores(conn)
+    invalidate_names()
+    return written
+
+
+def build_database(
+    path: Path,
+    families: int,
+    seed: int = 0,
+    meses: int = MESES,
+    hasta: Optional[datetime.date] = None,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> Dict[str, int]:
+    """Create `path` (which must not exist yet), migrate it and generate
+    into it. Binds database.session to `path` through CLUBAPP_DB_PATH, so
+    only call it in a process that hasn't imported database.session -
+    see main()."""
+    os.environ["CLUBAPP_DB_PATH"] = str(path)
+
+    from database.init_db import init_db
+    from database.session import engine
+
+    init_db()
+    # Nothing else is open on a file being created; skip the per-commit fsync.
+    with engine.connect() as conn:
+        conn.exec_driver_sql("PRAGMA synchronous=OFF")
+    return generate(families, seed, meses, hasta, progress=progress)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--families", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--meses", type=int, default=MESES)
+    parser.add_argument(
+        "--hasta", type=datetime.date.fromisoformat, default=None, help="last período's month, YYYY-MM-DD (default: today)"
+    )
+    args = parser.parse_args(argv)
+    if args.path.exists():
+        parser.error(f"{args.path} already exists")
+    args.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def _progress(hechas: int, total: int) -> None:
+        print(f"\r{hechas}/{total} familias", end="", flush=True)
+
+    written = build_database(args.path, args.families, args.seed, args.meses, args.hasta, _progress)
+    print()
+    for table, count in written.items():
+        print(f"{table}: {count}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
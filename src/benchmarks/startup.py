@@ -0,0 +1,245 @@
+"""Startup and screen-open latency benchmark.
+
+    python -m benchmarks.startup --families 1000 10000 --repeat 5 --out bench.json
+    python -m benchmarks.startup --families 10000 --baseline bench.json
+
+For each size, builds a generated database once (benchmarks/dataset.py,
+kept under data/bench/ for reuse, one per month so its last período is
+the current one) and then launches a fresh interpreter per run, on Qt's
+offscreen platform, that goes through the app's real startup path and
+times each phase:
+
+- import_database: importing database.init_db (SQLAlchemy and the models)
+- init_db: the startup migrations on an up-to-date database
+- import_ui: importing ui.main_window
+- first_window: QApplication + MainWindow shown and its events processed
+- members / transactions / audit_log: the screen's show_* route, from the
+  click until its table has its first rows (module import included, as on
+  a real first navigation)
+
+A fresh process per run is the point: imports and caches only cost
+anything the first time. Each run also gets its own throwaway copy of
+the cached database - opening Transacciones runs the período rollover,
+which would otherwise write into the cache and leave later runs (and
+--baseline comparisons) measuring a different database. One discarded
+warm-up run per size evens out the OS file cache. Results are JSON -
+the commit, each phase's min/median/max in milliseconds per size - and
+--baseline prints the change against an earlier result file.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+PHASES = ("import_database", "init_db", "import_ui", "first_window", "members", "transactions", "audit_log")
+
+SRC = Path(__file__).resolve().parents[1]
+
+# Longest a screen may take to show its first rows before the run fails.
+_SCREEN_TIMEOUT = 120.0
+
+
+def _wait_for(app, predicate: Callable[[], bool], timeout: float = _SCREEN_TIMEOUT) -> None:
+    deadline = time.perf_counter() + timeout
+    while not predicate():
+        if time.perf_counter() > deadline:
+            raise TimeoutError("screen never populated")
+        app.processEvents()
+        time.sleep(0.0005)
+
+
+def _child() -> Dict[str, float]:
+    """One measured startup, in this (fresh) process. Returns seconds per
+    phase."""
+    timings: Dict[str, float] = {}
+    start = time.perf_counter()
+    import database.init_db as init_db_module
+
+    timings["import_database"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    init_db_module.init_db()
+    timings["init_db"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    from PySide6.QtWidgets import QApplication
+
+    from ui.main_window import MainWindow
+
+    timings["import_ui"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    app = QApplication([])
+    window = MainWindow()
+    window.show()
+    app.processEvents()
+    timings["first_window"] = time.perf_counter() - start
+
+    from ui.views import main_menu_widget
+
+    screens = (
+        ("members", main_menu_widget.show_members_view, "_members_view"),
+        ("transactions", main_menu_widget.show_transactions_view, "_transactions_view"),
+        ("audit_log", None, "_audit_log_view"),
+    )
+    for phase, route, attr in screens:
+        start = time.perf_counter()
+        if route is None:
+            # Ajustes → Registro de auditoría, timing only the second step.
+            from features.settings import menu_view
+
+            route = menu_view.show_audit_log_view
+        route(window)
+        view = getattr(window, attr)
+        _wait_for(app, lambda: view.model.rowCount() > 0)
+        timings[phase] = time.perf_counter() - start
+    return timings
+
+
+def _run_child(db_path: Path) -> Dict[str, float]:
+    env = dict(os.environ, CLUBAPP_DB_PATH=str(db_path), QT_QPA_PLATFORM="offscreen", PYTHONPATH=str(SRC))
+    result = subprocess.run(
+        [sys.executable, "-m", "benchmarks.startup", "--child"],
+        cwd=SRC,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"benchmark run failed:\n{result.stderr[-2000:]}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def _ensure_database(db_dir: Path, families: int, seed: int) -> Path:
+    # Keyed by month: its períodos end with the current one, so rollover
+    # has nothing to add during a run.
+    mes = date.today().replace(day=1)
+    path = db_dir / f"club_{families}_s{seed}_{mes:%Y-%m}.db"
+    if not path.exists():
+        db_dir.mkdir(parents=True, exist_ok=True)
+        started = time.perf_counter()
+        env = dict(os.environ, PYTHONPATH=str(SRC))
+        subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "benchmarks.dataset",
+                str(path),
+                "--families",
+                str(families),
+                "--seed",
+                str(seed),
+                "--hasta",
+                mes.isoformat(),
+            ],
+            cwd=SRC,
+            env=env,
+            check=True,
+            capture_output=True,
+        )
+        print(f"built {path.name} in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+    return path
+
+
+def _commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=SRC, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmark(families: List[int], repeat: int, db_dir: Path, seed: int = 0) -> dict:
+    """Benchmark every size in `families`; returns the JSON-ready result."""
+    results = []
+    with tempfile.TemporaryDirectory(prefix="clubapp-bench-") as scratch:
+        for size in families:
+            path = _ensure_database(db_dir, size, seed)
+
+            def _run_on_copy() -> Dict[str, float]:
+                copy = Path(scratch) / path.name
+                shutil.copyfile(path, copy)
+                return _run_child(copy)
+
+            _run_on_copy()  # warm-up, discarded
+            runs = [_run_on_copy() for _ in range(repeat)]
+            phases = {}
+            for phase in PHASES:
+                values = [run[phase] * 1000 for run in runs]
+                phases[phase] = {
+                    "min_ms": round(min(values), 2),
+                    "median_ms": round(statistics.median(values), 2),
+                    "max_ms": round(max(values), 2),
+                }
+            results.append({"families": size, "db_bytes": path.stat().st_size, "runs": repeat, "phases": phases})
+    return {
+        "commit": _commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict) -> List[str]:
+    """One line per phase and size present in both: median before → after."""
+    before = {entry["families"]: entry["phases"] for entry in baseline.get("results", [])}
+    lines = []
+    for entry in current["results"]:
+        old = before.get(entry["families"])
+        if old is None:
+            continue
+        for phase in PHASES:
+            if phase not in old:
+                continue
+            was, now = old[phase]["median_ms"], entry["phases"][phase]["median_ms"]
+            change = (now - was) / was * 100 if was else 0.0
+            lines.append(f"{entry['families']:>8} {phase:<16} {was:>10.1f} → {now:>10.1f} ms ({change:+.1f}%)")
+    return lines
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--families", type=int, nargs="+", default=[1000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--db-dir", type=Path, default=None, help="where generated databases are kept")
+    parser.add_argument("--out", type=Path, help="write the JSON result here instead of stdout")
+    parser.add_argument("--baseline", type=Path, help="earlier result file to compare against")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(_child()))
+        return 0
+
+    if args.db_dir is None:
+        from config import DATA_DIR
+
+        args.db_dir = DATA_DIR / "bench"
+    result = run_benchmark(args.families, args.repeat, args.db_dir, args.seed)
+    text = json.dumps(result, indent=2)
+    if args.out:
+        args.out.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    if args.baseline:
+        for line in compare(result, json.loads(args.baseline.read_text(encoding="utf-8"))):
+            print(line, file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,63 @@
+"""Deferred imports for feature screens.
+
+Importing a feature's view pulls in its toolbar, dialogs, services and,
+through them, SQLAlchemy and the models - most of the app's import time.
+The main menu only needs to know which function opens each screen, so it
+names them as (module, function) and imports the module on the first
+click; after that the import system's cache makes it a dict lookup.
+Feature packages re-export their views the same way (lazy_exports), so
+importing a sibling module doesn't drag every screen in with it.
+
+prefetch() imports the likely next screens on a daemon thread once the
+main window is up, so the first click usually finds them loaded. It only
+imports modules - building widgets stays on the GUI thread.
+"""
+from __future__ import annotations
+
+import importlib
+import threading
+from typing import Any, Callable, Dict, Iterable
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def lazy_view(module: str, attr: str) -> Callable[[Any], Any]:
+    """A `show_*_view(main_window)` handler that imports `module` on first
+    call and delegates to its `attr`."""
+
+    def _show(main_window) -> Any:
+        return getattr(importlib.import_module(module), attr)(main_window)
+
+    _show.__name__ = _show.__qualname__ = attr
+    return _show
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Callable[[str], Any]:
+    """A module-level __getattr__ (PEP 562) for `package` that resolves
+    each name in `exports` - name -> relative module - on first access."""
+
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        return getattr(importlib.import_module(module, package), name)
+
+    return __getattr__
+
+
+def _import_all(modules: Iterable[str]) -> None:
+    for module in modules:
+        try:
+            importlib.import_module(module)
+        except Exception:
+            logger.exception("prefetch: failed to import %s", module)
+
+
+def prefetch(modules: Iterable[str]) -> threading.Thread:
+    """Import `modules` in order on a daemon thread; returns the thread.
+    Failures are logged and left for the real navigation to report."""
+    thread = threading.Thread(target=_import_all, args=(list(modules),), name="prefetch", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,101 @@
+"""Background execution of list-screen queries.
+
+Members, Transacciones and the audit log used to run their search query
+on the GUI thread, so a slow query froze the window - including while the
+user was still typing, since the search is debounced live. QueryRunner
+runs the service call on a worker thread and hands the plain row data
+back on the GUI thread through a queued signal.
+
+Only the latest request counts: submitting a new one discards any request
+still waiting to start, and the result of one already running is dropped
+when it arrives. Each runner has a single worker thread, so one screen
+never has more than one query in flight against SQLite.
+
+Service calls are safe to run off-thread as they are: each opens its own
+get_session(), and the SQLite engine's pooled connections aren't tied to
+the thread that created them. Nothing on the worker thread may touch a Qt
+widget or model - the callback does that.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, Optional
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class _Relay(QObject):
+    """Owned by the runner (so it lives on the GUI thread); tasks emit on it
+    from the worker thread, which makes the connection a queued one."""
+
+    # request id, succeeded, result
+    done = Signal(int, bool, object)
+
+
+class _QueryTask(QRunnable):
+    def __init__(self, relay: _Relay, request_id: int, fn: Callable[..., Any], args: tuple, kwargs: dict) -> None:
+        super().__init__()
+        self._relay = relay
+        self._request_id = request_id
+        self._fn = fn
+        self._args = args
+        self._kwargs = kwargs
+
+    def run(self) -> None:
+        try:
+            result = self._fn(*self._args, **self._kwargs)
+        except Exception:
+            logger.exception("QueryRunner: %s failed", getattr(self._fn, "__qualname__", self._fn))
+            self._relay.done.emit(self._request_id, False, None)
+            return
+        self._relay.done.emit(self._request_id, True, result)
+
+
+class QueryRunner(QObject):
+    """Runs one query at a time off the GUI thread; latest request wins."""
+
+    def __init__(self, parent: QObject = None) -> None:
+        super().__init__(parent)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._relay = _Relay(self)
+        self._relay.done.connect(self._on_done)
+        self._latest = 0
+        self._on_result: Optional[Callable[[Any], None]] = None
+
+    def submit(self, fn: Callable[..., Any], *args: Any, on_result: Callable[[Any], None], **kwargs: Any) -> int:
+        """Run `fn(*args, **kwargs)` on the worker thread and call
+        `on_result(result)` on the GUI thread, unless a newer request has
+        been submitted by then. Returns the request id."""
+        self._pool.clear()
+        self._latest += 1
+        self._on_result = on_result
+        self._pool.start(_QueryTask(self._relay, self._latest, fn, args, kwargs))
+        return self._latest
+
+    def cancel(self) -> None:
+        """Drop every pending or running request's result."""
+        self._pool.clear()
+        self._latest += 1
+        self._on_result = None
+
+    def is_busy(self) -> bool:
+        """True while the latest request's result hasn't been delivered."""
+        return self._on_result is not None
+
+    def wait(self, msecs: int = -1) -> bool:
+        """Block until the worker is idle (tests, shutdown). Results still
+        arrive through the event loop afterwards."""
+        return self._pool.waitForDone(msecs)
+
+    @Slot(int, bool, object)
+    def _on_done(self, request_id: int, succeeded: bool, result: Any) -> None:
+        if request_id != self._latest or self._on_result is None:
+            logger.debug("QueryRunner: dropped superseded request %d", request_id)
+            return
+        callback, self._on_result = self._on_result, None
+        if succeeded:
+            callback(result)
@@ -0,0 +1,140 @@
+"""Read-only, array-backed table model shared by the results screens.
+
+Members, Transacciones and the audit log used to rebuild a
+QStandardItemModel on every load: one QStandardItem per cell, created and
+appended in Python. RowTableModel instead keeps each row as the plain
+tuple the service produced and formats a cell only when the view asks for
+it in data(), so a refresh costs one list assignment and memory/paint time
+scale with the rows on screen rather than with rows x columns.
+
+Sorting never touches the rows either: sort_rows() computes a permutation
+of row indexes from per-column sort keys (cached until the next load) and
+data() reads through it, so re-sorting a large roster is one key sort.
+
+Cells are never editable (PLAN.md 4.5 - the dialogs are the only way to
+change data). Call sites that used `model.item(r, c).text()` use
+`model.text(r, c)` instead.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+
+class RowTableModel(QAbstractTableModel):
+    """Table model over a list of row tuples plus a header list."""
+
+    def __init__(self, headers: Optional[Sequence[str]] = None, parent=None) -> None:
+        super().__init__(parent)
+        self._headers: List[str] = [str(h) for h in headers] if headers else []
+        self._rows: List[Sequence[Any]] = []
+        # view row -> index into _rows; None while unsorted (load order)
+        self._order: Optional[List[int]] = None
+        # column -> one sort key per entry of _rows, dropped on every load
+        self._sort_keys: Dict[int, List[Any]] = {}
+
+    # ---------------------- loading ------------------------------------
+
+    def set_rows(self, headers: Sequence[str], rows: List[Sequence[Any]]) -> None:
+        """Replace headers and every row in one model reset."""
+        self.beginResetModel()
+        self._headers = [str(h) for h in headers]
+        self._rows = list(rows)
+        self._order = None
+        self._sort_keys = {}
+        self.endResetModel()
+
+    def append_rows(self, rows: List[Sequence[Any]]) -> None:
+        """Append rows at the bottom (e.g. a further page)."""
+        if not rows:
+            return
+        start = len(self._rows)
+        self.beginInsertRows(QModelIndex(), start, start + len(rows) - 1)
+        if self._order is not None:
+            self._order.extend(range(start, start + len(rows)))
+        self._rows.extend(rows)
+        self._sort_keys = {}
+        self.endInsertRows()
+
+    # ---------------------- ordering -----------------------------------
+
+    def sort_rows(self, column: int, key: Callable[[str], Any], descending: bool = False) -> None:
+        """Reorder the view by `key(cell text)` of `column`.
+
+        Stable with respect to the current order, so a previous sort
+        breaks ties. Only the permutation changes; rows stay as loaded.
+        """
+        if not (0 <= column < len(self._headers)):
+            return
+        keys = self._sort_keys.get(column)
+        if keys is None:
+            keys = [key(self._cell_text(values, column)) for values in self._rows]
+            self._sort_keys[column] = keys
+        current = self._order if self._order is not None else range(len(self._rows))
+        self._set_order(sorted(current, key=keys.__getitem__, reverse=descending))
+
+    def clear_order(self) -> None:
+        """Show the rows in load order again."""
+        if self._order is not None:
+            self._set_order(None)
+
+    def _set_order(self, order: Optional[List[int]]) -> None:
+        self.layoutAboutToBeChanged.emit()
+        old = self.persistentIndexList()
+        old_sources = [self._source_row(i.row()) for i in old]
+        self._order = order
+        if old:
+            position = {src: row for row, src in enumerate(order)} if order is not None else None
+            new = [
+                self.index(src if position is None else position[src], i.column())
+                for src, i in zip(old_sources, old)
+            ]
+            self.changePersistentIndexList(old, new)
+        self.layoutChanged.emit()
+
+    def _source_row(self, row: int) -> int:
+        return self._order[row] if self._order is not None else row
+
+    # ---------------------- reading ------------------------------------
+
+    def text(self, row: int, column: int) -> str:
+        """Display text of one cell ("" for None or out of range)."""
+        if not (0 <= row < len(self._rows)):
+            return ""
+        return self._cell_text(self._rows[self._source_row(row)], column)
+
+    def headers(self) -> List[str]:
+        return list(self._headers)
+
+    @staticmethod
+    def _cell_text(values: Sequence[Any], column: int) -> str:
+        if not (0 <= column < len(values)):
+            return ""
+        value = values[column]
+        return "" if value is None else str(value)
+
+    # ---------------------- QAbstractTableModel ------------------------
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        return self.text(index.row(), index.column())
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self._headers[section] if 0 <= section < len(self._headers) else None
+        return section + 1
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
@@ -1,4 +1,5 @@
 # src/config.py
+import os
 from pathlib import Path
 
 # Root directory = project root (two levels up from here)
@@ -8,5 +9,9 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 DATA_DIR = BASE_DIR / "data"
 DATA_DIR.mkdir(exist_ok=True)
 
+# Database file - data/club_manager.db unless CLUBAPP_DB_PATH points
+# elsewhere (the benchmarks run the app against generated databases).
+DB_PATH = Path(os.environ.get("CLUBAPP_DB_PATH") or DATA_DIR / "club_manager.db")
+
 # Database URL
-DATABASE_URL = f"sqlite:///{DATA_DIR / 'club_manager.db'}"
+DATABASE_URL = f"sqlite:///{DB_PATH}"
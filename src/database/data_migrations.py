@@ -0,0 +1,105 @@
+"""Chunked, resumable data migrations.
+
+A data migration - a backfill, a value cleanup, a unit conversion - that
+rewrites a whole table in one statement holds SQLite's write lock and
+grows the WAL for as long as it runs, which on a multi-million-row ledger
+is minutes. run_data_migration() instead walks the table in rowid order,
+`chunk_size` rows at a time, one committed transaction per chunk, so
+writers get in between chunks and the WAL checkpoints as it goes.
+
+Each chunk's commit also records the last rowid it covered in
+migraciones_progreso, in the same transaction, so a run interrupted by a
+crash or a closed window resumes after the last committed chunk instead
+of starting over. The row is deleted when the migration finishes; a
+later run starts from the beginning again, so `procesar` must be
+idempotent (update only rows that still need it) - which it has to be
+anyway, since database/migrations.py reruns an interrupted version.
+
+`procesar(conn, desde, hasta)` handles the rows with desde < rowid <=
+hasta and returns how many it changed. The table's INTEGER PRIMARY KEY
+is its rowid, so it can filter on the primary key directly.
+"""
+from __future__ import annotations
+
+from typing import Callable, NamedTuple, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connectable, Connection, Engine
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Rows per committed chunk - small enough that each transaction holds the
+# write lock for milliseconds, not seconds.
+DATA_MIGRATION_CHUNK = 5000
+
+# Bookkeeping table, not a model: it belongs to the migration machinery,
+# not the club's data, and must survive drop_all/create_all.
+_CHECKPOINT_DDL = (
+    "CREATE TABLE IF NOT EXISTS migraciones_progreso "
+    "(nombre VARCHAR PRIMARY KEY, ultimo_rowid INTEGER NOT NULL)"
+)
+
+
+class DataMigration(NamedTuple):
+    nombre: str
+    tabla: str
+    procesar: Callable[[Connection, int, int], int]
+
+
+def checkpoint(bind: Connectable, nombre: str) -> Optional[int]:
+    """Last rowid committed by the unfinished run of `nombre`, or None when
+    no run is in progress."""
+    with bind.begin() as conn:
+        conn.exec_driver_sql(_CHECKPOINT_DDL)
+        return conn.execute(
+            text("SELECT ultimo_rowid FROM migraciones_progreso WHERE nombre = :nombre"), {"nombre": nombre}
+        ).scalar()
+
+
+def run_data_migration(
+    engine: Engine,
+    migration: DataMigration,
+    progress: Optional[Callable[[int, int], None]] = None,
+    chunk_size: int = DATA_MIGRATION_CHUNK,
+) -> int:
+    """Run `migration` over its table from its checkpoint (or the start),
+    committing every `chunk_size` rows. Returns the number of rows
+    `procesar` changed in this run.
+
+    `progress(hechas, total)` is called after each chunk commits, with the
+    rows walked so far and the rows left when this run started.
+    """
+    desde = checkpoint(engine, migration.nombre) or 0
+    with engine.connect() as conn:
+        total = conn.execute(
+            text(f"SELECT COUNT(*) FROM {migration.tabla} WHERE rowid > :desde"), {"desde": desde}
+        ).scalar_one()
+    if desde:
+        logger.info("Resuming data migration %s after rowid %d (%d rows left).", migration.nombre, desde, total)
+
+    next_chunk = text(f"SELECT rowid FROM {migration.tabla} WHERE rowid > :desde ORDER BY rowid LIMIT :limite")
+    save = text(
+        "INSERT INTO migraciones_progreso (nombre, ultimo_rowid) VALUES (:nombre, :hasta) "
+        "ON CONFLICT(nombre) DO UPDATE SET ultimo_rowid = excluded.ultimo_rowid"
+    )
+    hechas = cambiadas = 0
+    while True:
+        with engine.begin() as conn:
+            rowids = conn.execute(next_chunk, {"desde": desde, "limite": chunk_size}).scalars().all()
+            if not rowids:
+                conn.execute(
+                    text("DELETE FROM migraciones_progreso WHERE nombre = :nombre"), {"nombre": migration.nombre}
+                )
+                break
+            hasta = rowids[-1]
+            cambiadas += migration.procesar(conn, desde, hasta)
+            conn.execute(save, {"nombre": migration.nombre, "hasta": hasta})
+        desde = hasta
+        hechas += len(rowids)
+        if progress is not None:
+            progress(hechas, total)
+    if cambiadas:
+        logger.info("Data migration %s updated %d row(s).", migration.nombre, cambiadas)
+    return cambiadas
@@ -0,0 +1,75 @@
+"""Maintained debtor index (Deudor / deudores).
+
+The legacy ALTA (SALDO) sheet flags a member DEUDOR when their running
+SALDO is below -0.01 (the sheet counts debt as negative; SaldoSocios counts
+it as positive). The Deudores screen lists every such family, so instead of
+finding each family's latest SaldoSocios row on every query, deudores keeps
+one row per indebted family with its current balance, indexed by saldo.
+
+Kept in sync by the balance engine: features/saldos/service.py calls
+refresh_deudores() for the families every apply_transaction(s)/rebuild
+chunk touched, inside the same transaction, so the flag commits or rolls
+back with the balance. init_db() calls rebuild_deudores() at startup to
+backfill existing databases.
+"""
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Iterable, Optional
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.engine import Connection
+
+# A family is a debtor once it owes more than this (the sheet's -0.01).
+UMBRAL_DEUDOR = Decimal("0.01")
+# sqlite3 can't bind Decimal; saldo_actual is compared numerically anyway.
+_UMBRAL_PARAM = float(UMBRAL_DEUDOR)
+
+# numero_socio values per IN (...) - well under SQLite's bound-parameter
+# limit.
+_REFRESH_CHUNK = 500
+
+# Each family's current balance: saldo_actual of its last SaldoSocios row
+# in the saldo chain's (fecha_inicio, id_periodo) order.
+_ACTUAL_SQL = """
+    SELECT numero_socio, saldo_actual FROM (
+        SELECT s.numero_socio, s.saldo_actual,
+               ROW_NUMBER() OVER (
+                   PARTITION BY s.numero_socio
+                   ORDER BY p.fecha_inicio DESC, p.id_periodo DESC
+               ) AS rn
+        FROM saldos_socios s
+        JOIN periodo p ON p.id_periodo = s.id_periodo
+        {where}
+    )
+    WHERE rn = 1 AND saldo_actual > :umbral
+"""
+
+_DELETE_SOME = text("DELETE FROM deudores WHERE numero_socio IN :numeros").bindparams(
+    bindparam("numeros", expanding=True)
+)
+_INSERT_SOME = text(
+    "INSERT INTO deudores (numero_socio, saldo) "
+    + _ACTUAL_SQL.format(where="WHERE s.numero_socio IN :numeros")
+).bindparams(bindparam("numeros", expanding=True))
+_INSERT_ALL = text("INSERT INTO deudores (numero_socio, saldo) " + _ACTUAL_SQL.format(where=""))
+
+
+def refresh_deudores(conn: Connection, numeros: Optional[Iterable[str]] = None) -> None:
+    """Recompute the deudores rows of `numeros` (every family when None)
+    from their current SaldoSocios balance."""
+    if numeros is None:
+        conn.execute(text("DELETE FROM deudores"))
+        conn.execute(_INSERT_ALL, {"umbral": _UMBRAL_PARAM})
+        return
+    numeros = sorted({numero for numero in numeros if numero})
+    for start in range(0, len(numeros), _REFRESH_CHUNK):
+        chunk = numeros[start:start + _REFRESH_CHUNK]
+        conn.execute(_DELETE_SOME, {"numeros": chunk})
+        conn.execute(_INSERT_SOME, {"numeros": chunk, "umbral": _UMBRAL_PARAM})
+
+
+def rebuild_deudores(conn: Connection) -> int:
+    """Recompute every row; returns the number of debtor families."""
+    refresh_deudores(conn)
+    return conn.execute(text("SELECT COUNT(*) FROM deudores")).scalar_one()
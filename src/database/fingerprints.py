@@ -0,0 +1,104 @@
+"""Persisted duplicate-detection key for Transaccion (`fingerprint`).
+
+TransactionsService._validate_transaction rejects an exact duplicate - same
+numero_socio/tipo/monto/id_periodo/id_metodo/fecha - and used to find one
+with a six-column probe no index covered. The fingerprint is a hash of
+those six fields in a canonical form (monto to cents, fecha as ISO date,
+None as ""), computed once on write and indexed, so the check is a single
+index lookup however long the ledger grows.
+
+Maintained by before_insert/before_update mapper events, the same way
+normalized_columns.py keeps the `*_norm` columns; init_db() runs
+backfill_fingerprints() in chunks for rows written before the column
+existed.
+"""
+from __future__ import annotations
+
+import datetime
+import hashlib
+from decimal import Decimal
+from typing import Any, Optional
+
+from sqlalchemy import bindparam, event, select, update
+from sqlalchemy.engine import Connection
+
+from database.models import Transaccion
+
+# Rows updated per round trip by the startup backfill.
+_BACKFILL_BATCH = 1000
+
+_CENTS = Decimal("0.01")
+
+
+def _canonical(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    return str(value)
+
+
+def transaccion_fingerprint(
+    numero_socio: Optional[str],
+    tipo: Optional[str],
+    monto: Any,
+    id_periodo: Optional[int],
+    id_metodo: Optional[int],
+    fecha: Optional[datetime.date],
+) -> str:
+    """The fingerprint two exact-duplicate movements share.
+
+    monto is quantized to cents first (Numeric(10, 2)), so 45, "45.0" and
+    Decimal("45.00") all give the same key.
+    """
+    if monto is not None:
+        monto = Decimal(str(monto)).quantize(_CENTS)
+    parts = (numero_socio, tipo, monto, id_periodo, id_metodo, fecha)
+    return hashlib.sha1("\x1f".join(_canonical(p) for p in parts).encode("utf-8")).hexdigest()
+
+
+def _set_fingerprint(mapper, connection, target: Transaccion) -> None:
+    # Apply the column's fecha default here rather than at INSERT time, so
+    # the fingerprint covers the date the row actually gets.
+    if target.fecha is None:
+        target.fecha = datetime.date.today()
+    target.fingerprint = transaccion_fingerprint(
+        target.numero_socio,
+        target.tipo,
+        target.monto,
+        target.id_periodo,
+        target.id_metodo,
+        target.fecha,
+    )
+
+
+event.listen(Transaccion, "before_insert", _set_fingerprint)
+event.listen(Transaccion, "before_update", _set_fingerprint)
+
+
+def backfill_fingerprints(conn: Connection, desde: int = 0, hasta: Optional[int] = None) -> int:
+    """Fill transacciones.fingerprint where it is still NULL, for
+    desde < id_transaccion <= hasta (the whole table by default - init_db
+    runs it in chunks through database/data_migrations.py). Returns the
+    number of rows updated; a no-op once every row has one."""
+    table = Transaccion.__table__
+    pending = select(
+        table.c.id_transaccion,
+        table.c.numero_socio,
+        table.c.tipo,
+        table.c.monto,
+        table.c.id_periodo,
+        table.c.id_metodo,
+        table.c.fecha,
+    ).where(table.c.fingerprint.is_(None), table.c.id_transaccion > desde)
+    if hasta is not None:
+        pending = pending.where(table.c.id_transaccion <= hasta)
+    rows = conn.execute(pending).all()
+    stmt = update(table).where(table.c.id_transaccion == bindparam("_pk"))
+    for start in range(0, len(rows), _BACKFILL_BATCH):
+        batch = [
+            {"_pk": row[0], "fingerprint": transaccion_fingerprint(*row[1:])}
+            for row in rows[start:start + _BACKFILL_BATCH]
+        ]
+        conn.execute(stmt, batch)
+    return len(rows)
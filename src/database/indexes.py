@@ -0,0 +1,33 @@
+"""Create the indexes declared in models.py on databases that predate them.
+
+create_all() only adds indexes together with a table it creates, so an
+Index added to an existing model's __table_args__ would never reach a DB
+that already has the table. The declarations in models.py are the
+catalog; ensure_indexes() compares them with what the database has and
+creates the missing ones. Idempotent - init_db() runs it on every startup.
+"""
+from __future__ import annotations
+
+from typing import Iterable, List, Optional
+
+from sqlalchemy import Table, inspect
+from sqlalchemy.engine import Connectable
+
+from database.models import Base
+
+
+def ensure_indexes(bind: Connectable, tables: Optional[Iterable[Table]] = None) -> List[str]:
+    """Create every declared index missing from `tables` (all mapped tables
+    when None). Returns the names of the indexes created."""
+    inspector = inspect(bind)
+    existing_tables = set(inspector.get_table_names())
+    created = []
+    for table in tables if tables is not None else Base.metadata.sorted_tables:
+        if table.name not in existing_tables or not table.indexes:
+            continue
+        existing = {ix["name"] for ix in inspector.get_indexes(table.name)}
+        for index in sorted(table.indexes, key=lambda ix: ix.name):
+            if index.name not in existing:
+                index.create(bind=bind)
+                created.append(index.name)
+    return created
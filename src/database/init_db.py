@@ -2,7 +2,15 @@ from sqlalchemy import text
 
 from database.session import engine
 from database.models import Base
+from database.indexes import ensure_indexes
+from database.migrations import Migration, run_migrations
 from database.seed_db import seed_all
+from database.socio_labels import rebuild_labels
+from database.deudores import rebuild_deudores
+from database.socios_fts import ensure_socios_fts
+from database.data_migrations import DataMigration, run_data_migration
+from database.fingerprints import backfill_fingerprints
+from database.normalized_columns import NORMALIZED_COLUMNS, backfill_normalized_table
 from utils.logger import get_logger
 logger = get_logger(__name__)
 
@@ -13,6 +21,13 @@ _COLUMN_MIGRATIONS = [
     ("metodos_pago", "estado", "ALTER TABLE metodos_pago ADD COLUMN estado VARCHAR DEFAULT 'activo'"),
     ("reglas_cobro", "estado", "ALTER TABLE reglas_cobro ADD COLUMN estado VARCHAR DEFAULT 'activo'"),
     ("socios", "es_titular", "ALTER TABLE socios ADD COLUMN es_titular BOOLEAN DEFAULT 0"),
+    ("saldos_socios", "reembolsos", "ALTER TABLE saldos_socios ADD COLUMN reembolsos NUMERIC(10, 2) DEFAULT 0"),
+    ("saldos_socios", "devoluciones", "ALTER TABLE saldos_socios ADD COLUMN devoluciones NUMERIC(10, 2) DEFAULT 0"),
+    ("socios", "nombre_norm", "ALTER TABLE socios ADD COLUMN nombre_norm VARCHAR"),
+    ("socios", "apellidos_norm", "ALTER TABLE socios ADD COLUMN apellidos_norm VARCHAR"),
+    ("socios", "email_norm", "ALTER TABLE socios ADD COLUMN email_norm VARCHAR"),
+    ("logs", "descripcion_norm", "ALTER TABLE logs ADD COLUMN descripcion_norm VARCHAR"),
+    ("transacciones", "fingerprint", "ALTER TABLE transacciones ADD COLUMN fingerprint VARCHAR"),
 ]
 
 # lowercase/legacy transacciones.tipo value -> canonical TIPOS_TRANSACCION
@@ -46,6 +61,23 @@ def _add_missing_columns() -> None:
                 logger.info("Migrated %s: added missing '%s' column.", table, column)
 
 
+def _normalize_tipo_chunk(conn, desde: int, hasta: int) -> int:
+    """Canonicalize transacciones.tipo for desde < id_transaccion <= hasta;
+    returns the rows changed."""
+    updated = 0
+    for legacy, canonical in _TIPO_CANONICAL.items():
+        result = conn.execute(
+            text(
+                "UPDATE transacciones SET tipo = :canonical "
+                "WHERE id_transaccion > :desde AND id_transaccion <= :hasta "
+                "AND LOWER(TRIM(tipo)) = :legacy AND tipo != :canonical"
+            ),
+            {"canonical": canonical, "legacy": legacy, "desde": desde, "hasta": hasta},
+        )
+        updated += result.rowcount
+    return updated
+
+
 def _normalize_tipo_transaccion() -> None:
     """Normalize transacciones.tipo to canonical Title Case.
 
@@ -54,34 +86,96 @@ def _normalize_tipo_transaccion() -> None:
     outside the dialog's dropdown (e.g. a legacy import), leaving a mix of
     casings in the same column. The dropdown itself now only ever writes
     canonical values (see TIPOS_TRANSACCION), so this is a one-time-per-row
-    cleanup of pre-existing data, not an ongoing need - safe to call on
-    every startup, a no-op once every row already matches its canonical form.
+    cleanup of pre-existing data, not an ongoing need - a no-op once every
+    row already matches its canonical form. Runs in committed chunks
+    (database/data_migrations.py), so it resumes if interrupted.
     """
-    with engine.connect() as conn:
-        columns = {row[1] for row in conn.execute(text("PRAGMA table_info(transacciones)"))}
-        if "tipo" not in columns:
-            return
-        for legacy, canonical in _TIPO_CANONICAL.items():
-            result = conn.execute(
-                text(
-                    "UPDATE transacciones SET tipo = :canonical "
-                    "WHERE LOWER(TRIM(tipo)) = :legacy AND tipo != :canonical"
-                ),
-                {"canonical": canonical, "legacy": legacy},
-            )
-            if result.rowcount:
-                conn.commit()
-                logger.info(
-                    "Normalized %d transacciones.tipo row(s) '%s' -> '%s'.",
-                    result.rowcount, legacy, canonical,
-                )
+    run_data_migration(engine, DataMigration("tipo_transaccion", "transacciones", _normalize_tipo_chunk))
 
 
-def init_db():
+def _ensure_indexes() -> None:
+    """Create the indexes models.py declares but an older DB lacks - see
+    database/indexes.py. A no-op once every index exists."""
+    created = ensure_indexes(engine)
+    if created:
+        logger.info("Created missing index(es): %s.", ", ".join(created))
+
+
+def _backfill_normalized_columns() -> None:
+    """Fill the *_norm shadow columns (database/normalized_columns.py) for
+    rows written before they existed, in committed chunks per table. A
+    no-op once done."""
+    for model in NORMALIZED_COLUMNS:
+
+        def _chunk(conn, desde, hasta, model=model):
+            return backfill_normalized_table(conn, model, desde, hasta)
+
+        table = model.__tablename__
+        run_data_migration(engine, DataMigration(f"norm_{table}", table, _chunk))
+
+
+def _backfill_fingerprints() -> None:
+    """Fill transacciones.fingerprint (database/fingerprints.py) for rows
+    written before it existed, in committed chunks. A no-op once done."""
+    run_data_migration(engine, DataMigration("fingerprints", "transacciones", backfill_fingerprints))
+
+
+def _rebuild_derived() -> None:
+    """Derived structures (etiquetas_socio, socios_fts, deudores) are only
+    maintained on writes, so backfill them for DBs created before they
+    existed."""
+    with engine.begin() as conn:
+        rebuild_labels(conn)
+        rebuild_deudores(conn)
+        if ensure_socios_fts(conn):
+            logger.info("Created socios_fts and indexed existing socios.")
+
+
+def _migrate_v1() -> None:
+    """Everything init_db() ran on every startup before versioning -
+    each step a no-op where already applied, so this brings any older DB
+    (or a new, empty one) to the current schema."""
     Base.metadata.create_all(bind=engine)
     _add_missing_columns()
     _normalize_tipo_transaccion()
+    _ensure_indexes()
+    _backfill_normalized_columns()
+    _backfill_fingerprints()
+    _rebuild_derived()
     seed_all()
+
+
+def _migrate_v2() -> None:
+    """Build saldos_socios for ledgers that predate the balance engine.
+
+    The engine only applies each new movement on top of the family's
+    existing rows, so on a DB whose transacciones were written before it
+    existed every balance would chain from 0 - and the refund check, which
+    reads the pagos/reembolsos totals from these rows, would reject valid
+    refunds. Rebuilds every row, closed períodos included, in committed
+    family chunks (rebuild_saldos), then the deudores index that reads
+    the result."""
+    from features.saldos.service import rebuild_saldos
+
+    families = rebuild_saldos(include_closed=True)
+    with engine.begin() as conn:
+        rebuild_deudores(conn)
+    if families:
+        logger.info("Rebuilt saldos_socios for %d families.", families)
+
+
+# Append-only - see database/migrations.py. Never renumber or edit an
+# applied entry; a schema or data change ships as the next version.
+_MIGRATIONS = [
+    Migration(1, "esquema y datos previos al versionado", _migrate_v1),
+    Migration(2, "saldos de los movimientos anteriores al motor de saldos", _migrate_v2),
+]
+
+
+def init_db():
+    applied = run_migrations(engine, _MIGRATIONS)
+    if applied:
+        logger.info("Base de datos migrada a la versión %d.", applied[-1])
     logger.info("Base de datos inicializada correctamente.")
 
 if __name__ == "__main__":
@@ -0,0 +1,74 @@
+"""Versioned startup migrations, stamped in SQLite's `PRAGMA user_version`.
+
+init_db() used to re-run every schema patch, data cleanup and backfill on
+each launch - each one a no-op once applied, but several of them still a
+full-table read to find that out. Instead, each step now belongs to a
+numbered Migration, and the database records the last version it
+applied in the header field SQLite reserves for exactly this
+(`PRAGMA user_version`, 0 on any database that predates this module). A
+database that is up to date costs one integer read at startup.
+
+Migrations run in version order, and the version is stamped after each
+one commits, so a failure leaves the database at the last complete
+version and the next launch resumes from there. Steps must stay safe to
+re-run anyway - a brand-new database runs all of them, and one created
+before versioning runs version 1, which is every pre-versioning step.
+
+**Any change to models.py that an existing database needs - a table, a
+column, an index, a backfill - gets a new Migration appended to
+init_db._MIGRATIONS.** create_all() alone no longer runs on a database
+that is up to date.
+"""
+from __future__ import annotations
+
+from typing import Callable, List, NamedTuple, Sequence
+
+from sqlalchemy.engine import Connectable, Engine
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class Migration(NamedTuple):
+    version: int
+    descripcion: str
+    aplicar: Callable[[], None]
+
+
+def current_version(bind: Connectable) -> int:
+    """The migration version the database was last stamped with."""
+    with bind.connect() as conn:
+        return conn.exec_driver_sql("PRAGMA user_version").scalar_one()
+
+
+def stamp_version(bind: Connectable, version: int) -> None:
+    """Record `version` as applied. PRAGMA values can't be bound, hence
+    the int() before formatting."""
+    with bind.begin() as conn:
+        conn.exec_driver_sql(f"PRAGMA user_version = {int(version)}")
+
+
+def run_migrations(engine: Engine, migrations: Sequence[Migration]) -> List[int]:
+    """Apply every migration newer than the database's version, in order,
+    stamping each as it completes. Returns the versions applied - empty
+    when the database was already current, or is ahead of this build
+    (opened by a newer version of the app), which is logged and left
+    alone."""
+    versions = [migration.version for migration in migrations]
+    if versions != sorted(set(versions)):
+        raise ValueError("migration versions must be unique and ascending")
+    actual = current_version(engine)
+    latest = versions[-1] if versions else 0
+    if actual > latest:
+        logger.warning("Database schema version %d is newer than this build's %d.", actual, latest)
+        return []
+    applied = []
+    for migration in migrations:
+        if migration.version <= actual:
+            continue
+        logger.info("Applying migration %d: %s", migration.version, migration.descripcion)
+        migration.aplicar()
+        stamp_version(engine, migration.version)
+        applied.append(migration.version)
+    return applied
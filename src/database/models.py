@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Date, DateTime, ForeignKey, Numeric, UniqueConstraint, Boolean
+from sqlalchemy import Column, Integer, String, Date, DateTime, ForeignKey, Numeric, UniqueConstraint, Boolean, Index
 from sqlalchemy.orm import declarative_base, relationship
 import datetime
 
@@ -6,6 +6,13 @@ Base = declarative_base()
 
 class Socio(Base):
     __tablename__ = "socios"
+    # (numero_socio, es_titular): has_titular/get_titular and the titular
+    # swap; estado: the default "activos" filter of every socio list (the
+    # index also yields id_socio order, it being the rowid).
+    __table_args__ = (
+        Index("ix_socios_numero_titular", "numero_socio", "es_titular"),
+        Index("ix_socios_estado", "estado"),
+    )
     id_socio = Column(Integer, primary_key=True, index=True)
     # numero_socio is a family/shared number; not unique across rows
     numero_socio = Column(String, nullable=False)
@@ -20,6 +27,11 @@ class Socio(Base):
     # number, enforced in MembersService.add_member/update_member, never at
     # the DB layer (see PLAN.md 2.17).
     es_titular = Column(Boolean, nullable=False, default=False)
+    # accent-folded copies for SQL search/sort - set on every write by
+    # database/normalized_columns.py, never by hand.
+    nombre_norm = Column(String, index=True)
+    apellidos_norm = Column(String, index=True)
+    email_norm = Column(String, index=True)
 
     # relationships: use class names and matching back_populates attribute names
     transacciones = relationship("Transaccion", back_populates="socio")
@@ -67,6 +79,20 @@ class ReglaCobro(Base):
 
 class Transaccion(Base):
     __tablename__ = "transacciones"
+    # (numero_socio, id_periodo, tipo) is how balances aggregate - see
+    # features/saldos/service.py's rebuild_saldos. (fecha, id_transaccion)
+    # is the Transacciones list order; the id_periodo-led one serves that
+    # list filtered by período, its default view. fingerprint is the
+    # duplicate check's lookup key - see database/fingerprints.py. The
+    # numero_socio-led (fecha, id_transaccion) one is a family's history in
+    # order, for SaldosService.family_ledger_page's running balance.
+    __table_args__ = (
+        Index("ix_transacciones_socio_periodo_tipo", "numero_socio", "id_periodo", "tipo"),
+        Index("ix_transacciones_fingerprint", "fingerprint"),
+        Index("ix_transacciones_fecha_id", "fecha", "id_transaccion"),
+        Index("ix_transacciones_periodo_fecha_id", "id_periodo", "fecha", "id_transaccion"),
+        Index("ix_transacciones_socio_fecha_id", "numero_socio", "fecha", "id_transaccion"),
+    )
     id_transaccion = Column(Integer, primary_key=True, index=True)
     # transactions are linked to the family member number (numero_socio)
     numero_socio = Column(String, ForeignKey("socios.numero_socio"))
@@ -76,6 +102,9 @@ class Transaccion(Base):
     monto = Column(Numeric(10, 2), nullable=False)
     fecha = Column(Date, default=datetime.date.today)
     referencia = Column(String)
+    # hash of numero_socio/tipo/monto/id_periodo/id_metodo/fecha, set on
+    # write - see database/fingerprints.py
+    fingerprint = Column(String)
 
     # relationship to Socio (singular) and back_populates must match attribute name on Socio
     socio = relationship("Socio", back_populates="transacciones")
@@ -92,6 +121,10 @@ class SaldoSocios(Base):
     saldo_anterior = Column(Numeric(10, 2), default=0)
     cargos = Column(Numeric(10, 2), default=0)
     pagos = Column(Numeric(10, 2), default=0)
+    # one running total per tipo, so saldo_actual can follow the decided
+    # formula (PLAN.md §6) term by term - see features/saldos/service.py.
+    reembolsos = Column(Numeric(10, 2), default=0)
+    devoluciones = Column(Numeric(10, 2), default=0)
     saldo_actual = Column(Numeric(10, 2), default=0)
 
 
@@ -102,13 +135,57 @@ class SaldoSocios(Base):
 
 class Log(Base):
     __tablename__ = "logs"
+    # The audit viewer's order (newest first), alone or under its
+    # tabla_afectada filter; the latter also serves list_tablas_afectadas.
+    __table_args__ = (
+        Index("ix_logs_fecha_id", "fecha_hora", "id_log"),
+        Index("ix_logs_tabla_fecha_id", "tabla_afectada", "fecha_hora", "id_log"),
+    )
     id_log = Column(Integer, primary_key=True, index=True)
     id_socio = Column(Integer, ForeignKey("socios.id_socio"))
     accion = Column(String, nullable=False)
     tabla_afectada = Column(String)
     id_registro_afectado = Column(Integer)
     descripcion_cambio = Column(String)
+    # accent-folded copy, see Socio.nombre_norm. Not indexed: it's only ever
+    # substring-matched, which a B-tree index can't serve.
+    descripcion_norm = Column(String)
     fecha_hora = Column(DateTime, default=datetime.datetime.now)
 
     # singular relationship to Socio
     socio = relationship("Socio", back_populates="logs")
+
+
+# Derived, one row per family: representative display name plus its
+# accent-folded search label. Never written directly - maintained from
+# socios by database/socio_labels.py.
+class EtiquetaSocio(Base):
+    __tablename__ = "etiquetas_socio"
+    numero_socio = Column(String, primary_key=True)
+    nombre = Column(String, nullable=False)
+    etiqueta_norm = Column(String, nullable=False, index=True)
+
+
+# Derived, one row per family whose current balance (saldo_actual of its
+# latest SaldoSocios row) is a debt - the legacy ALTA (SALDO) sheet's
+# DEUDOR flag. Never written directly - maintained by the balance engine
+# through database/deudores.py.
+class Deudor(Base):
+    __tablename__ = "deudores"
+    # saldo-ordered, so the Deudores list and its "+ de tres recibos"
+    # threshold are range reads.
+    __table_args__ = (Index("ix_deudores_saldo", "saldo"),)
+    numero_socio = Column(String, primary_key=True)
+    saldo = Column(Numeric(10, 2), nullable=False)
+
+
+# Register the hooks that keep derived structures in sync
+# (etiquetas_socio's Session listener, socios_fts's DDL, the *_norm and
+# fingerprint columns' mapper events, the reference cache's invalidation) -
+# must run wherever the models are used, so they're imported here, not by
+# callers.
+import database.socio_labels  # noqa: E402,F401
+import database.socios_fts  # noqa: E402,F401
+import database.normalized_columns  # noqa: E402,F401
+import database.fingerprints  # noqa: E402,F401
+import database.reference_cache  # noqa: E402,F401
@@ -0,0 +1,77 @@
+"""Persisted accent-folded shadow columns (`*_norm`).
+
+Each `*_norm` column holds utils.text.normalize_for_match() of its source
+column, computed once on write instead of per row on every search or sort,
+so queries can filter and ORDER BY the precomputed keys in SQL.
+
+Maintained by before_insert/before_update mapper events, so every ORM
+write path sets them (bulk query.update() bypasses mapper events - none
+exists on these models today; any future one must set the `*_norm` column
+itself). init_db() backfills rows written before a column existed, one
+backfill_normalized_table() chunk at a time.
+"""
+from __future__ import annotations
+
+from typing import Dict, Optional
+
+from sqlalchemy import bindparam, event, or_, select, update
+from sqlalchemy.engine import Connection
+
+from database.models import Log, Socio
+from utils.text import normalize_for_match
+
+# model -> {shadow column: source column}
+NORMALIZED_COLUMNS: Dict[type, Dict[str, str]] = {
+    Socio: {"nombre_norm": "nombre", "apellidos_norm": "apellidos", "email_norm": "email"},
+    Log: {"descripcion_norm": "descripcion_cambio"},
+}
+
+# Rows updated per round trip by the startup backfill.
+_BACKFILL_BATCH = 1000
+
+
+def _set_normalized(mapper, connection, target) -> None:
+    for shadow, source in NORMALIZED_COLUMNS[type(target)].items():
+        setattr(target, shadow, normalize_for_match(getattr(target, source)))
+
+
+for _model in NORMALIZED_COLUMNS:
+    event.listen(_model, "before_insert", _set_normalized)
+    event.listen(_model, "before_update", _set_normalized)
+
+
+def backfill_normalized_table(conn: Connection, model: type, desde: int = 0, hasta: Optional[int] = None) -> int:
+    """Fill `model`'s `*_norm` columns that are still NULL, for desde <
+    primary key <= hasta (the whole table by default - init_db runs it in
+    chunks through database/data_migrations.py). Returns the number of
+    rows updated.
+
+    A NULL source normalizes to "", never NULL, so rows are only ever
+    picked up once and this is a no-op on every later run.
+    """
+    columns = NORMALIZED_COLUMNS[model]
+    table = model.__table__
+    pk = list(table.primary_key.columns)[0]
+    pending = select(pk, *(table.c[source] for source in columns.values())).where(
+        or_(*(table.c[shadow].is_(None) for shadow in columns)), pk > desde
+    )
+    if hasta is not None:
+        pending = pending.where(pk <= hasta)
+    rows = conn.execute(pending).all()
+    stmt = update(table).where(pk == bindparam("_pk"))
+    for start in range(0, len(rows), _BACKFILL_BATCH):
+        batch = [
+            dict(
+                _pk=row[0],
+                **{shadow: normalize_for_match(value) for shadow, value in zip(columns, row[1:])},
+            )
+            for row in rows[start:start + _BACKFILL_BATCH]
+        ]
+        conn.execute(stmt, batch)
+    return len(rows)
+
+
+def backfill_normalized_columns(conn: Connection) -> int:
+    """Fill every `*_norm` column that is still NULL, in every table.
+    Returns the number of rows updated."""
+    return sum(backfill_normalized_table(conn, model) for model in NORMALIZED_COLUMNS)
@@ -0,0 +1,212 @@
+"""Process-wide cache of the small reference tables.
+
+metodos_pago, periodo and reglas_cobro hold a handful of rows and change
+only from the Ajustes screens or the transaction dialog's quick período
+creation, yet every Transacciones page used to re-read the whole of
+metodos_pago/periodo just to turn ids into names, and TransactionDialog
+re-read them on every open. This module keeps one snapshot of each table
+and hands out copies.
+
+Invalidation is write-through, the same way socio_labels.py keeps
+etiquetas_socio in sync: a Session listener notes which of these tables a
+flush (or a bulk query().delete()/update()) touched and drops their
+snapshots when that session commits - so MetodosPagoService,
+ReglasCobroService, create_periodo_rapido and ResetService.scoped_reset
+need no explicit calls. Writes that bypass the ORM (ResetService.full_reset's
+drop_all/create_all, a fresh test database) call invalidate() directly.
+
+Each table has a version number, bumped on every invalidation. A load
+that overlaps an invalidation isn't stored, so a reader on the background
+query thread (common/query_runner.py) can't put a pre-commit snapshot back.
+"""
+from __future__ import annotations
+
+import bisect
+import datetime
+import threading
+from itertools import chain
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from database.models import MetodoPago, Periodo, ReglaCobro
+
+METODOS_PAGO = MetodoPago.__tablename__
+PERIODOS = Periodo.__tablename__
+REGLAS_COBRO = ReglaCobro.__tablename__
+
+_MODELS = {MetodoPago: METODOS_PAGO, Periodo: PERIODOS, ReglaCobro: REGLAS_COBRO}
+_TABLES = tuple(_MODELS.values())
+
+_lock = threading.Lock()
+_versions: Dict[str, int] = {table: 0 for table in _TABLES}
+_snapshots: Dict[str, List[Dict[str, Any]]] = {}
+# (periodo version, starts, running max fecha_fin, rows) - see periodo_en.
+_periodo_index: Optional[Tuple[int, List[datetime.date], List[datetime.date], List[Dict[str, Any]]]] = None
+
+
+def version(table: str) -> int:
+    """Current version of `table`'s snapshot; changes on every invalidation."""
+    with _lock:
+        return _versions[table]
+
+
+def invalidate(*tables: str) -> None:
+    """Drop the cached snapshots of `tables` (every table when none given)."""
+    with _lock:
+        for table in tables or _TABLES:
+            _versions[table] += 1
+            _snapshots.pop(table, None)
+
+
+def _load_metodos_pago(session: Session) -> List[Dict[str, Any]]:
+    rows = session.query(MetodoPago).order_by(MetodoPago.nombre, MetodoPago.id_metodo)
+    return [{"id_metodo": m.id_metodo, "nombre": m.nombre, "estado": m.estado} for m in rows]
+
+
+def _load_periodos(session: Session) -> List[Dict[str, Any]]:
+    rows = session.query(Periodo).order_by(Periodo.fecha_inicio.desc(), Periodo.id_periodo.desc())
+    return [
+        {
+            "id_periodo": p.id_periodo,
+            "nombre": p.nombre,
+            "estado": p.estado,
+            "fecha_inicio": p.fecha_inicio,
+            "fecha_fin": p.fecha_fin,
+        }
+        for p in rows
+    ]
+
+
+def _load_reglas_cobro(session: Session) -> List[Dict[str, Any]]:
+    rows = session.query(ReglaCobro).order_by(ReglaCobro.id_regla)
+    return [
+        {
+            "id_regla": r.id_regla,
+            "descripcion": r.descripcion,
+            "cuota_mensual": r.cuota_mensual,
+            "plazo_pago": r.plazo_pago,
+            "penalizacion": r.penalizacion,
+            "descuento": r.descuento,
+            "estado": r.estado,
+        }
+        for r in rows
+    ]
+
+
+_LOADERS: Dict[str, Callable[[Session], List[Dict[str, Any]]]] = {
+    METODOS_PAGO: _load_metodos_pago,
+    PERIODOS: _load_periodos,
+    REGLAS_COBRO: _load_reglas_cobro,
+}
+
+
+def _snapshot(table: str) -> List[Dict[str, Any]]:
+    with _lock:
+        rows = _snapshots.get(table)
+        loaded_version = _versions[table]
+    if rows is None:
+        # Imported here so tests' patched database.session.SessionLocal is
+        # the one used (see tests/conftest.py).
+        from database.session import get_session
+
+        with get_session() as session:
+            rows = _LOADERS[table](session)
+        with _lock:
+            if _versions[table] == loaded_version:
+                _snapshots[table] = rows
+    return [dict(row) for row in rows]
+
+
+def metodos_pago() -> List[Dict[str, Any]]:
+    """Every payment method (any estado), ordered by nombre."""
+    return _snapshot(METODOS_PAGO)
+
+
+def periodos() -> List[Dict[str, Any]]:
+    """Every período, most recently started first."""
+    return _snapshot(PERIODOS)
+
+
+def reglas_cobro() -> List[Dict[str, Any]]:
+    """Every billing rule (any estado), ordered by id_regla."""
+    return _snapshot(REGLAS_COBRO)
+
+
+def periodo_en(fecha: datetime.date) -> Optional[Dict[str, Any]]:
+    """The período whose fecha_inicio..fecha_fin contains `fecha`, or None.
+
+    Answered from an interval index over the períodos snapshot - starts
+    sorted ascending plus a running max of fecha_fin - rebuilt only when
+    the snapshot's version changes, so the per-navigation rollover check
+    (features/periodos/service.py) costs a bisect, not a query. With
+    overlapping períodos, the one that started last wins.
+    """
+    global _periodo_index
+    with _lock:
+        index = _periodo_index
+        current = _versions[PERIODOS]
+    if index is None or index[0] != current:
+        rows = sorted(periodos(), key=lambda p: (p["fecha_inicio"], p["id_periodo"]))
+        max_fin: List[datetime.date] = []
+        for p in rows:
+            max_fin.append(max(p["fecha_fin"], max_fin[-1]) if max_fin else p["fecha_fin"])
+        index = (current, [p["fecha_inicio"] for p in rows], max_fin, rows)
+        with _lock:
+            if _versions[PERIODOS] == current:
+                _periodo_index = index
+    _version, starts, max_fin, rows = index
+    i = bisect.bisect_right(starts, fecha) - 1
+    while i >= 0 and max_fin[i] >= fecha:
+        if rows[i]["fecha_fin"] >= fecha:
+            return dict(rows[i])
+        i -= 1
+    return None
+
+
+def metodo_names() -> Dict[int, str]:
+    return {m["id_metodo"]: m["nombre"] for m in metodos_pago()}
+
+
+def periodo_names() -> Dict[int, str]:
+    return {p["id_periodo"]: p["nombre"] for p in periodos()}
+
+
+# ---------------------- write-through invalidation -------------------------
+
+_DIRTY_KEY = "reference_cache_dirty"
+
+
+def _mark_dirty(session: Session, table: str) -> None:
+    session.info.setdefault(_DIRTY_KEY, set()).add(table)
+
+
+@event.listens_for(Session, "after_flush")
+def _note_flushed_tables(session: Session, flush_context) -> None:
+    for obj in chain(session.new, session.dirty, session.deleted):
+        table = _MODELS.get(type(obj))
+        if table:
+            _mark_dirty(session, table)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _note_bulk_writes(orm_execute_state) -> None:
+    if orm_execute_state.is_select:
+        return
+    mapper = orm_execute_state.bind_mapper
+    table = _MODELS.get(mapper.class_) if mapper is not None else None
+    if table:
+        _mark_dirty(orm_execute_state.session, table)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session: Session) -> None:
+    tables = session.info.pop(_DIRTY_KEY, None)
+    if tables:
+        invalidate(*tables)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back(session: Session) -> None:
+    session.info.pop(_DIRTY_KEY, None)
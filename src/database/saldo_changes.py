@@ -0,0 +1,104 @@
+"""Change feed of SaldoSocios snapshots, for readers that cache balances.
+
+A late movement - typically a correction dated into an older período -
+shifts the touched (numero_socio, id_periodo) row and every later row of
+that family, so a report holding computed balances can't tell from the
+clock alone what went stale. Every balance write path notes the rows it
+touched with note_touched(session, keys); once the session commits, they
+are published under a new version number, and a reader that remembers
+the version() it built from asks touched_since(that_version) for exactly
+the snapshots to recompute. A rollback publishes nothing.
+
+Same stash-in-session.info, publish-on-after_commit shape as
+socio_labels.py. Writes that change balances wholesale (rebuild_saldos,
+a reset, seeding a new período) note None - "everything" - instead of
+listing rows.
+"""
+from __future__ import annotations
+
+import threading
+from collections import deque
+from typing import Deque, FrozenSet, Iterable, Optional, Set, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+SnapshotKey = Tuple[str, int]
+
+# Published changes kept for touched_since(); a reader further behind
+# than this just recomputes everything.
+_HISTORY = 1024
+
+_lock = threading.Lock()
+_version = 0
+# (version, keys) per published commit; keys None = every snapshot.
+_history: Deque[Tuple[int, Optional[FrozenSet[SnapshotKey]]]] = deque(maxlen=_HISTORY)
+
+_PENDING_KEY = "saldo_changes_pending"
+_ALL = object()
+
+
+def version() -> int:
+    """Current version of the feed; increases with every published change."""
+    with _lock:
+        return _version
+
+
+def touched_since(since: int) -> Optional[Set[SnapshotKey]]:
+    """The (numero_socio, id_periodo) snapshots changed after version
+    `since`, or None when that can't be told - a wholesale change, or
+    `since` older than the retained history - and everything is stale."""
+    with _lock:
+        if since >= _version:
+            return set()
+        if not _history or _history[0][0] > since + 1:
+            return None
+        touched: Set[SnapshotKey] = set()
+        for published, keys in _history:
+            if published <= since:
+                continue
+            if keys is None:
+                return None
+            touched.update(keys)
+        return touched
+
+
+def invalidate_all() -> None:
+    """Publish a wholesale change directly, for writes outside a Session
+    (drop_all/create_all, a fresh test database)."""
+    _publish(None)
+
+
+def note_touched(session: Session, keys: Optional[Iterable[SnapshotKey]]) -> None:
+    """Record snapshots `session` changed, published when it commits.
+    `keys` None means every snapshot may have changed."""
+    pending = session.info.get(_PENDING_KEY)
+    if pending is _ALL:
+        return
+    if keys is None:
+        session.info[_PENDING_KEY] = _ALL
+        return
+    if pending is None:
+        pending = session.info[_PENDING_KEY] = set()
+    pending.update(keys)
+
+
+def _publish(keys: Optional[FrozenSet[SnapshotKey]]) -> None:
+    global _version
+    with _lock:
+        _version += 1
+        _history.append((_version, keys))
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_committed(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending is _ALL:
+        _publish(None)
+    elif pending:
+        _publish(frozenset(pending))
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
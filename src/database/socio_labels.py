@@ -0,0 +1,181 @@
+"""Materialized family labels (EtiquetaSocio / etiquetas_socio).
+
+One row per numero_socio holding the family's representative display name
+and its accent-folded search label, so screens that show or search "the
+family" by name (the Transacciones socio column) can resolve it with one
+indexed SQL predicate instead of loading every Socio and normalizing in
+Python.
+
+Kept in sync by a Session after_flush listener rather than from the
+MembersService write paths: any ORM write to a Socio - including ones that
+bypass the service, like tests or seed scripts - refreshes the labels of
+the families it touched, inside the same transaction. init_db() calls
+rebuild_labels() once at startup to backfill existing databases.
+
+display_names()/display_name() answer "numero_socio -> name" from an
+in-memory copy of the table, loaded once. The same listener patches that
+copy for the families a session refreshed once it commits, so lookups
+never query after the first one.
+"""
+from __future__ import annotations
+
+import threading
+from itertools import chain
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy import delete, event, inspect, insert, select
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from database.models import EtiquetaSocio, Socio
+from utils.text import normalize_for_match
+
+
+def family_label(numero_socio: str, nombre: str) -> str:
+    """The searchable label for a family: what the Transacciones socio
+    column shows ("1001 · Marta Fernandez"), accent-folded."""
+    return normalize_for_match(f"{numero_socio} · {nombre}" if nombre else numero_socio)
+
+
+def refresh_labels(conn: Connection, numeros: Optional[Iterable[str]] = None) -> Dict[str, str]:
+    """Recompute the etiquetas_socio rows for `numeros` (every family when
+    None) from socios. Families left with no Socio lose their row.
+    Returns the new numero_socio -> display name of the families written.
+
+    The representative is the titular (PLAN.md 2.17), falling back to the
+    lowest id_socio for families that still have none - same rule as
+    every other numero_socio -> name lookup in the app.
+    """
+    table = EtiquetaSocio.__table__
+    query = select(Socio.numero_socio, Socio.nombre, Socio.apellidos).order_by(
+        Socio.es_titular.desc(), Socio.id_socio
+    )
+    if numeros is None:
+        conn.execute(delete(table))
+    else:
+        numeros = list(numeros)
+        if not numeros:
+            return {}
+        conn.execute(delete(table).where(table.c.numero_socio.in_(numeros)))
+        query = query.where(Socio.numero_socio.in_(numeros))
+
+    labels = {}
+    for numero, nombre, apellidos in conn.execute(query):
+        if numero not in labels:
+            display = f"{nombre} {apellidos}"
+            labels[numero] = {
+                "numero_socio": numero,
+                "nombre": display,
+                "etiqueta_norm": family_label(numero, display),
+            }
+    if labels:
+        conn.execute(insert(table), list(labels.values()))
+    return {numero: label["nombre"] for numero, label in labels.items()}
+
+
+def rebuild_labels(conn: Connection) -> None:
+    """Recompute every family label - the startup backfill."""
+    refresh_labels(conn, None)
+    invalidate_names()
+
+
+# ---------------------- in-memory name index -------------------------------
+
+_lock = threading.Lock()
+_names: Optional[Dict[str, str]] = None
+# bumped whenever _names changes or is dropped, so a load that overlapped a
+# commit isn't stored (see display_names)
+_generation = 0
+
+
+def invalidate_names() -> None:
+    """Drop the in-memory index; the next lookup reloads etiquetas_socio.
+    Needed after writes that bypass the Session (rebuild_labels, a fresh
+    database)."""
+    global _names, _generation
+    with _lock:
+        _names = None
+        _generation += 1
+
+
+def _all_names() -> Dict[str, str]:
+    global _names
+    with _lock:
+        names, generation = _names, _generation
+    if names is None:
+        # Imported here so tests' patched database.session.SessionLocal is
+        # the one used (see tests/conftest.py).
+        from database.session import get_session
+
+        with get_session() as session:
+            names = dict(session.query(EtiquetaSocio.numero_socio, EtiquetaSocio.nombre))
+        with _lock:
+            if _generation == generation:
+                _names = names
+    return names
+
+
+def display_names(numeros: Iterable[str]) -> Dict[str, str]:
+    """numero_socio -> the family's representative display name (the
+    titular's, else the lowest id_socio's) for each of `numeros` that has
+    members."""
+    names = _all_names()
+    found = ((numero, names.get(numero)) for numero in numeros)
+    return {numero: nombre for numero, nombre in found if nombre is not None}
+
+
+def display_name(numero_socio: str) -> str:
+    """The family's representative display name, "" if it has no members."""
+    return _all_names().get(numero_socio, "")
+
+
+_PENDING_KEY = "socio_labels_pending"
+
+
+@event.listens_for(Session, "after_flush")
+def _refresh_flushed_families(session: Session, flush_context) -> None:
+    """Refresh the labels of every family a flush touched.
+
+    Runs after the flush's SQL but before commit, on the same connection,
+    so the labels commit or roll back with the Socio write. A Socio moved
+    to another numero_socio refreshes both its old and its new family.
+    """
+    numeros = set()
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, Socio):
+            numeros.add(obj.numero_socio)
+            numeros.update(inspect(obj).attrs.numero_socio.history.deleted or ())
+    numeros.discard(None)
+    if numeros:
+        names = refresh_labels(session.connection(), numeros)
+        pending = session.info.setdefault(_PENDING_KEY, {})
+        pending.update({numero: names.get(numero) for numero in numeros})
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_committed_families(session: Session) -> None:
+    """Patch the in-memory index with the labels this session committed
+    (None = the family no longer has members).
+
+    Copy-on-write: the patched copy replaces _names under the lock, so a
+    reader on another thread (a QueryRunner page load) that already holds
+    the old dict never sees it change under it."""
+    global _generation, _names
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending:
+        return
+    with _lock:
+        _generation += 1
+        if _names is not None:
+            names = dict(_names)
+            for numero, nombre in pending.items():
+                if nombre is None:
+                    names.pop(numero, None)
+                else:
+                    names[numero] = nombre
+            _names = names
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back_families(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
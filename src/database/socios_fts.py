@@ -0,0 +1,76 @@
+"""FTS5 full-text index over socios (socios_fts).
+
+An external-content FTS5 table over numero_socio/nombre/apellidos/email,
+tokenized with `unicode61 remove_diacritics 2` so matching is accent- and
+case-insensitive the same way utils.text.normalize_for_match is. It holds
+no copy of the rows, only the index; SQLite triggers on socios keep it in
+sync, so every write path (services, tests, seed scripts, bulk UPDATEs)
+is covered without any application code.
+
+The table and triggers are created together with socios (an after_create
+hook, so create_all and ResetService.full_reset get them) and dropped
+before it. init_db() calls ensure_socios_fts() to add them to databases
+created before the index existed, rebuilding the index once when it does.
+"""
+from __future__ import annotations
+
+import re
+from typing import List
+
+from sqlalchemy import DDL, event, text
+from sqlalchemy.engine import Connection
+
+from database.models import Socio
+
+_INDEXED = "numero_socio, nombre, apellidos, email"
+_NEW = "new.numero_socio, new.nombre, new.apellidos, new.email"
+_OLD = "old.numero_socio, old.nombre, old.apellidos, old.email"
+
+_CREATE_STATEMENTS: List[str] = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS socios_fts USING fts5({_INDEXED}, "
+    "content='socios', content_rowid='id_socio', tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS socios_fts_ai AFTER INSERT ON socios BEGIN "
+    f"INSERT INTO socios_fts(rowid, {_INDEXED}) VALUES (new.id_socio, {_NEW}); END",
+    "CREATE TRIGGER IF NOT EXISTS socios_fts_ad AFTER DELETE ON socios BEGIN "
+    f"INSERT INTO socios_fts(socios_fts, rowid, {_INDEXED}) VALUES ('delete', old.id_socio, {_OLD}); END",
+    "CREATE TRIGGER IF NOT EXISTS socios_fts_au AFTER UPDATE ON socios BEGIN "
+    f"INSERT INTO socios_fts(socios_fts, rowid, {_INDEXED}) VALUES ('delete', old.id_socio, {_OLD}); "
+    f"INSERT INTO socios_fts(rowid, {_INDEXED}) VALUES (new.id_socio, {_NEW}); END",
+]
+
+for _statement in _CREATE_STATEMENTS:
+    event.listen(Socio.__table__, "after_create", DDL(_statement))
+# Triggers go with socios on DROP TABLE; the virtual table doesn't, and a
+# stale one would survive a drop_all/create_all cycle with old content.
+event.listen(Socio.__table__, "before_drop", DDL("DROP TABLE IF EXISTS socios_fts"))
+
+
+def ensure_socios_fts(conn: Connection) -> bool:
+    """Create socios_fts and its triggers if missing, indexing existing
+    rows when the table is new. Returns True if it had to create it."""
+    exists = conn.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'socios_fts'")
+    ).first()
+    for statement in _CREATE_STATEMENTS:
+        conn.execute(text(statement))
+    if exists:
+        return False
+    conn.execute(text("INSERT INTO socios_fts(socios_fts) VALUES ('rebuild')"))
+    return True
+
+
+def match_query(needle: str) -> str:
+    """Turn free search text into an FTS5 MATCH expression.
+
+    Each whitespace-separated term becomes a prefix phrase, and terms are
+    ANDed: "marta fern" matches Marta Fernández, "other.com" matches
+    x@other.com (the phrase "other com"*). Returns "" when the text has no
+    indexable characters. Terms are reduced to letters/digits before
+    quoting, so user input can never inject FTS5 syntax.
+    """
+    phrases = []
+    for term in needle.split():
+        tokens = re.findall(r"[^\W_]+", term)
+        if tokens:
+            phrases.append('"' + " ".join(tokens) + '"*')
+    return " AND ".join(phrases)
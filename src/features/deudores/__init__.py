@@ -0,0 +1 @@
+"""Deudores feature: debtor families report (legacy ALTA (SALDO) flags)."""
@@ -0,0 +1,85 @@
+"""DeudoresService: the debtor report (PLAN.md 2.15b's DEUDOR and
+"+ de tres recibos" flags).
+
+Reads the maintained deudores table (database/deudores.py) - one row per
+indebted family, indexed by saldo - so listing every debtor, or only the
+escalated ones, is a range read of ix_deudores_saldo, never a pass over
+SaldoSocios.
+
+"Meses pendientes" is how many monthly cuotas the debt covers - the
+legacy sheet escalated at -108, three months of its 36€ cuota - counted
+against the active ReglaCobro's cuota (minus descuento, as
+generate_cuotas charges it). With none, or several, active rules that
+amount is ambiguous, so the legacy 36€ stands in.
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import List
+
+from sqlalchemy import select
+
+from database import reference_cache, socio_labels
+from database.deudores import UMBRAL_DEUDOR
+from database.models import Deudor
+from database.session import get_session
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEUDOR_COLUMNS = ("Nº socio", "Socio", "Saldo", "Meses pendientes", "Aviso")
+
+# Unpaid cuotas from which a family is flagged "+ de tres recibos".
+RECIBOS_AVISO = 3
+AVISO_RECIBOS = "+ de tres recibos"
+
+# The legacy sheet's cuota, for when no single active rule says otherwise.
+CUOTA_LEGADO = Decimal("36.00")
+
+
+class DeudoresService:
+    """Read-only access to debtor families for the Deudores screen."""
+
+    def cuota_referencia(self) -> Decimal:
+        """The monthly amount months overdue are counted in: the single
+        active rule's cuota_mensual minus descuento, else CUOTA_LEGADO."""
+        activas = [r for r in reference_cache.reglas_cobro() if r["estado"] == "activo"]
+        if len(activas) == 1:
+            cuota = Decimal(activas[0]["cuota_mensual"] or 0) - Decimal(activas[0]["descuento"] or 0)
+            if cuota > 0:
+                return cuota
+        return CUOTA_LEGADO
+
+    def list_deudores(self, solo_aviso: bool = False) -> List[tuple]:
+        """Debtor families as `DEUDOR_COLUMNS` tuples, largest debt first.
+
+        `solo_aviso` keeps only the "+ de tres recibos" ones - saldo of at
+        least RECIBOS_AVISO cuotas - as the lower bound of the same index
+        range. Names resolve through the current titular (socio_labels).
+        Returns [] on failure.
+        """
+        try:
+            cuota = self.cuota_referencia()
+            umbral = cuota * RECIBOS_AVISO if solo_aviso else UMBRAL_DEUDOR
+            query = select(Deudor.numero_socio, Deudor.saldo).where(Deudor.saldo >= umbral).order_by(Deudor.saldo.desc())
+            with get_session() as session:
+                deudores = session.execute(query).all()
+            nombres = socio_labels.display_names(numero for numero, _saldo in deudores)
+            rows = []
+            for numero_socio, saldo in deudores:
+                meses = int(saldo // cuota)
+                rows.append(
+                    (
+                        numero_socio,
+                        nombres.get(numero_socio, ""),
+                        saldo,
+                        meses,
+                        AVISO_RECIBOS if meses >= RECIBOS_AVISO else "",
+                    )
+                )
+            logger.info("DeudoresService.list_deudores: %d rows (solo_aviso=%s)", len(rows), solo_aviso)
+            return rows
+        except Exception as exc:
+            logger.exception("DeudoresService.list_deudores: failed - %s", exc)
+            return []
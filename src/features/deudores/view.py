@@ -0,0 +1,193 @@
+"""Deudores screen - debtor families from the main menu.
+
+Read-only list over DeudoresService.list_deudores (the maintained
+deudores index), largest debt first, with a "Solo + de tres recibos"
+toggle for the legacy escalation list. No toolbar: fixing a debt means
+registering a Pago in Transacciones, not editing anything here.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from PySide6.QtWidgets import (
+    QWidget,
+    QVBoxLayout,
+    QHBoxLayout,
+    QLabel,
+    QPushButton,
+    QCheckBox,
+    QStyle,
+    QSizePolicy,
+    QTableView,
+    QHeaderView,
+    QAbstractItemView,
+)
+from PySide6.QtCore import Qt, QEvent
+
+from .service import DEUDOR_COLUMNS, DeudoresService
+from common.query_runner import QueryRunner
+from common.table_model import RowTableModel
+from features.members.column_fill import ensure_columns_fill as _ensure_columns_fill
+from features.members.table_sort import TableSortMixin
+from ui.styles import MEMBERS_MENU_STYLESHEET
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class DeudoresView(QWidget, TableSortMixin):
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.setObjectName("membersMenu")  # reuse Members' paper/table QSS root
+        self.main_window = parent
+        self._service = DeudoresService()
+        # Runs the debtor query off the GUI thread (common/query_runner.py).
+        self._query_runner = QueryRunner(self)
+
+        main_layout = QVBoxLayout(self)
+        main_layout.setContentsMargins(8, 8, 8, 8)
+        main_layout.setSpacing(10)
+
+        # --- Top bar: back, title, escalation toggle, refrescar -----------
+        top_bar = QWidget(self)
+        top_bar.setObjectName("topBar")
+        top_layout = QHBoxLayout(top_bar)
+        top_layout.setContentsMargins(6, 6, 6, 6)
+
+        back_button = QPushButton("Volver")
+        back_button.setObjectName("backButton")
+        back_button.setToolTip("Volver al menú principal")
+        back_button.setMaximumWidth(120)
+        back_button.setIcon(self.style().standardIcon(QStyle.SP_ArrowBack))
+        back_button.clicked.connect(self.on_back_to_main_menu)
+        top_layout.addWidget(back_button, 0, Qt.AlignmentFlag.AlignLeft)
+
+        title = QLabel("Deudores")
+        title.setObjectName("screenTitle")
+        top_layout.addWidget(title, 0, Qt.AlignmentFlag.AlignCenter)
+        top_layout.addStretch(1)
+
+        self.solo_aviso_check = QCheckBox("Solo + de tres recibos", top_bar)
+        self.solo_aviso_check.toggled.connect(self.refresh_table)
+        top_layout.addWidget(self.solo_aviso_check)
+
+        self.summary_label = QLabel(top_bar)
+        top_layout.addWidget(self.summary_label)
+
+        btn_refresh = QPushButton("Refrescar", top_bar)
+        btn_refresh.clicked.connect(self.refresh_table)
+        top_layout.addWidget(btn_refresh)
+
+        main_layout.addWidget(top_bar)
+
+        # --- Table ---------------------------------------------------------
+        self.table = QTableView(self)
+        self.table.setObjectName("resultsTable")
+        self.table.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setAlternatingRowColors(True)
+
+        self.model = RowTableModel(DEUDOR_COLUMNS, self)
+        self.table.setModel(self.model)
+
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        header.setDefaultSectionSize(120)
+        header.setStretchLastSection(False)
+        header.setSectionsClickable(True)
+        header.setSortIndicatorShown(False)
+        header.sectionClicked.connect(self._on_header_clicked)
+
+        self._sort_column = None
+        self._sort_order = None
+        self._last_search_text = None
+        self._current_view_name = "deudores"
+
+        main_layout.addWidget(self.table)
+
+        self.setStyleSheet(MEMBERS_MENU_STYLESHEET)
+
+        try:
+            self.load_table_view()
+        except Exception:
+            logger.exception("DeudoresView.__init__: initial load_table_view failed")
+
+        try:
+            self.ensure_columns_fill()
+        except Exception:
+            pass
+
+        self.table.viewport().installEventFilter(self)
+
+    def eventFilter(self, obj, ev):
+        if obj is not None and ev.type() == QEvent.Type.Resize and obj is self.table.viewport():
+            try:
+                self.ensure_columns_fill()
+            except Exception:
+                pass
+        return super().eventFilter(obj, ev)
+
+    def hideEvent(self, event) -> None:
+        """Clear the table selection whenever this screen stops being the
+        current widget - see MembersMenuView.hideEvent (PLAN.md 4.4)."""
+        self.table.clearSelection()
+        super().hideEvent(event)
+
+    def ensure_columns_fill(self) -> None:
+        _ensure_columns_fill(self.table, self.model)
+
+    def on_back_to_main_menu(self) -> None:
+        if self.main_window and hasattr(self.main_window, "_stack") and hasattr(self.main_window, "_home"):
+            self.main_window._stack.setCurrentWidget(self.main_window._home)
+        else:
+            logger.warning("DeudoresView.on_back_to_main_menu: no se pudo navegar al menú principal")
+
+    def load_table_view(self) -> None:
+        """Reload the debtor list (used on first load and by
+        TableSortMixin's sort-clear restoration). The query runs off the
+        GUI thread; a newer reload (e.g. toggling the checkbox again)
+        supersedes it."""
+        solo_aviso = self.solo_aviso_check.isChecked()
+        self._query_runner.submit(
+            lambda: (self._service.list_deudores(solo_aviso=solo_aviso), self._service.cuota_referencia()),
+            on_result=self._on_deudores_loaded,
+        )
+
+    def _on_deudores_loaded(self, result: tuple) -> None:
+        rows, cuota = result
+        self.model.set_rows(DEUDOR_COLUMNS, rows)
+        self.summary_label.setText(f"{len(rows)} familia(s) · cuota de referencia {cuota}€")
+        logger.info("DeudoresView.load_table_view: %d rows", len(rows))
+        try:
+            self.ensure_columns_fill()
+        except Exception:
+            pass
+
+    def on_search(self) -> None:
+        self.load_table_view()
+
+    def refresh_table(self) -> None:
+        try:
+            self.load_table_view()
+        except Exception as exc:
+            logger.exception("DeudoresView.refresh_table: failed - %s", exc)
+
+
+def show_deudores_view(main_window) -> None:
+    """Ensure a DeudoresView exists in the application's central stack and
+    make it the current widget - same singleton pattern as
+    features.members.menu_view.show_members_view. Reloads on every visit,
+    since balances change from other screens."""
+    if main_window is None:
+        raise ValueError("main_window is required")
+
+    dv = getattr(main_window, "_deudores_view", None)
+    if dv is None:
+        dv = DeudoresView(main_window)
+        main_window._deudores_view = dv
+        main_window._stack.addWidget(dv)
+    else:
+        dv.refresh_table()
+
+    main_window._stack.setCurrentWidget(dv)
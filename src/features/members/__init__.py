@@ -1,6 +1,14 @@
 """Members feature: view, toolbar, dialog, and backing services."""
 
-from .menu_view import MembersMenuView, show_members_view
-from .toolbar import MembersToolBar
+from common.lazy_view import lazy_exports
 
-__all__ = ["MembersMenuView", "show_members_view", "MembersToolBar"]
\ No newline at end of file
+# Resolved on first access (common/lazy_view.py), so importing a sibling
+# module like toolbar_service doesn't load the whole screen.
+_EXPORTS = {
+    "MembersMenuView": ".menu_view",
+    "show_members_view": ".menu_view",
+    "MembersToolBar": ".toolbar",
+}
+__getattr__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = ["MembersMenuView", "show_members_view", "MembersToolBar"]
@@ -7,10 +7,10 @@ read/tested on its own, separate from widget construction and sorting.
 from __future__ import annotations
 
 from PySide6.QtWidgets import QTableView
-from PySide6.QtGui import QStandardItemModel
+from PySide6.QtCore import QAbstractItemModel
 
 
-def ensure_columns_fill(table: QTableView, model: QStandardItemModel) -> None:
+def ensure_columns_fill(table: QTableView, model: QAbstractItemModel) -> None:
     """Expand visible columns to fill available viewport width.
 
     Keeps the header's Interactive resize mode (user-draggable) rather than
@@ -12,8 +12,11 @@ from __future__ import annotations
 
 from typing import Any, List, Optional, Tuple
 
+from sqlalchemy import Float, and_, case, cast, column, func, not_, text as sql_text
+
 from database.models import Socio
 from database.session import get_session
+from database.socios_fts import match_query
 from utils.text import normalize_for_match
 from utils.logger import get_logger
 logger = get_logger(__name__)
@@ -34,14 +37,57 @@ _SOCIO_COLUMNS: Tuple[str, ...] = (
     "es_titular",
     "observaciones",
 )
-# Columns matched against the search text.
-_SOCIO_SEARCH_COLUMNS: Tuple[str, ...] = ("numero_socio", "nombre", "apellidos", "email")
 # Index of es_titular within _SOCIO_COLUMNS, for the boolean -> "Sí"/"No"
 # display formatting in _fetch_socios_rows. Appended after estado rather
 # than inserted before id_socio/numero_socio/nombre/apellidos (columns 0-3),
 # whose fixed indices MembersToolBar relies on (see its module docstring).
 _ES_TITULAR_COL = _SOCIO_COLUMNS.index("es_titular")
 
+# First page size of the paged Members table (list_members_page); further
+# pages load as the user scrolls.
+MEMBERS_PAGE_SIZE = 200
+
+# Sort text for the columns that have a persisted accent-folded copy (see
+# database/normalized_columns.py); the rest fall back to lower(trim(col)).
+_SORT_NORM_COLUMNS = {
+    "nombre": Socio.nombre_norm,
+    "apellidos": Socio.apellidos_norm,
+    "email": Socio.email_norm,
+}
+# Columns whose SQL ordering already matches the header-click sort as-is.
+_SORT_PLAIN_COLUMNS = ("id_socio", "fecha_alta", "es_titular")
+
+
+def _order_terms(sort_column: str, descending: bool = False) -> list:
+    """ORDER BY terms for `sort_column` matching TableSortMixin._make_sort_key.
+
+    Numeric-looking text (digits with at most one '.') sorts first, by
+    value, then everything else by its accent-folded text - the same
+    numbers-before-text rule the in-memory sort applies. id_socio breaks
+    ties so paging stays deterministic.
+    """
+    if sort_column not in _SOCIO_COLUMNS:
+        raise ValueError(f"unknown sort column: {sort_column!r}")
+    col = getattr(Socio, sort_column)
+    if sort_column in _SORT_PLAIN_COLUMNS:
+        terms = [col]
+    else:
+        trimmed = func.trim(func.coalesce(col, ""))
+        is_number = and_(
+            trimmed.op("GLOB")("*[0-9]*"),
+            not_(trimmed.op("GLOB")("*[^0-9.]*")),
+            not_(trimmed.op("GLOB")("*.*.*")),
+        )
+        sort_text = _SORT_NORM_COLUMNS.get(sort_column, func.lower(trimmed))
+        terms = [
+            case((is_number, 0), else_=1),
+            case((is_number, cast(trimmed, Float))),
+            sort_text,
+        ]
+    if descending:
+        terms = [t.desc() for t in terms]
+    return terms + [Socio.id_socio]
+
 
 class MembersMenuService:
     """Provides backend behaviour for the members menu view.
@@ -50,18 +96,53 @@ class MembersMenuService:
     objects or return pure data that the UI can consume.
     """
 
-    def _fetch_socios_rows(self, include_inactive: bool = False) -> List[tuple]:
+    def _fetch_socios_rows(
+        self,
+        include_inactive: bool = False,
+        text: Optional[str] = None,
+        sort_column: Optional[str] = None,
+        descending: bool = False,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[tuple]:
         """Return Socio rows as plain tuples, in `_SOCIO_COLUMNS` order.
 
         By default only `estado="activo"` members are returned (PLAN.md 2.2
         - hide inactive by default, with an opt-in toggle); pass
         `include_inactive=True` to also return `inactivo` ones.
+
+        `text` filters through the socios_fts index: every word must prefix-
+        match a word of numero_socio/nombre/apellidos/email, accent- and
+        case-insensitively (see database/socios_fts.py's match_query).
+        Empty/whitespace-only text means "no filter"; text with nothing
+        indexable in it (only punctuation) matches nobody.
+
+        Rows come in id_socio order unless `sort_column` (a `_SOCIO_COLUMNS`
+        name) is given, in which case the database sorts them (see
+        _order_terms). `limit`/`offset` then select one page of that order.
         """
+        needle = normalize_for_match(text) if text else ""
         with get_session() as session:
             query = session.query(Socio)
             if not include_inactive:
                 query = query.filter(Socio.estado == "activo")
-            socios = query.order_by(Socio.id_socio).all()
+            if needle:
+                fts_query = match_query(needle)
+                if not fts_query:
+                    return []
+                matching = sql_text("SELECT rowid FROM socios_fts WHERE socios_fts MATCH :fts_query")
+                query = query.filter(
+                    Socio.id_socio.in_(matching.bindparams(fts_query=fts_query).columns(column("rowid")))
+                )
+            if sort_column:
+                query = query.order_by(*_order_terms(sort_column, descending))
+            else:
+                query = query.order_by(Socio.id_socio)
+            if offset:
+                query = query.offset(offset)
+            if limit is not None:
+                query = query.limit(limit)
+            socios = query.all()
             rows = []
             for s in socios:
                 values = [getattr(s, col) for col in _SOCIO_COLUMNS]
@@ -69,45 +150,12 @@ class MembersMenuService:
                 rows.append(tuple(values))
             return rows
 
-    def _filter_socio_rows(self, rows: List[tuple], text: Optional[str]) -> List[tuple]:
-        """Filter `rows` (as returned by `_fetch_socios_rows`) by `text`.
-
-        Matches substrings of numero_socio/nombre/apellidos/email,
-        accent- and case-insensitively (via normalize_for_match, shared
-        with TableSortMixin's sort-key normalization). Empty/whitespace-only
-        text means "no filter" - all rows are returned.
-        """
-        needle = normalize_for_match(text) if text else ""
-        if not needle:
-            return rows
-        search_idx = [_SOCIO_COLUMNS.index(c) for c in _SOCIO_SEARCH_COLUMNS]
-        matched = []
-        for row in rows:
-            haystack = " ".join(normalize_for_match(row[i]) for i in search_idx if row[i] is not None)
-            if needle in haystack:
-                matched.append(row)
-        return matched
-
-    @staticmethod
-    def _populate_model(model: Any, keys: List[str], rows: List[tuple]) -> None:
-        """Rebuild `model` in place from `keys` (headers) and `rows`."""
-        from PySide6.QtGui import QStandardItem
-
-        model.removeRows(0, model.rowCount())
-        model.setColumnCount(len(keys))
-        model.setRowCount(0)
-        model.setHorizontalHeaderLabels([str(k) for k in keys])
-        for row in rows:
-            items = [QStandardItem("") if v is None else QStandardItem(str(v)) for v in row]
-            for item in items:
-                item.setEditable(False)
-            model.appendRow(items)
-
     def search_members(self, text: str, model: Any, include_inactive: bool = False) -> int:
         """Query socios matching `text` and populate the provided model.
 
-        Matches against numero_socio, nombre, apellidos and email,
-        accent/case-insensitively. Empty `text` means "no filter" - every
+        Matches word prefixes of numero_socio, nombre, apellidos and email,
+        accent/case-insensitively, through the socios_fts full-text index
+        rather than a Python scan. Empty `text` means "no filter" - every
         (matching-estado) socio is returned, which is also how the default
         members table load (see MembersMenuView.load_table_view) gets its
         data.
@@ -125,15 +173,42 @@ class MembersMenuService:
             return 0
 
         try:
-            rows = self._filter_socio_rows(self._fetch_socios_rows(include_inactive), text)
+            rows = self._fetch_socios_rows(include_inactive, text)
 
-            self._populate_model(model, list(_SOCIO_COLUMNS), rows)
+            model.set_rows(_SOCIO_COLUMNS, rows)
             logger.info("MembersMenuService.search_members: %d rows for '%s'", len(rows), text)
             return len(rows)
         except Exception as exc:
             logger.exception("MembersMenuService.search_members: failed - %s", exc)
             return 0
 
+    def list_members_page(
+        self,
+        text: str = "",
+        include_inactive: bool = False,
+        sort_column: Optional[str] = None,
+        descending: bool = False,
+        offset: int = 0,
+        page_size: int = MEMBERS_PAGE_SIZE,
+    ) -> Tuple[List[tuple], Optional[int]]:
+        """Return one page of matching socios plus the next page's offset.
+
+        Same filtering as search_members; `sort_column`/`descending` push a
+        header-click sort into the query, so only the first page of the
+        sorted result is read. The offset is None once there are no more
+        rows. Returns ([], None) on failure.
+        """
+        try:
+            rows = self._fetch_socios_rows(
+                include_inactive, text, sort_column, descending, limit=page_size + 1, offset=offset
+            )
+            if len(rows) > page_size:
+                return rows[:page_size], offset + page_size
+            return rows, None
+        except Exception as exc:
+            logger.exception("MembersMenuService.list_members_page: failed - %s", exc)
+            return [], None
+
     def get_filter_labels(self, model: Optional[Any]) -> List[str]:
         """Return a list of header labels for the provided model.
 
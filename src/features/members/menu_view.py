@@ -29,8 +29,8 @@ from PySide6.QtWidgets import (
     QHeaderView,
     QAbstractItemView,
 )
-from PySide6.QtGui import QStandardItemModel, QAction
-from PySide6.QtCore import Qt, QEvent, QTimer
+from PySide6.QtGui import QAction
+from PySide6.QtCore import Qt, QEvent, QTimer, QModelIndex
 from utils.logger import get_logger
 logger = get_logger(__name__)
 
@@ -38,8 +38,45 @@ from .toolbar import MembersToolBar
 from .column_fill import ensure_columns_fill as _ensure_columns_fill
 from .table_sort import TableSortMixin
 from .table_selection import capture_selected_id, restore_selected_id
+from common.query_runner import QueryRunner
+from common.table_model import RowTableModel
 from ui.styles import MEMBERS_MENU_STYLESHEET
-from .menu_service import MembersMenuService
+from .menu_service import _SOCIO_COLUMNS, MembersMenuService
+class _PagedMembersModel(RowTableModel):
+    """RowTableModel that pulls further pages of socios on demand.
+
+    Same canFetchMore()/fetchMore() shape as the Transacciones screen's
+    paged model; the sort is part of the query
+    (MembersMenuService.list_members_page), so later pages continue it.
+    """
+
+    def __init__(self, service: MembersMenuService, parent=None) -> None:
+        super().__init__(_SOCIO_COLUMNS, parent)
+        self._service = service
+        self._query: dict = {}
+        self._next_offset: Optional[int] = None
+
+    def load_first_page(self, query: dict, rows: list, next_offset: Optional[int]) -> None:
+        """Replace every loaded row with the first page for `query` (a
+        list_members_page result, fetched off the GUI thread by the view);
+        later pages continue from `next_offset`."""
+        self._query = dict(query)
+        self._next_offset = next_offset
+        self.set_rows(_SOCIO_COLUMNS, rows)
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        if parent.isValid():
+            return False
+        return self._next_offset is not None
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        if parent.isValid() or self._next_offset is None:
+            return
+        rows, self._next_offset = self._service.list_members_page(offset=self._next_offset, **self._query)
+        self.append_rows(rows)
+        logger.info("MembersMenuView.fetchMore: +%d rows", len(rows))
+
+
 class MembersMenuView(QWidget, TableSortMixin):
     """Members menu view widget.
 
@@ -174,8 +211,12 @@ class MembersMenuView(QWidget, TableSortMixin):
         self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.table.setAlternatingRowColors(True)
 
-        # Minimal model. Real app should replace with a proper model connected to DB.
-        self.model = QStandardItemModel(0, 4, self)
+        # Backend/service used by the view (also feeds the paged model)
+        self._service = MembersMenuService()
+        # Runs the search query off the GUI thread (common/query_runner.py).
+        self._query_runner = QueryRunner(self)
+        # Loaded a page at a time, see _PagedMembersModel.
+        self.model = _PagedMembersModel(self._service, parent=self)
         self.table.setModel(self.model)
 
         header = self.table.horizontalHeader()
@@ -203,8 +244,6 @@ class MembersMenuView(QWidget, TableSortMixin):
 
         # Set table and model references for the toolbar
         self.toolbar.set_table_references(self.table, self.model)
-        # Backend/service used by the view
-        self._service = MembersMenuService()
         # Populate filters menu based on current model columns
         self._populate_filters_menu()
         
@@ -331,14 +370,7 @@ class MembersMenuView(QWidget, TableSortMixin):
         # Same row-persists-across-reload rule as load_table_view() (PLAN.md 4.4).
         selected_id = capture_selected_id(self.table, self.model)
         # Delegate search/population to service
-        added = self._service.search_members(text, self.model, include_inactive=self._show_inactive)
-        logger.info("Search added %d rows", added)
-        restore_selected_id(self.table, self.model, selected_id)
-        # After populating the model, ensure columns fill the available width
-        try:
-            self.ensure_columns_fill()
-        except Exception:
-            pass
+        self._reload_pages(text, selected_id)
 
     def load_table_view(self) -> None:
         """Reload the members table (socios) from the database.
@@ -365,19 +397,47 @@ class MembersMenuView(QWidget, TableSortMixin):
         # kept for TableSortMixin, which checks this before reloading on
         # sort-clear; always "socios" now that there's nothing else to load.
         self._current_view_name = "socios"
-        added = self._service.search_members(text, self.model, include_inactive=self._show_inactive)
-        logger.info("Cargados %d socios (filtro: '%s')", added, text)
+        # An active header sort is part of the query (_reload_pages), so
+        # there's no _maybe_reapply_sort() pass afterwards.
+        self._reload_pages(text, selected_id)
+
+    def refresh_table(self) -> None:
+        """Reload the members table from the database."""
+        try:
+            self.load_table_view()
+        except Exception as exc:
+            logger.exception("MembersMenuView.refresh_table: failed - %s", exc)
+
+    def _reload_pages(self, text: str, selected_id: Optional[str] = None) -> None:
+        """Load the first page for `text` under the current filters/sort.
+
+        The query runs off the GUI thread; a newer reload supersedes it, so
+        only the latest search's rows ever reach the model. `selected_id`
+        is re-selected once they arrive.
+        """
+        sort_column = None
+        if self._sort_column is not None and 0 <= self._sort_column < len(_SOCIO_COLUMNS):
+            sort_column = _SOCIO_COLUMNS[self._sort_column]
+        query = {
+            "text": text,
+            "include_inactive": self._show_inactive,
+            "sort_column": sort_column,
+            "descending": self._sort_order == Qt.SortOrder.DescendingOrder,
+        }
+        self._query_runner.submit(
+            self._service.list_members_page,
+            on_result=lambda page: self._on_first_page(query, page, selected_id),
+            **query,
+        )
+
+    def _on_first_page(self, query: dict, page: tuple, selected_id: Optional[str]) -> None:
+        rows, next_offset = page
+        self.model.load_first_page(query, rows, next_offset)
+        logger.info("Cargados %d socios (filtro: '%s')", len(rows), query["text"])
 
         # Refresh filters menu to match new columns
         self._populate_filters_menu()
 
-        # If a sort is currently active, try to re-apply it on the newly loaded model
-        try:
-            self._maybe_reapply_sort()
-        except Exception:
-            # Non-critical; ignore reapply failures
-            logger.debug("_maybe_reapply_sort failed (ignored)")
-
         restore_selected_id(self.table, self.model, selected_id)
 
         # Ensure columns expand to fill the area after model load
@@ -386,16 +446,25 @@ class MembersMenuView(QWidget, TableSortMixin):
         except Exception:
             pass
 
-    def refresh_table(self) -> None:
-        """Reload the members table from the database."""
+    def _apply_sort(self) -> None:
+        """Run the header-click sort in the database rather than in memory:
+        only the loaded pages are in the model, so sorting them alone would
+        be wrong. Reloads from the first page of the sorted query."""
+        if self._sort_column is None or self._sort_order is None:
+            return
         try:
-            self.load_table_view()
-        except Exception as exc:
-            logger.exception("MembersMenuView.refresh_table: failed - %s", exc)
+            self._reload_pages(self.search_input.text().strip())
+            header = self.table.horizontalHeader()
+            header.setSortIndicator(self._sort_column, self._sort_order)
+            header.setSortIndicatorShown(True)
+            self.ensure_columns_fill()
+        except Exception:
+            logger.exception("MembersMenuView._apply_sort: failed to apply sort")
 
-    # Sorting behaviour (header-click cycle, diacritic-aware compare) lives in
-    # TableSortMixin (see table_sort.py) — this class only owns the sort state
-    # (_sort_column/_sort_order, initialized above) and the widgets it acts on.
+    # The rest of the header-click cycle (state toggling, sort-clear
+    # restoration) lives in TableSortMixin (see table_sort.py) — this class
+    # only owns the sort state (_sort_column/_sort_order, initialized above)
+    # and the widgets it acts on.
 
 
 def show_members_view(main_window) -> None:
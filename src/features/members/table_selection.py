@@ -1,7 +1,7 @@
 """Row-selection persistence helper for results tables.
 
-Every screen's load_table_view() rebuilds its QStandardItemModel from
-scratch (removeRows/setRowCount(0) + appendRow for each row), which discards
+Every screen's load_table_view() reloads its model from scratch (a
+RowTableModel reset, or a QStandardItemModel rebuilt row by row), which discards
 whatever row the user had selected - the QItemSelectionModel's indexes no
 longer point at anything once the rows they referred to are gone. These two
 functions let a reload re-select "the same logical row" (matched by the
@@ -18,10 +18,10 @@ from __future__ import annotations
 from typing import Optional
 
 from PySide6.QtWidgets import QTableView
-from PySide6.QtGui import QStandardItemModel
+from PySide6.QtCore import QAbstractItemModel
 
 
-def capture_selected_id(table: QTableView, model: QStandardItemModel, id_column: int = 0) -> Optional[str]:
+def capture_selected_id(table: QTableView, model: QAbstractItemModel, id_column: int = 0) -> Optional[str]:
     """Return the id-column text of the currently selected row, if any.
 
     Call this before rebuilding `model` and pass the result to
@@ -36,7 +36,7 @@ def capture_selected_id(table: QTableView, model: QStandardItemModel, id_column:
     return rows[0].data()
 
 
-def restore_selected_id(table: QTableView, model: QStandardItemModel, id_value: Optional[str], id_column: int = 0) -> None:
+def restore_selected_id(table: QTableView, model: QAbstractItemModel, id_value: Optional[str], id_column: int = 0) -> None:
     """Re-select the row whose id-column text matches `id_value`, if present.
 
     No-ops if id_value is None or no row matches (the row was deleted, or a
@@ -46,7 +46,6 @@ def restore_selected_id(table: QTableView, model: QStandardItemModel, id_value:
     if id_value is None:
         return
     for row in range(model.rowCount()):
-        item = model.item(row, id_column)
-        if item is not None and item.text() == id_value:
+        if model.index(row, id_column).data() == id_value:
             table.selectRow(row)
             return
@@ -8,7 +8,6 @@ mixin avoids threading a dozen callbacks through a standalone helper.
 from __future__ import annotations
 
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QStandardItem
 
 from utils.logger import get_logger
 from utils.text import normalize_for_match
@@ -104,38 +103,14 @@ class TableSortMixin:
             col = self._sort_column
             ascending = self._sort_order == Qt.SortOrder.AscendingOrder
 
-            # Extract all rows as lists of text values
-            rows = []
-            row_count = self.model.rowCount()
-            col_count = self.model.columnCount()
-            for r in range(row_count):
-                vals = []
-                for c in range(col_count):
-                    item = self.model.item(r, c)
-                    vals.append("") if item is None else vals.append(item.text())
-                rows.append(vals)
-
-            # Stable sort using keys that remove diacritics and prefer numeric ordering
-            rows.sort(key=lambda rv: self._make_sort_key(rv[col]), reverse=not ascending)
-
-            # Repopulate model preserving header labels
-            # Capture headers
-            headers = [self.model.headerData(c, Qt.Orientation.Horizontal) for c in range(col_count)]
-
-            # Clear and rebuild
-            self.model.removeRows(0, self.model.rowCount())
-            self.model.setColumnCount(col_count)
-            if headers:
-                self.model.setHorizontalHeaderLabels([str(h) if h is not None else "" for h in headers])
-
-            for vals in rows:
-                items = [QStandardItem("" if v is None else str(v)) for v in vals]
-                self.model.appendRow(items)
+            # Permutation over cached per-column keys (common/table_model.py) -
+            # no cell is read back out or rebuilt.
+            self.model.sort_rows(col, self._make_sort_key, descending=not ascending)
 
             header = self.table.horizontalHeader()
             header.setSortIndicator(self._sort_column, self._sort_order)
             header.setSortIndicatorShown(True)
-            # After sorting and repopulating the model, ensure columns fill
+            # After sorting, ensure columns fill
             try:
                 self.ensure_columns_fill()
             except Exception:
@@ -11,15 +11,17 @@ from typing import List, Optional, Tuple, TYPE_CHECKING
 
 from PySide6.QtWidgets import QToolBar, QStyle, QTableView, QMessageBox
 from PySide6.QtCore import QSize
-from PySide6.QtGui import QStandardItemModel
 
 if TYPE_CHECKING:
     from PySide6.QtWidgets import QWidget
 
 from .toolbar_service import MembersService
 from .dialog import MemberDialog
+from features.periodos.service import PeriodosService
+from features.saldos.dialog import FamilyBalanceDialog
 from features.transactions.dialog import TransactionDialog
 from features.transactions.service import TransactionsService
+from common.table_model import RowTableModel
 from utils.logger import get_logger
 logger = get_logger(__name__)
 
@@ -46,7 +48,7 @@ class MembersToolBar(QToolBar):
         self.setIconSize(QSize(18, 18))
         # Reference to the table view and model (will be set by parent)
         self.table: Optional[QTableView] = None
-        self.model: Optional[QStandardItemModel] = None
+        self.model: Optional[RowTableModel] = None
 
         # Behaviour services (non-UI logic)
         self.service: MembersService = service or MembersService()
@@ -100,7 +102,12 @@ class MembersToolBar(QToolBar):
         act_register.setToolTip("Registrar cargos, pagos y devoluciones")
         act_register.triggered.connect(self.on_register_movements)
 
-    def set_table_references(self, table: QTableView, model: QStandardItemModel) -> None:
+        icon_balance = self.style().standardIcon(QStyle.SP_FileDialogDetailedView)
+        act_balance = self.addAction(icon_balance, "Saldo")
+        act_balance.setToolTip("Ver el historial y el saldo de la familia seleccionada")
+        act_balance.triggered.connect(self.on_show_balance)
+
+    def set_table_references(self, table: QTableView, model: RowTableModel) -> None:
         """Set references to the table view and model for toolbar operations."""
         self.table = table
         self.model = model
@@ -143,10 +150,9 @@ class MembersToolBar(QToolBar):
             return
 
         row = sel[0].row()
-        id_item = self.model.item(row, 0)
         try:
-            id_socio = int(id_item.text()) if id_item is not None else None
-        except (ValueError, AttributeError):
+            id_socio = int(self.model.text(row, COL_ID))
+        except ValueError:
             id_socio = None
         if id_socio is None:
             logger.warning("MembersToolBar.on_edit_member: could not resolve id_socio for row=%s", row)
@@ -190,20 +196,16 @@ class MembersToolBar(QToolBar):
         resolved: List[Tuple[int, str, str]] = []
         for index in self.table.selectionModel().selectedRows():
             row = index.row()
-            id_item = self.model.item(row, COL_ID)
-            nombre_item = self.model.item(row, COL_NOMBRE)
-            apellidos_item = self.model.item(row, COL_APELLIDOS)
-            estado_item = self.model.item(row, COL_ESTADO)
             try:
-                id_socio = int(id_item.text()) if id_item is not None else None
-            except (ValueError, AttributeError):
+                id_socio = int(self.model.text(row, COL_ID))
+            except ValueError:
                 id_socio = None
             if id_socio is None:
                 logger.warning("MembersToolBar: could not resolve id_socio for row=%s", row)
                 continue
-            parts = [item.text() for item in (nombre_item, apellidos_item) if item is not None and item.text()]
-            nombre_completo = " ".join(parts).strip() or f"fila {row}"
-            estado_actual = estado_item.text() if estado_item is not None else "activo"
+            parts = [self.model.text(row, col) for col in (COL_NOMBRE, COL_APELLIDOS)]
+            nombre_completo = " ".join(p for p in parts if p).strip() or f"fila {row}"
+            estado_actual = self.model.text(row, COL_ESTADO) or "activo"
             resolved.append((id_socio, nombre_completo, estado_actual))
         return resolved
 
@@ -333,11 +335,7 @@ class MembersToolBar(QToolBar):
             for r in range(self.model.rowCount()):
                 row_vals = []
                 for c in range(self.model.columnCount()):
-                    item = self.model.item(r, c)
-                    try:
-                        row_vals.append(item.text() if item is not None else "")
-                    except Exception:
-                        row_vals.append(str(item) if item is not None else "")
+                    row_vals.append(self.model.text(r, c))
                 rows.append(row_vals)
         self.service.export_members(rows, destination=None)
 
@@ -375,6 +373,9 @@ class MembersToolBar(QToolBar):
                     )
                     return
 
+        # PLAN.md 2.6: entering a screen that needs an open período rolls
+        # it over first, so the dialog's picker already offers it.
+        PeriodosService().rollover()
         dialog = TransactionDialog(self, service=self.transactions_service, preset_socio=preset_socio)
         if dialog.exec() != TransactionDialog.DialogCode.Accepted:
             return
@@ -393,6 +394,21 @@ class MembersToolBar(QToolBar):
             return
         QMessageBox.information(self, "Movimiento registrado", "El movimiento se registró correctamente.")
 
+    def on_show_balance(self) -> None:
+        """Open FamilyBalanceDialog for the selected member's family - the
+        balance is per numero_socio, so any member of it shows the same."""
+        if self.table is None or self.model is None:
+            return
+        sel = self.table.selectionModel().selectedRows()
+        if len(sel) != 1:
+            QMessageBox.information(self, "Saldo", "Seleccione un único miembro para ver el saldo de su familia.")
+            return
+        numero_socio = self.model.text(sel[0].row(), 1)
+        if not numero_socio:
+            QMessageBox.critical(self, "Error", "No se pudo resolver el socio seleccionado.")
+            return
+        FamilyBalanceDialog(self, numero_socio=numero_socio).exec()
+
     def _resolve_preset_socio(self, row: int) -> Optional[dict]:
         """Read the Members table's columns 0-3 for `row` into a preset_socio
         dict shaped like TransactionsService.list_socios_activos()'s rows.
@@ -402,20 +418,16 @@ class MembersToolBar(QToolBar):
         """
         if self.model is None:
             return None
-        id_item = self.model.item(row, 0)
-        numero_item = self.model.item(row, 1)
-        nombre_item = self.model.item(row, 2)
-        apellidos_item = self.model.item(row, 3)
         try:
-            id_socio = int(id_item.text()) if id_item is not None else None
-        except (ValueError, AttributeError):
+            id_socio = int(self.model.text(row, 0))
+        except ValueError:
             id_socio = None
-        numero_socio = numero_item.text() if numero_item is not None else None
+        numero_socio = self.model.text(row, 1)
         if id_socio is None or not numero_socio:
             return None
         return {
             "id_socio": id_socio,
             "numero_socio": numero_socio,
-            "nombre": nombre_item.text() if nombre_item is not None else "",
-            "apellidos": apellidos_item.text() if apellidos_item is not None else "",
+            "nombre": self.model.text(row, 2),
+            "apellidos": self.model.text(row, 3),
         }
\ No newline at end of file
@@ -0,0 +1 @@
+"""Períodos feature: automatic período rollover (PLAN.md 2.6)."""
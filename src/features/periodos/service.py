@@ -0,0 +1,192 @@
+"""Automatic período rollover (PLAN.md 2.6, decided in §6).
+
+On navigation into a screen that needs an open período (Transacciones, the
+Members "Registrar" shortcut), PeriodosService.rollover() makes sure today's
+date falls inside a período: if none covers it, the next monthly períodos
+are created (same one-month-minus-a-day length as create_periodo_rapido) up
+to the one containing today. Every período that ended before the current
+one and is still "abierto" is then closed in one UPDATE, so exactly one
+período stays open.
+
+Each new período starts with a SaldoSocios row per family, carrying the
+family's latest saldo_actual into saldo_anterior - one INSERT ... SELECT
+(_SEED_SQL), not a loop. A closed período is a frozen snapshot:
+TransactionsService rejects movements into it and rebuild_saldos starts
+each family's chain from its last closed row instead of recomputing them
+(see features/saldos/service.py).
+
+The "is anything to do" check is answered from reference_cache.periodo_en's
+interval index and the cached períodos snapshot, so the common case - a
+navigation inside an already-open período - touches no table at all.
+"""
+
+from __future__ import annotations
+
+import calendar
+import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import text
+
+from database import reference_cache, saldo_changes
+from database.audit import record_log
+from database.models import Periodo
+from database.session import get_session
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+PERIODO_ABIERTO = "abierto"
+PERIODO_CERRADO = "cerrado"
+
+_MESES = (
+    "Enero", "Febrero", "Marzo", "Abril", "Mayo", "Junio",
+    "Julio", "Agosto", "Septiembre", "Octubre", "Noviembre", "Diciembre",
+)
+
+# Seed a new período's SaldoSocios rows from each family's latest earlier
+# row (the saldo chain's order: fecha_inicio, then id_periodo), movements
+# zeroed. Families that already have a row for it are left alone.
+_SEED_SQL = text(
+    """
+    INSERT INTO saldos_socios
+        (numero_socio, id_periodo, saldo_anterior, cargos, pagos, reembolsos, devoluciones, saldo_actual)
+    SELECT numero_socio, :id_periodo, saldo_actual, 0, 0, 0, 0, saldo_actual
+    FROM (
+        SELECT s.numero_socio, s.saldo_actual,
+               ROW_NUMBER() OVER (
+                   PARTITION BY s.numero_socio
+                   ORDER BY p.fecha_inicio DESC, p.id_periodo DESC
+               ) AS rn
+        FROM saldos_socios s
+        JOIN periodo p ON p.id_periodo = s.id_periodo
+        WHERE p.fecha_inicio < :fecha_inicio
+           OR (p.fecha_inicio = :fecha_inicio AND p.id_periodo < :id_periodo)
+    )
+    WHERE rn = 1
+    ON CONFLICT (numero_socio, id_periodo) DO NOTHING
+    """
+)
+
+
+def add_months(fecha: datetime.date, months: int) -> datetime.date:
+    """Add `months` calendar months to `fecha`, clamping the day if needed."""
+    month_index = fecha.month - 1 + months
+    year = fecha.year + month_index // 12
+    month = month_index % 12 + 1
+    day = min(fecha.day, calendar.monthrange(year, month)[1])
+    return datetime.date(year, month, day)
+
+
+def fecha_fin_mensual(fecha_inicio: datetime.date) -> datetime.date:
+    """A monthly período's fecha_fin: one month minus a day after fecha_inicio."""
+    return add_months(fecha_inicio, 1) - datetime.timedelta(days=1)
+
+
+def nombre_mensual(fecha_inicio: datetime.date) -> str:
+    """Default name for an automatically created período, e.g. "Enero 2026"."""
+    return f"{_MESES[fecha_inicio.month - 1]} {fecha_inicio.year}"
+
+
+class PeriodosService:
+    """Service for período lifecycle operations without direct Qt coupling."""
+
+    def _nuevos_periodos(self, periodos: List[Dict[str, Any]], hoy: datetime.date) -> List[datetime.date]:
+        """fecha_inicio of every monthly período to create so one covers `hoy`.
+
+        Continues from the latest fecha_fin, or starts at the first of this
+        month when there are no períodos yet. Empty when `hoy` falls before
+        the last período ends (a gap between períodos, or before the first)
+        - those need a manual decision, not a guess.
+        """
+        if not periodos:
+            return [hoy.replace(day=1)]
+        ultima_fin = max(p["fecha_fin"] for p in periodos)
+        if hoy <= ultima_fin:
+            return []
+        inicios = []
+        inicio = ultima_fin + datetime.timedelta(days=1)
+        while inicio <= hoy:
+            inicios.append(inicio)
+            inicio = fecha_fin_mensual(inicio) + datetime.timedelta(days=1)
+        return inicios
+
+    def rollover(self, hoy: Optional[datetime.date] = None) -> Optional[int]:
+        """Make sure a período covers `hoy` (default today) and is the only
+        open one up to it. Returns the current período's id when anything
+        changed (períodos created or closed), else None - also on failure,
+        logged, since navigation must go on regardless.
+
+        Open períodos that start after the current one (created ahead of
+        time) are left open.
+        """
+        hoy = hoy or datetime.date.today()
+        actual = reference_cache.periodo_en(hoy)
+        periodos = reference_cache.periodos()
+        inicios = [] if actual is not None else self._nuevos_periodos(periodos, hoy)
+        if actual is None and not inicios:
+            logger.warning("PeriodosService.rollover: no período covers %s and none can follow the last one", hoy)
+            return None
+        inicio_actual = actual["fecha_inicio"] if actual is not None else inicios[-1]
+        por_cerrar = [
+            p for p in periodos
+            if p["estado"] == PERIODO_ABIERTO and p["fecha_fin"] < inicio_actual
+        ]
+        if not inicios and not por_cerrar:
+            return None
+
+        try:
+            with get_session() as session:
+                creados = []
+                for inicio in inicios:
+                    periodo = Periodo(
+                        nombre=nombre_mensual(inicio),
+                        fecha_inicio=inicio,
+                        fecha_fin=fecha_fin_mensual(inicio),
+                        estado=PERIODO_ABIERTO,
+                    )
+                    session.add(periodo)
+                    session.flush()
+                    session.execute(
+                        _SEED_SQL, {"id_periodo": periodo.id_periodo, "fecha_inicio": inicio.isoformat()}
+                    )
+                    creados.append(periodo)
+                if creados:
+                    saldo_changes.note_touched(session, None)
+                id_actual = creados[-1].id_periodo if creados else actual["id_periodo"]
+
+                if por_cerrar:
+                    session.query(Periodo).filter(
+                        Periodo.id_periodo.in_([p["id_periodo"] for p in por_cerrar]),
+                        Periodo.estado == PERIODO_ABIERTO,
+                    ).update({Periodo.estado: PERIODO_CERRADO}, synchronize_session=False)
+
+                # Intermediate períodos created to bridge a long absence are
+                # already in the past: close them too.
+                for periodo in creados[:-1]:
+                    periodo.estado = PERIODO_CERRADO
+
+                partes = []
+                if creados:
+                    partes.append("alta de " + ", ".join(f"'{p.nombre}'" for p in creados))
+                cerrados = [p["nombre"] for p in por_cerrar] + [p.nombre for p in creados[:-1]]
+                if cerrados:
+                    partes.append("cierre de " + ", ".join(f"'{nombre}'" for nombre in cerrados))
+                record_log(
+                    session,
+                    id_socio=None,
+                    accion="rollover",
+                    tabla_afectada="periodo",
+                    id_registro_afectado=id_actual,
+                    descripcion_cambio=f"Cambio automático de período al {hoy.isoformat()}: " + "; ".join(partes),
+                )
+            logger.info(
+                "PeriodosService.rollover: current id=%s, created %d, closed %d",
+                id_actual,
+                len(creados),
+                len(cerrados),
+            )
+            return id_actual
+        except Exception as exc:
+            logger.exception("PeriodosService.rollover: failed - %s", exc)
+            return None
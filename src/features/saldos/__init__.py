@@ -0,0 +1 @@
+"""Saldos feature: SaldoSocios balance maintenance (PLAN.md 2.5)."""
@@ -0,0 +1,92 @@
+"""Per-family balance detail (PLAN.md 2.15b's "Busqueda por socio").
+
+One family's movements, most recent first, each with the running balance
+after it - SaldosService.family_ledger_page, paged on scroll the same way
+the Transacciones screen is. The family name is resolved when the dialog
+opens, from whoever is titular now (PLAN.md 2.17), never stored.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from PySide6.QtCore import QModelIndex
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QDialog,
+    QDialogButtonBox,
+    QHeaderView,
+    QLabel,
+    QTableView,
+    QVBoxLayout,
+    QWidget,
+)
+
+from .service import FAMILY_LEDGER_COLUMNS, SaldosService
+from common.table_model import RowTableModel
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+COL_SALDO = FAMILY_LEDGER_COLUMNS.index("Saldo")
+
+
+class _FamilyLedgerModel(RowTableModel):
+    """RowTableModel that pulls further pages of one family's ledger on
+    demand - see TransactionsView's _PagedTransactionsModel."""
+
+    def __init__(self, service: SaldosService, numero_socio: str, parent=None) -> None:
+        super().__init__(FAMILY_LEDGER_COLUMNS, parent)
+        self._service = service
+        self._numero_socio = numero_socio
+        rows, self._next_token = service.family_ledger_page(numero_socio)
+        self.set_rows(FAMILY_LEDGER_COLUMNS, rows)
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        if parent.isValid():
+            return False
+        return self._next_token is not None
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        if parent.isValid() or self._next_token is None:
+            return
+        rows, self._next_token = self._service.family_ledger_page(self._numero_socio, after=self._next_token)
+        self.append_rows(rows)
+        logger.info("FamilyBalanceDialog.fetchMore: +%d rows", len(rows))
+
+
+class FamilyBalanceDialog(QDialog):
+    """Read-only running-balance history of the family `numero_socio`."""
+
+    def __init__(
+        self, parent: Optional[QWidget] = None, numero_socio: str = "", service: Optional[SaldosService] = None
+    ) -> None:
+        super().__init__(parent)
+        self.service = service or SaldosService()
+        nombre = self.service.family_name(numero_socio)
+        etiqueta = f"{numero_socio} · {nombre}" if nombre else numero_socio
+        self.setWindowTitle(f"Saldo de {etiqueta}")
+        self.setModal(True)
+        self.resize(760, 480)
+
+        layout = QVBoxLayout(self)
+
+        self.model = _FamilyLedgerModel(self.service, numero_socio, self)
+        # The first row is the latest movement, so its running balance is
+        # the family's current one.
+        saldo = self.model.text(0, COL_SALDO) if self.model.rowCount() else "0.00"
+        self.summary_label = QLabel(f"<b>{etiqueta}</b> — saldo actual: {saldo}€ (positivo = debe al club)", self)
+        layout.addWidget(self.summary_label)
+
+        self.table = QTableView(self)
+        self.table.setObjectName("resultsTable")
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setAlternatingRowColors(True)
+        self.table.setModel(self.model)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        layout.addWidget(self.table)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Close, self)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
@@ -0,0 +1,549 @@
+"""Balance engine for SaldoSocios (PLAN.md 2.5).
+
+Balances are per numero_socio (the family, never the individual - see
+models.py) and per período, using the decided formula (PLAN.md §6):
+
+    saldo_actual = saldo_anterior + cargos - pagos - reembolsos + devoluciones
+
+chained forward across períodos: a período's saldo_anterior is the
+family's saldo_actual in the previous período (ordered by fecha_inicio),
+so saldo_actual is a continuous running total, never reset per período.
+A positive saldo_actual means the family owes the club.
+
+apply_transaction() keeps this up to date incrementally on every new
+Transaccion: it's called from inside the writer's own get_session()
+block (same rule as database/audit.py's record_log), so the movement and
+its balance update commit or roll back together; apply_transactions() is
+its batch form, for TransactionsService.add_transactions. rebuild_saldos()
+is the full recompute from transacciones, for repairing drift or
+backfilling a database that predates the incremental path - run it from
+Ajustes or headless with `python -m features.saldos.service` from src/.
+All three also refresh the touched families' debtor flags
+(database/deudores.py) in the same transaction.
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import Numeric, and_, case, func, insert, or_, select, text, type_coerce, update
+from sqlalchemy.orm import Session
+
+from database import reference_cache, saldo_changes, socio_labels
+from database.audit import record_log
+from database.deudores import refresh_deudores
+from database.indexes import ensure_indexes
+from database.models import Periodo, SaldoSocios, Transaccion
+from database.session import get_session
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Transaccion.tipo -> (SaldoSocios column it accumulates into, sign it
+# contributes to saldo_actual). Keys mirror TIPOS_TRANSACCION in
+# features/transactions/service.py - not imported from there, since that
+# module imports this one.
+_TIPO_EFFECTS = {
+    "Cargo": ("cargos", 1),
+    "Pago": ("pagos", -1),
+    "Reembolso": ("reembolsos", -1),
+    "Devolución": ("devoluciones", 1),
+}
+
+# SaldoSocios column -> its sign in saldo_actual, for apply_transactions.
+_COLUMN_SIGNS = dict(_TIPO_EFFECTS.values())
+
+_ZERO = Decimal("0")
+
+# numero_socio values per IN (...) when apply_transactions preloads rows -
+# well under SQLite's bound-parameter limit.
+_PRELOAD_CHUNK = 500
+
+# Rows per family_ledger_page() call - the family balance dialog's first
+# screenful plus scroll room.
+FAMILY_LEDGER_PAGE_SIZE = 100
+
+# Columns of family_ledger_page's rows, in display order.
+FAMILY_LEDGER_COLUMNS = ("ID", "Fecha", "Tipo", "Monto", "Saldo", "Método", "Período", "Referencia")
+
+# Families recomputed per transaction by rebuild_saldos - bounds how long
+# each chunk holds SQLite's write lock on a multi-million-row ledger.
+_REBUILD_CHUNK_FAMILIES = 2000
+
+# One chunk of rebuild_saldos, entirely inside SQLite: per-tipo totals
+# grouped by (numero_socio, id_periodo), the saldo chain as a running SUM()
+# window ordered by (fecha_inicio, id_periodo), and one upsert of the
+# result. `claves` also keeps SaldoSocios rows that have no movements, so
+# they're re-chained (saldo_anterior carried forward) instead of left stale.
+# With :congelar = 1, closed períodos are frozen snapshots: their rows and
+# movements are skipped, and each family's chain starts from the
+# saldo_actual of its last closed row (`base`) - closed períodos precede
+# every open one, as features/periodos/service.py's rollover leaves them.
+_REBUILD_SQL = text(
+    """
+    WITH cerrados AS (
+        SELECT id_periodo FROM periodo WHERE estado = 'cerrado' AND :congelar = 1
+    ),
+    base AS (
+        SELECT numero_socio, saldo_actual FROM (
+            SELECT s.numero_socio, s.saldo_actual,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY s.numero_socio
+                       ORDER BY p.fecha_inicio DESC, p.id_periodo DESC
+                   ) AS rn
+            FROM saldos_socios s
+            JOIN periodo p ON p.id_periodo = s.id_periodo
+            WHERE s.numero_socio BETWEEN :lo AND :hi
+              AND s.id_periodo IN (SELECT id_periodo FROM cerrados)
+        )
+        WHERE rn = 1
+    ),
+    claves AS (
+        SELECT numero_socio, id_periodo FROM transacciones
+        WHERE numero_socio BETWEEN :lo AND :hi AND id_periodo IS NOT NULL
+          AND id_periodo NOT IN (SELECT id_periodo FROM cerrados)
+        UNION
+        SELECT numero_socio, id_periodo FROM saldos_socios
+        WHERE numero_socio BETWEEN :lo AND :hi
+          AND id_periodo NOT IN (SELECT id_periodo FROM cerrados)
+    ),
+    totales AS (
+        SELECT numero_socio, id_periodo,
+               SUM(CASE WHEN tipo = 'Cargo' THEN monto ELSE 0 END) AS cargos,
+               SUM(CASE WHEN tipo = 'Pago' THEN monto ELSE 0 END) AS pagos,
+               SUM(CASE WHEN tipo = 'Reembolso' THEN monto ELSE 0 END) AS reembolsos,
+               SUM(CASE WHEN tipo = 'Devolución' THEN monto ELSE 0 END) AS devoluciones
+        FROM transacciones
+        WHERE numero_socio BETWEEN :lo AND :hi AND id_periodo IS NOT NULL
+          AND id_periodo NOT IN (SELECT id_periodo FROM cerrados)
+        GROUP BY numero_socio, id_periodo
+    ),
+    cadena AS (
+        SELECT c.numero_socio, c.id_periodo,
+               COALESCE(t.cargos, 0) AS cargos,
+               COALESCE(t.pagos, 0) AS pagos,
+               COALESCE(t.reembolsos, 0) AS reembolsos,
+               COALESCE(t.devoluciones, 0) AS devoluciones,
+               COALESCE(t.cargos - t.pagos - t.reembolsos + t.devoluciones, 0) AS movimiento,
+               COALESCE(b.saldo_actual, 0) + SUM(COALESCE(t.cargos - t.pagos - t.reembolsos + t.devoluciones, 0)) OVER (
+                   PARTITION BY c.numero_socio
+                   ORDER BY p.fecha_inicio, p.id_periodo
+                   ROWS UNBOUNDED PRECEDING
+               ) AS acumulado
+        FROM claves c
+        JOIN periodo p ON p.id_periodo = c.id_periodo
+        LEFT JOIN totales t ON t.numero_socio = c.numero_socio AND t.id_periodo = c.id_periodo
+        LEFT JOIN base b ON b.numero_socio = c.numero_socio
+    )
+    INSERT INTO saldos_socios
+        (numero_socio, id_periodo, saldo_anterior, cargos, pagos, reembolsos, devoluciones, saldo_actual)
+    SELECT numero_socio, id_periodo,
+           ROUND(acumulado - movimiento, 2), ROUND(cargos, 2), ROUND(pagos, 2),
+           ROUND(reembolsos, 2), ROUND(devoluciones, 2), ROUND(acumulado, 2)
+    FROM cadena WHERE true
+    ON CONFLICT (numero_socio, id_periodo) DO UPDATE SET
+        saldo_anterior = excluded.saldo_anterior,
+        cargos = excluded.cargos,
+        pagos = excluded.pagos,
+        reembolsos = excluded.reembolsos,
+        devoluciones = excluded.devoluciones,
+        saldo_actual = excluded.saldo_actual
+    """
+)
+
+
+def _later_periodos(periodo: Periodo):
+    """Select every id_periodo ordered after `periodo` in the saldo chain.
+
+    Ties on fecha_inicio are broken by id_periodo, so two períodos that
+    happen to start on the same day still have one well-defined order.
+    """
+    return select(Periodo.id_periodo).where(
+        or_(
+            Periodo.fecha_inicio > periodo.fecha_inicio,
+            and_(Periodo.fecha_inicio == periodo.fecha_inicio, Periodo.id_periodo > periodo.id_periodo),
+        )
+    )
+
+
+def _saldo_previo(session: Session, numero_socio: str, periodo: Periodo) -> Decimal:
+    """Return the family's saldo_actual in the closest earlier período that
+    has a SaldoSocios row, or 0 if there's none (first movement ever)."""
+    row = (
+        session.query(SaldoSocios.saldo_actual)
+        .join(Periodo, Periodo.id_periodo == SaldoSocios.id_periodo)
+        .filter(
+            SaldoSocios.numero_socio == numero_socio,
+            or_(
+                Periodo.fecha_inicio < periodo.fecha_inicio,
+                and_(Periodo.fecha_inicio == periodo.fecha_inicio, Periodo.id_periodo < periodo.id_periodo),
+            ),
+        )
+        .order_by(Periodo.fecha_inicio.desc(), Periodo.id_periodo.desc())
+        .first()
+    )
+    return row[0] if row is not None and row[0] is not None else _ZERO
+
+
+def apply_transaction(
+    session: Session,
+    *,
+    numero_socio: Optional[str],
+    id_periodo: Optional[int],
+    tipo: Optional[str],
+    monto: Optional[Decimal],
+) -> List[Tuple[str, int]]:
+    """Apply one movement's effect to SaldoSocios (not committed here).
+
+    O(1) in ledger size: updates (or creates) the single
+    (numero_socio, id_periodo) row, then shifts saldo_anterior/
+    saldo_actual of that family's later períodos by the same delta with
+    one ranged UPDATE - no re-summing of Transaccion rows. A row created
+    here starts from the closest earlier período's saldo_actual, so the
+    chain stays continuous even when a family skips períodos.
+
+    Returns the (numero_socio, id_periodo) snapshots it changed, also
+    noted in database/saldo_changes.py's feed; empty if skipped.
+    """
+    effect = _TIPO_EFFECTS.get(tipo)
+    if effect is None or not numero_socio or id_periodo is None or monto is None:
+        logger.warning(
+            "saldos.apply_transaction: skipped (numero_socio=%s, id_periodo=%s, tipo=%s, monto=%s)",
+            numero_socio, id_periodo, tipo, monto,
+        )
+        return []
+    periodo = session.get(Periodo, id_periodo)
+    if periodo is None:
+        logger.warning("saldos.apply_transaction: no periodo id=%s", id_periodo)
+        return []
+
+    column, sign = effect
+    monto = Decimal(monto)
+    delta = monto * sign
+
+    saldo = (
+        session.query(SaldoSocios)
+        .filter(SaldoSocios.numero_socio == numero_socio, SaldoSocios.id_periodo == id_periodo)
+        .one_or_none()
+    )
+    if saldo is None:
+        anterior = _saldo_previo(session, numero_socio, periodo)
+        saldo = SaldoSocios(
+            numero_socio=numero_socio,
+            id_periodo=id_periodo,
+            saldo_anterior=anterior,
+            cargos=_ZERO,
+            pagos=_ZERO,
+            reembolsos=_ZERO,
+            devoluciones=_ZERO,
+            saldo_actual=anterior,
+        )
+        session.add(saldo)
+    setattr(saldo, column, (getattr(saldo, column) or _ZERO) + monto)
+    saldo.saldo_actual = (saldo.saldo_actual or _ZERO) + delta
+    session.flush()
+
+    tocados = [(numero_socio, id_periodo)]
+    if delta:
+        table = SaldoSocios.__table__
+        shifted = session.execute(
+            update(table)
+            .where(table.c.numero_socio == numero_socio, table.c.id_periodo.in_(_later_periodos(periodo)))
+            .values(
+                saldo_anterior=func.round(table.c.saldo_anterior + delta, 2),
+                saldo_actual=func.round(table.c.saldo_actual + delta, 2),
+            )
+            .returning(table.c.id_periodo)
+        )
+        tocados.extend((numero_socio, later) for (later,) in shifted)
+    refresh_deudores(session.connection(), [numero_socio])
+    saldo_changes.note_touched(session, tocados)
+    return tocados
+
+
+def apply_transactions(
+    session: Session,
+    movements: Iterable[Tuple[Optional[str], Optional[int], Optional[str], Optional[Decimal]]],
+) -> None:
+    """Batch form of apply_transaction for (numero_socio, id_periodo, tipo,
+    monto) movements (not committed here).
+
+    Movements are first totalled per family and período, then each
+    affected family's SaldoSocios rows are read once (one IN query per
+    _PRELOAD_CHUNK families) as plain column dicts and updated in memory -
+    new rows chained from the closest earlier período, later períodos
+    shifted by each delta - and written back with one executemany INSERT
+    for the new rows and one bulk UPDATE by id_saldo for the changed ones.
+    No ORM objects are built, so a dues run over tens of thousands of
+    families stays a few statements; SaldoSocios instances already loaded
+    in `session` aren't refreshed.
+    """
+    totals: Dict[str, Dict[int, Dict[str, Decimal]]] = {}
+    for numero_socio, id_periodo, tipo, monto in movements:
+        effect = _TIPO_EFFECTS.get(tipo)
+        if effect is None or not numero_socio or id_periodo is None or monto is None:
+            logger.warning(
+                "saldos.apply_transactions: skipped (numero_socio=%s, id_periodo=%s, tipo=%s, monto=%s)",
+                numero_socio, id_periodo, tipo, monto,
+            )
+            continue
+        columns = totals.setdefault(numero_socio, {}).setdefault(id_periodo, {})
+        columns[effect[0]] = columns.get(effect[0], _ZERO) + Decimal(monto)
+    if not totals:
+        return
+
+    # Chain position of every período - the (fecha_inicio, id_periodo)
+    # order _later_periodos and _saldo_previo use.
+    orden = {
+        id_periodo: (fecha_inicio, id_periodo)
+        for id_periodo, fecha_inicio in session.query(Periodo.id_periodo, Periodo.fecha_inicio)
+    }
+    table = SaldoSocios.__table__
+    numeros = list(totals)
+    filas: Dict[str, List[Dict[str, Any]]] = {numero: [] for numero in numeros}
+    for start in range(0, len(numeros), _PRELOAD_CHUNK):
+        chunk = numeros[start:start + _PRELOAD_CHUNK]
+        for row in session.execute(select(table).where(table.c.numero_socio.in_(chunk))).mappings():
+            if row["id_periodo"] in orden:
+                filas[row["numero_socio"]].append(dict(row))
+
+    nuevas: List[Dict[str, Any]] = []
+    cambiadas: Dict[int, Dict[str, Any]] = {}
+    for numero_socio, por_periodo in totals.items():
+        family = filas[numero_socio]
+        for id_periodo in [pid for pid in por_periodo if pid not in orden]:
+            logger.warning("saldos.apply_transactions: no periodo id=%s", id_periodo)
+        for id_periodo in sorted((pid for pid in por_periodo if pid in orden), key=orden.__getitem__):
+            posicion = orden[id_periodo]
+            saldo = next((row for row in family if row["id_periodo"] == id_periodo), None)
+            if saldo is None:
+                previas = [row for row in family if orden[row["id_periodo"]] < posicion]
+                previa = max(previas, key=lambda row: orden[row["id_periodo"]], default=None)
+                anterior = previa["saldo_actual"] if previa is not None and previa["saldo_actual"] is not None else _ZERO
+                saldo = {
+                    "numero_socio": numero_socio,
+                    "id_periodo": id_periodo,
+                    "saldo_anterior": anterior,
+                    "cargos": _ZERO,
+                    "pagos": _ZERO,
+                    "reembolsos": _ZERO,
+                    "devoluciones": _ZERO,
+                    "saldo_actual": anterior,
+                }
+                family.append(saldo)
+                nuevas.append(saldo)
+
+            delta = _ZERO
+            for column, monto in por_periodo[id_periodo].items():
+                saldo[column] = (saldo[column] or _ZERO) + monto
+                delta += monto * _COLUMN_SIGNS[column]
+            saldo["saldo_actual"] = (saldo["saldo_actual"] or _ZERO) + delta
+            changed = [saldo]
+            if delta:
+                for later in family:
+                    if orden[later["id_periodo"]] > posicion:
+                        later["saldo_anterior"] = (later["saldo_anterior"] or _ZERO) + delta
+                        later["saldo_actual"] = (later["saldo_actual"] or _ZERO) + delta
+                        changed.append(later)
+            for row in changed:
+                if "id_saldo" in row:
+                    cambiadas[row["id_saldo"]] = row
+
+    if nuevas:
+        session.execute(insert(table), nuevas)
+    if cambiadas:
+        session.execute(update(SaldoSocios), list(cambiadas.values()))
+    refresh_deudores(session.connection(), numeros)
+    saldo_changes.note_touched(
+        session,
+        [(row["numero_socio"], row["id_periodo"]) for row in nuevas]
+        + [(row["numero_socio"], row["id_periodo"]) for row in cambiadas.values()],
+    )
+
+
+def rebuild_saldos(
+    progress: Optional[Callable[[int, int], None]] = None,
+    chunk_size: int = _REBUILD_CHUNK_FAMILIES,
+    include_closed: bool = False,
+) -> int:
+    """Recompute SaldoSocios rows from transacciones. Returns the number of
+    families rebuilt.
+
+    Closed períodos are frozen snapshots and skipped (see _REBUILD_SQL)
+    unless `include_closed`, which recomputes every row from scratch.
+
+    Families are processed in contiguous numero_socio ranges of
+    `chunk_size`, each chunk one aggregation + upsert statement committed
+    on its own (see _REBUILD_SQL), so the write lock is released between
+    chunks and `progress(done, total)` can report after each one. Chunks
+    run sequentially rather than in parallel: SQLite serializes writers,
+    so parallel workers would only queue on the same lock. Raises on
+    failure - callers that need the usual log-and-return-None shape go
+    through SaldosService.rebuild_saldos.
+    """
+    from database.session import engine
+
+    # Each chunk's range predicate needs this index to avoid a full scan
+    # of transacciones per chunk.
+    ensure_indexes(engine, [Transaccion.__table__])
+
+    with get_session() as session:
+        numeros = [
+            row[0]
+            for row in session.execute(
+                text(
+                    "SELECT numero_socio FROM transacciones WHERE numero_socio IS NOT NULL "
+                    "UNION SELECT numero_socio FROM saldos_socios WHERE numero_socio IS NOT NULL "
+                    "ORDER BY 1"
+                )
+            )
+        ]
+    total = len(numeros)
+    chunk_size = max(1, chunk_size)
+    for start in range(0, total, chunk_size):
+        chunk = numeros[start:start + chunk_size]
+        with get_session() as session:
+            session.execute(_REBUILD_SQL, {"lo": chunk[0], "hi": chunk[-1], "congelar": 0 if include_closed else 1})
+            refresh_deudores(session.connection(), chunk)
+            saldo_changes.note_touched(session, None)
+        done = start + len(chunk)
+        logger.info("saldos.rebuild_saldos: %d/%d families", done, total)
+        if progress is not None:
+            progress(done, total)
+    return total
+
+
+class SaldosService:
+    """UI-facing wrapper around the balance engine, in the usual service
+    shape: failures are logged and reported as None, never raised."""
+
+    def family_name(self, numero_socio: str) -> str:
+        """The family's display name - the titular's, else the lowest
+        id_socio's (PLAN.md 2.17) - resolved from the current Socio rows
+        through socio_labels, never stored with the balance."""
+        return socio_labels.display_name(numero_socio)
+
+    def family_ledger_page(
+        self,
+        numero_socio: str,
+        after: Optional[str] = None,
+        page_size: int = FAMILY_LEDGER_PAGE_SIZE,
+    ) -> Tuple[List[tuple], Optional[str]]:
+        """One page of a family's movements, most recent first, each with
+        the running balance after it (the "Saldo" column). Returns
+        (rows, next_token) - keyset paging with the same "<fecha>|<id>"
+        tokens as TransactionsService.list_transactions_page.
+
+        The balance is a SUM() OVER (ORDER BY fecha, id_transaccion) window
+        in SQLite, over the whole family history, then paged from the
+        outside, so every row's balance is right whichever page it's on;
+        ix_transacciones_socio_fecha_id feeds the window already in order,
+        no sort. Movements sum in date order here, while SaldoSocios chains
+        by período, so the two agree on the final balance but a movement
+        dated outside its período sits where its fecha puts it.
+        """
+        # Imported here: features/transactions/service.py imports this module.
+        from features.transactions.service import _decode_cursor, _encode_cursor
+
+        try:
+            efecto = case(
+                *[(Transaccion.tipo == tipo, Transaccion.monto * sign) for tipo, (_column, sign) in _TIPO_EFFECTS.items()],
+                else_=0,
+            )
+            historial = (
+                select(
+                    Transaccion.id_transaccion,
+                    Transaccion.fecha,
+                    Transaccion.tipo,
+                    Transaccion.monto,
+                    type_coerce(
+                        func.round(
+                            func.sum(efecto).over(
+                                order_by=(Transaccion.fecha, Transaccion.id_transaccion), rows=(None, 0)
+                            ),
+                            2,
+                        ),
+                        Numeric(12, 2),
+                    ).label("saldo"),
+                    Transaccion.id_metodo,
+                    Transaccion.id_periodo,
+                    Transaccion.referencia,
+                )
+                .where(Transaccion.numero_socio == numero_socio)
+                .subquery()
+            )
+            query = select(historial).order_by(historial.c.fecha.desc(), historial.c.id_transaccion.desc())
+            if after:
+                fecha, last_id = _decode_cursor(after)
+                # Same NULL-fecha-last rule as the Transacciones list.
+                if fecha is None:
+                    query = query.where(historial.c.fecha.is_(None), historial.c.id_transaccion < last_id)
+                else:
+                    query = query.where(
+                        or_(
+                            historial.c.fecha < fecha,
+                            and_(historial.c.fecha == fecha, historial.c.id_transaccion < last_id),
+                            historial.c.fecha.is_(None),
+                        )
+                    )
+            with get_session() as session:
+                # One extra row tells us whether another page exists.
+                filas = session.execute(query.limit(page_size + 1)).all()
+            has_more = len(filas) > page_size
+            filas = filas[:page_size]
+
+            metodo_names = reference_cache.metodo_names()
+            periodo_names = reference_cache.periodo_names()
+            rows = [
+                (
+                    f.id_transaccion,
+                    f.fecha,
+                    f.tipo,
+                    f.monto,
+                    f.saldo,
+                    metodo_names.get(f.id_metodo, ""),
+                    periodo_names.get(f.id_periodo, ""),
+                    f.referencia or "",
+                )
+                for f in filas
+            ]
+            next_token = _encode_cursor(filas[-1].fecha, filas[-1].id_transaccion) if has_more else None
+            return rows, next_token
+        except Exception as exc:
+            logger.exception("SaldosService.family_ledger_page: failed - %s", exc)
+            return [], None
+
+    def rebuild_saldos(
+        self,
+        progress: Optional[Callable[[int, int], None]] = None,
+        include_closed: bool = False,
+    ) -> Optional[int]:
+        """Run the rebuild and record it in the audit log. Returns the
+        number of families rebuilt, or None on failure."""
+        try:
+            total = rebuild_saldos(progress, include_closed=include_closed)
+            with get_session() as session:
+                record_log(
+                    session,
+                    id_socio=None,
+                    accion="recalcular",
+                    tabla_afectada="saldos_socios",
+                    id_registro_afectado=None,
+                    descripcion_cambio=(
+                        f"Recálculo {'completo' if include_closed else 'de períodos abiertos'} de saldos "
+                        f"desde transacciones ({total} familias)"
+                    ),
+                )
+            logger.info("SaldosService.rebuild_saldos: rebuilt %d families", total)
+            return total
+        except Exception as exc:
+            logger.exception("SaldosService.rebuild_saldos: failed - %s", exc)
+            return None
+
+
+if __name__ == "__main__":
+    import sys
+
+    # --todo also recomputes closed períodos.
+    rebuild_saldos(include_closed="--todo" in sys.argv[1:])
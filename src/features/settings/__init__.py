@@ -5,13 +5,25 @@ subpackage (view.py plus toolbar.py/dialog.py/service.py where relevant),
 keeping each section's files grouped together instead of flat-named.
 """
 
-from .menu_view import SettingsView, show_settings_view
-from .metodos_pago.view import MetodosPagoView, show_metodos_pago_view
-from .metodos_pago.toolbar import MetodosPagoToolBar
-from .reglas_cobro.view import ReglasCobroView, show_reglas_cobro_view
-from .reglas_cobro.toolbar import ReglasCobroToolBar
-from .reset.view import ResetView, show_reset_view
-from .audit_log.view import AuditLogView, show_audit_log_view
+from common.lazy_view import lazy_exports
+
+# Resolved on first access (common/lazy_view.py), so opening one section
+# - or importing one section's service - doesn't load the other three.
+_EXPORTS = {
+    "SettingsView": ".menu_view",
+    "show_settings_view": ".menu_view",
+    "MetodosPagoView": ".metodos_pago.view",
+    "show_metodos_pago_view": ".metodos_pago.view",
+    "MetodosPagoToolBar": ".metodos_pago.toolbar",
+    "ReglasCobroView": ".reglas_cobro.view",
+    "show_reglas_cobro_view": ".reglas_cobro.view",
+    "ReglasCobroToolBar": ".reglas_cobro.toolbar",
+    "ResetView": ".reset.view",
+    "show_reset_view": ".reset.view",
+    "AuditLogView": ".audit_log.view",
+    "show_audit_log_view": ".audit_log.view",
+}
+__getattr__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "SettingsView",
@@ -10,18 +10,16 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
 
+from sqlalchemy import func, or_, select
+
 from database.models import Log, Socio
 from database.session import get_session
-from utils.text import normalize_for_match
+from utils.text import like_contains, normalize_for_match
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 _LOG_COLUMNS = ("ID", "Fecha y hora", "Socio", "Acción", "Tabla", "Registro", "Descripción")
-# Columns (by index into the row tuples built in list_logs) matched against
-# the search text: Socio, Acción, Descripción - not Tabla/Registro, which
-# have their own dedicated filter/id semantics.
-_SEARCH_COLS = (2, 3, 6)
 
 
 class AuditLogService:
@@ -38,22 +36,39 @@ class AuditLogService:
             logger.exception("AuditLogService.list_tablas_afectadas: failed - %s", exc)
             return []
 
-    def list_logs(self, text: str = "", tabla_afectada: Optional[str] = None, model: Any = None) -> int:
-        """Query logs (optionally filtered) and populate `model`.
+    def list_log_rows(self, text: str = "", tabla_afectada: Optional[str] = None) -> List[tuple]:
+        """Return matching logs as plain tuples in `_LOG_COLUMNS` order.
 
         Filters: `text` matches socio/acción/descripción accent/case-
-        insensitively; `tabla_afectada` is an exact match, None meaning
-        "any". Ordered most-recent-first, matching a timeline/audit-trail
-        reading order.
+        insensitively - not Tabla/Registro, which have their own dedicated
+        filter/id semantics; `tabla_afectada` is an exact match, None
+        meaning "any". Ordered most-recent-first, matching a timeline/
+        audit-trail reading order.
+
+        The text filter runs in SQL against the persisted `*_norm` columns
+        (database/normalized_columns.py), so nothing is normalized per row
+        here. acción values are lowercase ASCII keys, so lower() suffices.
+        Touches no Qt object, so the viewer runs it off the GUI thread
+        (common/query_runner.py). Returns [] on failure.
         """
-        if model is None:
-            logger.warning("AuditLogService.list_logs: no model provided")
-            return 0
         try:
             with get_session() as session:
                 query = session.query(Log).order_by(Log.fecha_hora.desc(), Log.id_log.desc())
                 if tabla_afectada:
                     query = query.filter(Log.tabla_afectada == tabla_afectada)
+                needle = normalize_for_match(text) if text else ""
+                if needle:
+                    pattern = like_contains(needle)
+                    socios = select(Socio.id_socio).where(
+                        (Socio.nombre_norm + " " + Socio.apellidos_norm).like(pattern, escape="\\")
+                    )
+                    query = query.filter(
+                        or_(
+                            Log.descripcion_norm.like(pattern, escape="\\"),
+                            func.lower(Log.accion).like(pattern, escape="\\"),
+                            Log.id_socio.in_(socios),
+                        )
+                    )
                 logs = query.all()
 
                 socio_ids = {l.id_socio for l in logs if l.id_socio}
@@ -76,32 +91,18 @@ class AuditLogService:
                             l.descripcion_cambio or "",
                         )
                     )
-
-            needle = normalize_for_match(text) if text else ""
-            if needle:
-                rows = [
-                    r for r in rows
-                    if any(needle in normalize_for_match(r[i]) for i in _SEARCH_COLS)
-                ]
-
-            self._populate_model(model, list(_LOG_COLUMNS), rows)
-            logger.info("AuditLogService.list_logs: %d rows (tabla_afectada=%s)", len(rows), tabla_afectada)
-            return len(rows)
+            logger.info("AuditLogService.list_log_rows: %d rows (tabla_afectada=%s)", len(rows), tabla_afectada)
+            return rows
         except Exception as exc:
-            logger.exception("AuditLogService.list_logs: failed - %s", exc)
-            return 0
+            logger.exception("AuditLogService.list_log_rows: failed - %s", exc)
+            return []
 
-    @staticmethod
-    def _populate_model(model: Any, keys: List[str], rows: List[tuple]) -> None:
-        """Rebuild `model` in place from `keys` (headers) and `rows`."""
-        from PySide6.QtGui import QStandardItem
-
-        model.removeRows(0, model.rowCount())
-        model.setColumnCount(len(keys))
-        model.setRowCount(0)
-        model.setHorizontalHeaderLabels([str(k) for k in keys])
-        for row in rows:
-            items = [QStandardItem("") if v is None else QStandardItem(str(v)) for v in row]
-            for item in items:
-                item.setEditable(False)
-            model.appendRow(items)
+    def list_logs(self, text: str = "", tabla_afectada: Optional[str] = None, model: Any = None) -> int:
+        """Query logs (see list_log_rows) and populate `model`. Returns the
+        number of rows."""
+        if model is None:
+            logger.warning("AuditLogService.list_logs: no model provided")
+            return 0
+        rows = self.list_log_rows(text, tabla_afectada)
+        model.set_rows(_LOG_COLUMNS, rows)
+        return len(rows)
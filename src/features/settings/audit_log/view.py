@@ -22,10 +22,11 @@ from PySide6.QtWidgets import (
     QHeaderView,
     QAbstractItemView,
 )
-from PySide6.QtGui import QStandardItemModel
 from PySide6.QtCore import Qt, QEvent, QTimer
 
-from .service import AuditLogService
+from .service import _LOG_COLUMNS, AuditLogService
+from common.query_runner import QueryRunner
+from common.table_model import RowTableModel
 from features.members.column_fill import ensure_columns_fill as _ensure_columns_fill
 from features.members.table_sort import TableSortMixin
 from features.members.table_selection import capture_selected_id, restore_selected_id
@@ -43,6 +44,8 @@ class AuditLogView(QWidget, TableSortMixin):
         self.setObjectName("settingsMenu")
         self.main_window = parent
         self._service = AuditLogService()
+        # Runs the log query off the GUI thread (common/query_runner.py).
+        self._query_runner = QueryRunner(self)
 
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(8, 8, 8, 8)
@@ -115,7 +118,7 @@ class AuditLogView(QWidget, TableSortMixin):
         self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.table.setAlternatingRowColors(True)
 
-        self.model = QStandardItemModel(0, 7, self)
+        self.model = RowTableModel(parent=self)
         self.table.setModel(self.model)
 
         header = self.table.horizontalHeader()
@@ -200,8 +203,16 @@ class AuditLogView(QWidget, TableSortMixin):
         tabla = self.tabla_filter.currentData()
 
         selected_id = capture_selected_id(self.table, self.model)
-        added = self._service.list_logs(text, tabla_afectada=tabla, model=self.model)
-        logger.info("AuditLogView.on_search: %d rows (tabla_afectada=%s)", added, tabla)
+        self._query_runner.submit(
+            self._service.list_log_rows,
+            text,
+            tabla,
+            on_result=lambda rows: self._on_logs_loaded(rows, tabla, selected_id),
+        )
+
+    def _on_logs_loaded(self, rows: list, tabla: Optional[str], selected_id: Optional[str]) -> None:
+        self.model.set_rows(_LOG_COLUMNS, rows)
+        logger.info("AuditLogView.on_search: %d rows (tabla_afectada=%s)", len(rows), tabla)
         restore_selected_id(self.table, self.model, selected_id)
 
         try:
@@ -21,18 +21,25 @@ from PySide6.QtWidgets import (
     QLabel,
     QPushButton,
     QStyle,
+    QMessageBox,
+    QProgressDialog,
+    QApplication,
 )
 from PySide6.QtCore import Qt
 
-from .metodos_pago.view import show_metodos_pago_view
-from .reglas_cobro.view import show_reglas_cobro_view
-from .reset.view import show_reset_view
-from .audit_log.view import show_audit_log_view
+from common.lazy_view import lazy_view
+from features.saldos.service import SaldosService
 from ui.styles import SETTINGS_MENU_STYLESHEET
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Each section is imported when first opened - see common/lazy_view.py.
+show_metodos_pago_view = lazy_view("features.settings.metodos_pago.view", "show_metodos_pago_view")
+show_reglas_cobro_view = lazy_view("features.settings.reglas_cobro.view", "show_reglas_cobro_view")
+show_reset_view = lazy_view("features.settings.reset.view", "show_reset_view")
+show_audit_log_view = lazy_view("features.settings.audit_log.view", "show_audit_log_view")
+
 
 class SettingsView(QWidget):
     def __init__(self, parent: Optional[QWidget] = None) -> None:
@@ -75,6 +82,7 @@ class SettingsView(QWidget):
             ("💳 Métodos de pago", self.on_open_metodos_pago),
             ("📋 Reglas de cobro", self.on_open_reglas_cobro),
             ("🗂️ Registro de auditoría", self.on_open_audit_log),
+            ("🧮 Recalcular saldos", self.on_rebuild_saldos),
             ("🗑️ Restablecer base de datos", self.on_open_reset),
         ]
         columns = 2
@@ -110,6 +118,41 @@ class SettingsView(QWidget):
         if self.main_window is not None:
             show_audit_log_view(self.main_window)
 
+    def on_rebuild_saldos(self) -> None:
+        """Recompute the SaldoSocios rows of open períodos from
+        transacciones (see features/saldos/service.py's rebuild_saldos;
+        closed períodos are frozen and kept). Not a screen - just a
+        confirmation and a modal progress dialog over the hub."""
+        reply = QMessageBox.question(
+            self,
+            "Recalcular saldos",
+            "Se recalcularán los saldos de los períodos abiertos a partir de las transacciones "
+            "registradas (los períodos cerrados se conservan).\n"
+            "Puede tardar varios minutos en bases de datos grandes. ¿Continuar?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.No,
+        )
+        if reply != QMessageBox.StandardButton.Yes:
+            return
+
+        dialog = QProgressDialog("Recalculando saldos...", None, 0, 0, self)
+        dialog.setWindowTitle("Recalcular saldos")
+        dialog.setWindowModality(Qt.WindowModality.WindowModal)
+        dialog.setMinimumDuration(0)
+        dialog.show()
+
+        def on_progress(done: int, total: int) -> None:
+            dialog.setMaximum(total)
+            dialog.setValue(done)
+            QApplication.processEvents()
+
+        total = SaldosService().rebuild_saldos(progress=on_progress)
+        dialog.close()
+        if total is None:
+            QMessageBox.critical(self, "Error", "No se pudieron recalcular los saldos. Consulte el registro.")
+        else:
+            QMessageBox.information(self, "Recalcular saldos", f"Saldos recalculados para {total} familias.")
+
 
 def show_settings_view(main_window) -> None:
     """Ensure a SettingsView exists in the application's central stack and
@@ -16,6 +16,7 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
 
+from database import reference_cache
 from database.audit import record_log
 from database.models import MetodoPago
 from database.seed_db import METODOS_PAGO_FIJOS
@@ -32,17 +33,8 @@ class MetodosPagoService:
     def list_metodos_pago(self) -> List[Dict[str, Any]]:
         """Return every payment method (fixed and custom, any estado)."""
         try:
-            with get_session() as session:
-                rows = session.query(MetodoPago).order_by(MetodoPago.id_metodo).all()
-                return [
-                    {
-                        "id_metodo": row.id_metodo,
-                        "nombre": row.nombre,
-                        "estado": row.estado,
-                        "fijo": self.is_fixed(row.nombre),
-                    }
-                    for row in rows
-                ]
+            rows = sorted(reference_cache.metodos_pago(), key=lambda m: m["id_metodo"])
+            return [dict(row, fijo=self.is_fixed(row["nombre"])) for row in rows]
         except Exception as exc:
             logger.exception("MetodosPagoService.list_metodos_pago: failed - %s", exc)
             return []
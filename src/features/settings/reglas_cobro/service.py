@@ -14,6 +14,7 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
 
+from database import reference_cache
 from database.audit import record_log
 from database.models import ReglaCobro
 from database.session import get_session
@@ -26,20 +27,7 @@ class ReglasCobroService:
     def list_reglas_cobro(self) -> List[Dict[str, Any]]:
         """Return every billing rule (any estado)."""
         try:
-            with get_session() as session:
-                rows = session.query(ReglaCobro).order_by(ReglaCobro.id_regla).all()
-                return [
-                    {
-                        "id_regla": row.id_regla,
-                        "descripcion": row.descripcion,
-                        "cuota_mensual": row.cuota_mensual,
-                        "plazo_pago": row.plazo_pago,
-                        "penalizacion": row.penalizacion,
-                        "descuento": row.descuento,
-                        "estado": row.estado,
-                    }
-                    for row in rows
-                ]
+            return reference_cache.reglas_cobro()
         except Exception as exc:
             logger.exception("ReglasCobroService.list_reglas_cobro: failed - %s", exc)
             return []
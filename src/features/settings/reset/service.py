@@ -19,8 +19,9 @@ existing engine, which sidesteps file-locking/WAL concerns entirely.
 
 from __future__ import annotations
 
+from database import reference_cache, saldo_changes, socio_labels
 from database.audit import record_log
-from database.models import Base, Periodo, SaldoSocios, Transaccion
+from database.models import Base, Deudor, Periodo, SaldoSocios, Transaccion
 from database.seed_db import seed_all
 from database.session import get_session
 from utils.logger import get_logger
@@ -44,6 +45,11 @@ class ResetService:
 
             Base.metadata.drop_all(bind=engine)
             Base.metadata.create_all(bind=engine)
+            # drop_all/create_all bypass the ORM, so the reference cache's
+            # and socio_labels' Session hooks never see them.
+            reference_cache.invalidate()
+            saldo_changes.invalidate_all()
+            socio_labels.invalidate_names()
             seed_all()
             with get_session() as session:
                 record_log(
@@ -74,7 +80,9 @@ class ResetService:
             with get_session() as session:
                 session.query(Transaccion).delete()
                 session.query(SaldoSocios).delete()
+                session.query(Deudor).delete()
                 session.query(Periodo).delete()
+                saldo_changes.note_touched(session, None)
                 record_log(
                     session,
                     id_socio=None,
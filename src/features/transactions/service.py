@@ -8,17 +8,22 @@ own persistence logic.
 
 from __future__ import annotations
 
-import calendar
 import datetime
+import json
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from sqlalchemy import Float, String, and_, exists, func, insert, or_, select, tuple_, type_coerce
 from sqlalchemy.orm import Session
 
 from database.audit import record_log
-from database.models import MetodoPago, Periodo, Socio, Transaccion
+from database import reference_cache, socio_labels
+from database.fingerprints import transaccion_fingerprint
+from database.models import EtiquetaSocio, MetodoPago, Periodo, SaldoSocios, Socio, Transaccion
 from database.session import get_session
-from utils.text import normalize_for_match
+from features.periodos.service import PERIODO_CERRADO, fecha_fin_mensual
+from features.saldos.service import apply_transaction, apply_transactions
+from utils.text import like_contains, normalize_for_match
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -29,14 +34,108 @@ TIPOS_TRANSACCION = ("Cargo", "Pago", "Reembolso", "Devolución")
 # display order.
 _TRANSACCION_COLUMNS = ("ID", "Fecha", "Socio", "Tipo", "Monto", "Método", "Período", "Referencia")
 
+# Rows per list_transactions_page() call - one screenful plus scroll room,
+# so opening the Transacciones screen costs one page, not the ledger.
+TRANSACTIONS_PAGE_SIZE = 200
 
-def _add_months(fecha: datetime.date, months: int) -> datetime.date:
-    """Add `months` calendar months to `fecha`, clamping the day if needed."""
-    month_index = fecha.month - 1 + months
-    year = fecha.year + month_index // 12
-    month = month_index % 12 + 1
-    day = min(fecha.day, calendar.monthrange(year, month)[1])
-    return datetime.date(year, month, day)
+
+# Items per IN (...) in add_transactions' set-based checks - well under
+# SQLite's bound-parameter limit.
+_BATCH_IN_CHUNK = 500
+
+# referencia generate_cuotas stamps on the Cargos it creates - also how a
+# rerun recognizes a family already charged for that período.
+CUOTA_REFERENCIA = "Cuota mensual"
+
+# referencia prefix of the contra-entries correct_transaction posts,
+# followed by the corrected movement's id.
+CORRECCION_REFERENCIA = "Corrección de #"
+
+_DUPLICATE_ERROR = (
+    "Ya existe una transacción idéntica registrada (mismo socio, tipo, "
+    "monto, período, método y fecha)."
+)
+
+
+def _refund_error(numero_socio: Optional[str], monto: Any, disponible: Decimal) -> str:
+    return (
+        f"No se puede reembolsar {monto}€: el socio {numero_socio} solo tiene "
+        f"{disponible}€ disponibles de pagos en este período."
+    )
+
+
+def _periodos_cerrados() -> Dict[int, str]:
+    """id_periodo -> nombre of every closed período, from the reference
+    cache (no query)."""
+    return {p["id_periodo"]: p["nombre"] for p in reference_cache.periodos() if p["estado"] == PERIODO_CERRADO}
+
+
+def _periodo_cerrado_error(nombre: str) -> str:
+    return f"El período '{nombre}' está cerrado; no admite movimientos nuevos."
+
+
+def _fingerprint_of(data: Dict[str, Any]) -> str:
+    """transaccion_fingerprint() of a TransactionDialog.get_data() dict; a
+    missing fecha counts as today, the default the row would get."""
+    return transaccion_fingerprint(
+        data.get("numero_socio"),
+        data.get("tipo"),
+        data.get("monto"),
+        data.get("id_periodo"),
+        data.get("id_metodo"),
+        data.get("fecha") or datetime.date.today(),
+    )
+
+
+def _encode_cursor(fecha: Optional[datetime.date], id_transaccion: int) -> str:
+    """Continuation token for the row a page ended on: "<fecha>|<id>",
+    with an empty fecha for a NULL one."""
+    return f"{fecha.isoformat() if fecha else ''}|{id_transaccion}"
+
+
+def _decode_cursor(token: str) -> Tuple[Optional[datetime.date], int]:
+    fecha, _, id_transaccion = token.partition("|")
+    return (datetime.date.fromisoformat(fecha) if fecha else None), int(id_transaccion)
+
+
+def _sort_key(sort_column: str):
+    """SQL sort key for a header-click sort on `sort_column` (a
+    _TRANSACCION_COLUMNS header), never NULL so it can be keyset-paged.
+
+    Matches TableSortMixin._make_sort_key on the displayed cells: text is
+    compared accent/case-folded where it can be (the socio label through
+    etiquetas_socio's etiqueta_norm), and fecha as its ISO text, with a
+    missing value first. Período sorts by its fecha_inicio - its name
+    ("Enero 2026") would sort alphabetically, not by month.
+    """
+    if sort_column == "ID":
+        return Transaccion.id_transaccion
+    if sort_column == "Fecha":
+        return func.coalesce(type_coerce(Transaccion.fecha, String), "")
+    if sort_column == "Socio":
+        etiqueta = (
+            select(EtiquetaSocio.etiqueta_norm)
+            .where(EtiquetaSocio.numero_socio == Transaccion.numero_socio)
+            .scalar_subquery()
+        )
+        return func.coalesce(etiqueta, Transaccion.numero_socio, "")
+    if sort_column == "Tipo":
+        return func.lower(func.coalesce(Transaccion.tipo, ""))
+    if sort_column == "Monto":
+        return func.coalesce(type_coerce(Transaccion.monto, Float), 0.0, type_=Float)
+    if sort_column == "Método":
+        nombre = select(MetodoPago.nombre).where(MetodoPago.id_metodo == Transaccion.id_metodo).scalar_subquery()
+        return func.lower(func.coalesce(nombre, ""))
+    if sort_column == "Período":
+        inicio = (
+            select(type_coerce(Periodo.fecha_inicio, String))
+            .where(Periodo.id_periodo == Transaccion.id_periodo)
+            .scalar_subquery()
+        )
+        return func.coalesce(inicio, "")
+    if sort_column == "Referencia":
+        return func.lower(func.coalesce(Transaccion.referencia, ""))
+    raise ValueError(f"unknown sort column: {sort_column!r}")
 
 
 class TransactionsService:
@@ -57,7 +156,7 @@ class TransactionsService:
                 rows = (
                     session.query(Socio)
                     .filter(Socio.estado == "activo")
-                    .order_by(Socio.apellidos, Socio.nombre)
+                    .order_by(Socio.apellidos_norm, Socio.nombre_norm)
                     .all()
                 )
                 return [
@@ -97,14 +196,11 @@ class TransactionsService:
     def list_metodos_pago_activos(self) -> List[Dict[str, Any]]:
         """Return active payment methods for the dialog's método dropdown."""
         try:
-            with get_session() as session:
-                rows = (
-                    session.query(MetodoPago)
-                    .filter(MetodoPago.estado == "activo")
-                    .order_by(MetodoPago.nombre)
-                    .all()
-                )
-                return [{"id_metodo": m.id_metodo, "nombre": m.nombre} for m in rows]
+            return [
+                {"id_metodo": m["id_metodo"], "nombre": m["nombre"]}
+                for m in reference_cache.metodos_pago()
+                if m["estado"] == "activo"
+            ]
         except Exception as exc:
             logger.exception("TransactionsService.list_metodos_pago_activos: failed - %s", exc)
             return []
@@ -112,18 +208,7 @@ class TransactionsService:
     def list_periodos(self) -> List[Dict[str, Any]]:
         """Return every período, most recently started first."""
         try:
-            with get_session() as session:
-                rows = session.query(Periodo).order_by(Periodo.fecha_inicio.desc()).all()
-                return [
-                    {
-                        "id_periodo": p.id_periodo,
-                        "nombre": p.nombre,
-                        "estado": p.estado,
-                        "fecha_inicio": p.fecha_inicio,
-                        "fecha_fin": p.fecha_fin,
-                    }
-                    for p in rows
-                ]
+            return reference_cache.periodos()
         except Exception as exc:
             logger.exception("TransactionsService.list_periodos: failed - %s", exc)
             return []
@@ -138,95 +223,167 @@ class TransactionsService:
     ) -> int:
         """Query transacciones (optionally filtered) and populate `model`.
 
-        Filters: `text` matches the socio column (numero_socio or the
-        representative name - see below) accent/case-insensitively; `tipo`
-        and `id_periodo` are exact matches, either None meaning "any".
-
-        Deliberately does NOT join Transaccion to Socio on numero_socio for
-        the display name: numero_socio is a shared, non-unique family
-        identifier (see models.py's note), so a join would silently
-        duplicate a transaction row once per family member sharing that
-        numero_socio. Instead, a numero_socio -> representative display
-        name map is built as a separate query and used only for display/
-        search text, never joined into the primary result set.
+        Loads every matching row (or the first `limit`) in one go - the
+        Transacciones screen pages through list_transactions_page()
+        instead; this stays for callers that want the whole result.
         """
         if model is None:
             logger.warning("TransactionsService.list_transactions: no model provided")
             return 0
         try:
             with get_session() as session:
-                query = session.query(Transaccion).order_by(
-                    Transaccion.fecha.desc(), Transaccion.id_transaccion.desc()
-                )
-                if tipo:
-                    query = query.filter(Transaccion.tipo == tipo)
-                if id_periodo:
-                    query = query.filter(Transaccion.id_periodo == id_periodo)
-                transacciones = query.all()
-
-                numeros = {t.numero_socio for t in transacciones if t.numero_socio}
-                socio_display: Dict[str, str] = {}
-                if numeros:
-                    # Order titulares first (PLAN.md 2.17) so setdefault below
-                    # locks in the titular's name per numero_socio when one
-                    # exists, falling back to the first-by-id member of
-                    # groups that still have no titular assigned.
-                    socios = (
-                        session.query(Socio)
-                        .filter(Socio.numero_socio.in_(numeros))
-                        .order_by(Socio.es_titular.desc(), Socio.id_socio)
-                        .all()
-                    )
-                    for s in socios:
-                        socio_display.setdefault(s.numero_socio, f"{s.nombre} {s.apellidos}")
-
-                metodo_names = {m.id_metodo: m.nombre for m in session.query(MetodoPago).all()}
-                periodo_names = {p.id_periodo: p.nombre for p in session.query(Periodo).all()}
-
-                rows = []
-                for t in transacciones:
-                    nombre = socio_display.get(t.numero_socio, "")
-                    socio_label = f"{t.numero_socio} · {nombre}" if nombre else str(t.numero_socio)
-                    rows.append(
-                        (
-                            t.id_transaccion,
-                            t.fecha,
-                            socio_label,
-                            t.tipo,
-                            t.monto,
-                            metodo_names.get(t.id_metodo, ""),
-                            periodo_names.get(t.id_periodo, ""),
-                            t.referencia or "",
-                        )
-                    )
-
-            needle = normalize_for_match(text) if text else ""
-            if needle:
-                rows = [r for r in rows if needle in normalize_for_match(r[2])]
-            if limit:
-                rows = rows[:limit]
-
-            self._populate_model(model, list(_TRANSACCION_COLUMNS), rows)
+                rows, _ = self._fetch_page(session, text, tipo, id_periodo, None, limit)
+            model.set_rows(_TRANSACCION_COLUMNS, rows)
             logger.info("TransactionsService.list_transactions: %d rows (tipo=%s, id_periodo=%s)", len(rows), tipo, id_periodo)
             return len(rows)
         except Exception as exc:
             logger.exception("TransactionsService.list_transactions: failed - %s", exc)
             return 0
 
-    @staticmethod
-    def _populate_model(model: Any, keys: List[str], rows: List[tuple]) -> None:
-        """Rebuild `model` in place from `keys` (headers) and `rows`."""
-        from PySide6.QtGui import QStandardItem
-
-        model.removeRows(0, model.rowCount())
-        model.setColumnCount(len(keys))
-        model.setRowCount(0)
-        model.setHorizontalHeaderLabels([str(k) for k in keys])
-        for row in rows:
-            items = [QStandardItem("") if v is None else QStandardItem(str(v)) for v in row]
-            for item in items:
-                item.setEditable(False)
-            model.appendRow(items)
+    def list_transactions_page(
+        self,
+        text: str = "",
+        tipo: Optional[str] = None,
+        id_periodo: Optional[int] = None,
+        after: Optional[str] = None,
+        page_size: int = TRANSACTIONS_PAGE_SIZE,
+        sort_column: Optional[str] = None,
+        descending: bool = False,
+    ) -> Tuple[List[tuple], Optional[str]]:
+        """Return one page of display rows plus the token for the next one.
+
+        Keyset pagination on (fecha DESC, id_transaccion DESC): `after` is
+        the token returned with the previous page (None for the first),
+        and the next page starts strictly after that row - no OFFSET, so
+        page N costs the same as page 1 and rows added meanwhile don't
+        shift pages. The returned token is None once there are no more
+        rows. Same filters as list_transactions.
+
+        `sort_column` (a _TRANSACCION_COLUMNS header) and `descending` push
+        a header-click sort into the query instead - keyset-paged on
+        (_sort_key, id_transaccion), so later pages continue the sort over
+        the whole filtered result, not just the rows already loaded.
+        """
+        try:
+            with get_session() as session:
+                return self._fetch_page(session, text, tipo, id_periodo, after, page_size, sort_column, descending)
+        except Exception as exc:
+            logger.exception("TransactionsService.list_transactions_page: failed - %s", exc)
+            return [], None
+
+    def _fetch_page(
+        self,
+        session: Session,
+        text: str,
+        tipo: Optional[str],
+        id_periodo: Optional[int],
+        after: Optional[str],
+        page_size: Optional[int],
+        sort_column: Optional[str] = None,
+        descending: bool = False,
+    ) -> Tuple[List[tuple], Optional[str]]:
+        """Shared query behind list_transactions/list_transactions_page.
+
+        `text` matches the socio column (numero_socio or the representative
+        name - see below) accent/case-insensitively; `tipo` and
+        `id_periodo` are exact matches, either None meaning "any". A
+        `page_size` of None means no limit. With a `sort_column`, rows and
+        tokens follow that sort (see list_transactions_page).
+
+        Deliberately does NOT join Transaccion to Socio on numero_socio for
+        the display name: numero_socio is a shared, non-unique family
+        identifier (see models.py's note), so a join would silently
+        duplicate a transaction row once per family member sharing that
+        numero_socio. Names and the search both go through etiquetas_socio
+        instead (one row per family - database/socio_labels.py), so the
+        search is a SQL predicate evaluated before any row is loaded.
+        """
+        sort_key = _sort_key(sort_column) if sort_column else None
+        if sort_key is None:
+            query = session.query(Transaccion).order_by(
+                Transaccion.fecha.desc(), Transaccion.id_transaccion.desc()
+            )
+        elif descending:
+            query = session.query(Transaccion, sort_key).order_by(sort_key.desc(), Transaccion.id_transaccion.desc())
+        else:
+            query = session.query(Transaccion, sort_key).order_by(sort_key.asc(), Transaccion.id_transaccion.asc())
+        if tipo:
+            query = query.filter(Transaccion.tipo == tipo)
+        if id_periodo:
+            query = query.filter(Transaccion.id_periodo == id_periodo)
+
+        needle = normalize_for_match(text) if text else ""
+        if needle:
+            matching = select(EtiquetaSocio.numero_socio).where(
+                EtiquetaSocio.etiqueta_norm.like(like_contains(needle), escape="\\")
+            )
+            query = query.filter(Transaccion.numero_socio.in_(matching))
+
+        if after and sort_key is not None:
+            # Sorted tokens are a JSON [key, id] pair - see below.
+            last_key, last_id = json.loads(after)
+            if descending:
+                query = query.filter(
+                    or_(sort_key < last_key, and_(sort_key == last_key, Transaccion.id_transaccion < last_id))
+                )
+            else:
+                query = query.filter(
+                    or_(sort_key > last_key, and_(sort_key == last_key, Transaccion.id_transaccion > last_id))
+                )
+        elif after:
+            fecha, last_id = _decode_cursor(after)
+            # SQLite sorts NULL fecha last under DESC, so NULLs follow
+            # every dated row and are paged by id alone.
+            if fecha is None:
+                query = query.filter(Transaccion.fecha.is_(None), Transaccion.id_transaccion < last_id)
+            else:
+                query = query.filter(
+                    or_(
+                        Transaccion.fecha < fecha,
+                        and_(Transaccion.fecha == fecha, Transaccion.id_transaccion < last_id),
+                        Transaccion.fecha.is_(None),
+                    )
+                )
+        if page_size:
+            # One extra row tells us whether another page exists.
+            transacciones = query.limit(page_size + 1).all()
+            has_more = len(transacciones) > page_size
+            transacciones = transacciones[:page_size]
+        else:
+            transacciones = query.all()
+            has_more = False
+        last_key = None
+        if sort_key is not None:
+            last_key = transacciones[-1][1] if transacciones else None
+            transacciones = [t for t, _key in transacciones]
+
+        numeros = {t.numero_socio for t in transacciones if t.numero_socio}
+        socio_display = socio_labels.display_names(numeros)
+        metodo_names = reference_cache.metodo_names()
+        periodo_names = reference_cache.periodo_names()
+
+        rows = []
+        for t in transacciones:
+            nombre = socio_display.get(t.numero_socio, "")
+            socio_label = f"{t.numero_socio} · {nombre}" if nombre else str(t.numero_socio)
+            rows.append(
+                (
+                    t.id_transaccion,
+                    t.fecha,
+                    socio_label,
+                    t.tipo,
+                    t.monto,
+                    metodo_names.get(t.id_metodo, ""),
+                    periodo_names.get(t.id_periodo, ""),
+                    t.referencia or "",
+                )
+            )
+        next_token = None
+        if has_more and sort_key is not None:
+            next_token = json.dumps([last_key, transacciones[-1].id_transaccion])
+        elif has_more:
+            next_token = _encode_cursor(transacciones[-1].fecha, transacciones[-1].id_transaccion)
+        return rows, next_token
 
     def export_transactions(self, rows: Optional[List[List[str]]] = None, destination: Optional[str] = None) -> None:
         """Export plain rows to a destination (placeholder, same shape as
@@ -249,7 +406,7 @@ class TransactionsService:
             logger.warning("TransactionsService.create_periodo_rapido: nombre/fecha_inicio required")
             return None
         try:
-            fecha_fin = _add_months(fecha_inicio, 1) - datetime.timedelta(days=1)
+            fecha_fin = fecha_fin_mensual(fecha_inicio)
             with get_session() as session:
                 periodo = Periodo(
                     nombre=nombre,
@@ -274,64 +431,52 @@ class TransactionsService:
             logger.exception("TransactionsService.create_periodo_rapido: failed - %s", exc)
             return None
 
-    def _sum_by_tipo(self, session: Session, numero_socio: str, id_periodo: int, tipo: str) -> Decimal:
-        """Sum monto across every Transaccion of `tipo` for numero_socio+id_periodo."""
-        rows = (
-            session.query(Transaccion.monto)
-            .filter(
-                Transaccion.numero_socio == numero_socio,
-                Transaccion.id_periodo == id_periodo,
-                Transaccion.tipo == tipo,
-            )
-            .all()
-        )
-        return sum((row[0] for row in rows), Decimal("0"))
-
     def _validate_transaction(self, session: Session, data: Dict[str, Any]) -> Optional[str]:
         """Return an error message if `data` fails an integrity rule, else None.
 
-        Two rules (PLAN.md 2.4, decided):
+        Three rules (PLAN.md 2.4/2.6, decided):
+        - Nothing is registered into a closed período - it's a frozen
+          snapshot once features/periodos/service.py's rollover closes it.
         - A "reembolso" can't exceed what's actually available to refund:
-          sum of "pago" minus sum of already-refunded "reembolso", scoped to
-          the same numero_socio+id_periodo (mirrors SaldoSocios' per-período
-          scoping).
+          pagos minus already-refunded reembolsos, scoped to the same
+          numero_socio+id_periodo - read from that family's SaldoSocios
+          row, which apply_transaction keeps current, rather than summed.
+          Movements older than the balance engine get their rows from
+          init_db's migration 2 before any of this runs.
         - No exact-duplicate Transaccion (same numero_socio/tipo/monto/
           id_periodo/id_metodo/fecha) - catches accidental double-submission
           (e.g. double-clicking "Aceptar") without blocking legitimate
           similar-looking charges that differ in any of those fields.
+          Looked up by fingerprint (database/fingerprints.py).
+
+        The período's estado comes from the reference cache; the other two
+        lookups go out as one SELECT of indexed single-row reads, so the
+        cost doesn't grow with the ledger.
         """
         numero_socio = data.get("numero_socio")
         id_periodo = data.get("id_periodo")
         tipo = data.get("tipo")
         monto = data.get("monto")
 
+        cerrado = _periodos_cerrados().get(id_periodo)
+        if cerrado is not None:
+            return _periodo_cerrado_error(cerrado)
+
+        checks = [exists().where(Transaccion.fingerprint == _fingerprint_of(data))]
+        if tipo == "Reembolso":
+            saldo = (SaldoSocios.numero_socio == numero_socio, SaldoSocios.id_periodo == id_periodo)
+            checks.append(select(SaldoSocios.pagos).where(*saldo).scalar_subquery())
+            checks.append(select(SaldoSocios.reembolsos).where(*saldo).scalar_subquery())
+        duplicate, *totals = session.execute(select(*checks)).one()
+
         if tipo == "Reembolso":
-            pagos = self._sum_by_tipo(session, numero_socio, id_periodo, "Pago")
-            reembolsos = self._sum_by_tipo(session, numero_socio, id_periodo, "Reembolso")
+            pagos, reembolsos = (Decimal(total or 0) for total in totals)
             disponible = pagos - reembolsos
             if monto is None or monto > disponible:
-                return (
-                    f"No se puede reembolsar {monto}€: el socio {numero_socio} solo tiene "
-                    f"{disponible}€ disponibles de pagos en este período."
-                )
+                return _refund_error(numero_socio, monto, disponible)
 
-        duplicate = (
-            session.query(Transaccion)
-            .filter_by(
-                numero_socio=numero_socio,
-                tipo=tipo,
-                monto=monto,
-                id_periodo=id_periodo,
-                id_metodo=data.get("id_metodo"),
-                fecha=data.get("fecha"),
-            )
-            .first()
-        )
-        if duplicate is not None:
-            return (
-                "Ya existe una transacción idéntica registrada (mismo socio, tipo, "
-                "monto, período, método y fecha)."
-            )
+        if duplicate:
+            return _DUPLICATE_ERROR
 
         return None
 
@@ -362,6 +507,11 @@ class TransactionsService:
         used only to attribute the audit Log row. Transaccion itself FKs on
         numero_socio (the family), not id_socio - see models.py's note on
         why Log differs from Transaccion here.
+
+        The family's SaldoSocios row for id_periodo (and the saldo chain of
+        its later períodos) is updated in the same transaction - PLAN.md
+        2.5's "recalculate after every Transaccion" - see
+        features/saldos/service.py.
         """
         data = dict(data)
         id_socio_log = data.pop("id_socio_log", None)
@@ -376,6 +526,13 @@ class TransactionsService:
                 session.add(transaccion)
                 session.flush()
                 new_id = transaccion.id_transaccion
+                apply_transaction(
+                    session,
+                    numero_socio=transaccion.numero_socio,
+                    id_periodo=transaccion.id_periodo,
+                    tipo=transaccion.tipo,
+                    monto=transaccion.monto,
+                )
                 record_log(
                     session,
                     id_socio=id_socio_log,
@@ -397,3 +554,369 @@ class TransactionsService:
         except Exception as exc:
             logger.exception("TransactionsService.add_transaction: failed - %s", exc)
             return None
+
+    def _validate_batch(
+        self, session: Session, items: List[Dict[str, Any]], fingerprints: List[str]
+    ) -> List[Optional[str]]:
+        """_validate_transaction's rules for a whole batch, one error message
+        (or None) per item.
+
+        Set-based: the batch's fingerprints are looked up with IN queries
+        and the refund totals of every (numero_socio, id_periodo) it refunds
+        against are read from SaldoSocios the same way, a chunk of
+        _BATCH_IN_CHUNK per round trip. Items are then checked in order
+        against that state plus the batch's own accepted items, so an exact
+        repeat within the batch is rejected and a Pago earlier in the batch
+        can cover a later Reembolso. `fingerprints` are the items'
+        _fingerprint_of(), in the same order.
+        """
+        existing = set()
+        for start in range(0, len(fingerprints), _BATCH_IN_CHUNK):
+            chunk = fingerprints[start:start + _BATCH_IN_CHUNK]
+            existing.update(session.scalars(select(Transaccion.fingerprint).where(Transaccion.fingerprint.in_(chunk))))
+
+        refund_keys = list({
+            (data.get("numero_socio"), data.get("id_periodo"))
+            for data in items
+            if data.get("tipo") == "Reembolso"
+        })
+        disponible = {key: Decimal("0") for key in refund_keys}
+        for start in range(0, len(refund_keys), _BATCH_IN_CHUNK):
+            chunk = refund_keys[start:start + _BATCH_IN_CHUNK]
+            rows = session.execute(
+                select(SaldoSocios.numero_socio, SaldoSocios.id_periodo, SaldoSocios.pagos, SaldoSocios.reembolsos)
+                .where(tuple_(SaldoSocios.numero_socio, SaldoSocios.id_periodo).in_(chunk))
+            )
+            for numero_socio, id_periodo, pagos, reembolsos in rows:
+                disponible[(numero_socio, id_periodo)] = Decimal(pagos or 0) - Decimal(reembolsos or 0)
+
+        cerrados = _periodos_cerrados()
+        errors: List[Optional[str]] = []
+        accepted = set()
+        for data, fingerprint in zip(items, fingerprints):
+            numero_socio = data.get("numero_socio")
+            tipo = data.get("tipo")
+            monto = None if data.get("monto") is None else Decimal(str(data["monto"]))
+            key = (numero_socio, data.get("id_periodo"))
+            error = None
+            if not tipo or monto is None:
+                error = "Faltan el tipo o el monto del movimiento."
+            elif key[1] in cerrados:
+                error = _periodo_cerrado_error(cerrados[key[1]])
+            elif tipo == "Reembolso" and monto > disponible[key]:
+                error = _refund_error(numero_socio, monto, disponible[key])
+            elif fingerprint in existing:
+                error = _DUPLICATE_ERROR
+            elif fingerprint in accepted:
+                error = "El lote repite esta misma transacción (mismo socio, tipo, monto, período, método y fecha)."
+            errors.append(error)
+            if error is None:
+                accepted.add(fingerprint)
+                if key in disponible and tipo in ("Pago", "Reembolso"):
+                    disponible[key] += monto if tipo == "Pago" else -monto
+        return errors
+
+    def _insert_batch(
+        self, session: Session, items: List[Dict[str, Any]]
+    ) -> Tuple[List[Optional[str]], List[Dict[str, Any]], List[int]]:
+        """Validate `items` (_validate_batch), then write the valid ones and
+        their balance effect into `session` (not committed here). Returns
+        (error per item, the rows inserted, their new ids in the same order).
+
+        One executemany INSERT. Ids are assigned up front from
+        max(id_transaccion) - an INSERT ... RETURNING that has to keep
+        parameter order runs one statement per row on SQLite - and bulk
+        inserts skip mapper events, so the fecha default and the
+        fingerprint (database/fingerprints.py) are filled in here too.
+        """
+        fingerprints = [_fingerprint_of(data) for data in items]
+        errors = self._validate_batch(session, items, fingerprints)
+        today = datetime.date.today()
+        rows = [
+            {
+                "numero_socio": data.get("numero_socio"),
+                "id_periodo": data.get("id_periodo"),
+                "id_metodo": data.get("id_metodo"),
+                "tipo": data.get("tipo"),
+                "monto": data.get("monto"),
+                "fecha": data.get("fecha") or today,
+                "referencia": data.get("referencia"),
+                "fingerprint": fingerprint,
+            }
+            for data, fingerprint, error in zip(items, fingerprints, errors)
+            if error is None
+        ]
+        if not rows:
+            return errors, rows, []
+        last_id = session.scalar(select(func.max(Transaccion.id_transaccion))) or 0
+        new_ids = list(range(last_id + 1, last_id + 1 + len(rows)))
+        for new_id, row in zip(new_ids, rows):
+            row["id_transaccion"] = new_id
+        session.execute(insert(Transaccion.__table__), rows)
+        apply_transactions(session, ((r["numero_socio"], r["id_periodo"], r["tipo"], r["monto"]) for r in rows))
+        return errors, rows, new_ids
+
+    def add_transactions(self, items: List[Dict[str, Any]]) -> List[Tuple[Optional[int], Optional[str]]]:
+        """Persist many Transaccion rows in one database transaction, for
+        imports and other bulk entry (generate_cuotas shares its write path,
+        _insert_batch). Returns, per item and in order, (new id,
+        None) or (None, the reason it was rejected).
+
+        Each item has add_transaction's `data` keys (`id_socio_log` is
+        dropped - the batch gets one audit Log row, attributed to nobody).
+        Invalid items are rejected individually (_validate_batch) and the
+        rest are still written: one executemany INSERT, one
+        apply_transactions() balance update per family and período, one
+        summary Log row, one commit. On an unexpected failure nothing is
+        written and every item reports a generic error.
+        """
+        items = [{k: v for k, v in data.items() if k != "id_socio_log"} for data in items]
+        if not items:
+            return []
+        try:
+            with get_session() as session:
+                errors, rows, new_ids = self._insert_batch(session, items)
+                if rows:
+                    por_tipo: Dict[str, List[Decimal]] = {}
+                    for r in rows:
+                        por_tipo.setdefault(r["tipo"], []).append(Decimal(str(r["monto"])))
+                    resumen = ", ".join(
+                        f"{len(montos)} {tipo} ({sum(montos)}€)" for tipo, montos in por_tipo.items()
+                    )
+                    record_log(
+                        session,
+                        id_socio=None,
+                        accion="crear",
+                        tabla_afectada="transacciones",
+                        id_registro_afectado=None,
+                        descripcion_cambio=(
+                            f"Alta en lote de {len(new_ids)} movimiento(s), "
+                            f"ids {min(new_ids)}-{max(new_ids)}: {resumen}"
+                        ),
+                    )
+            ids = iter(new_ids)
+            results = [(None, error) if error else (next(ids), None) for error in errors]
+            logger.info(
+                "TransactionsService.add_transactions: created %d, rejected %d",
+                len(new_ids),
+                len(items) - len(new_ids),
+            )
+            return results
+        except Exception as exc:
+            logger.exception("TransactionsService.add_transactions: failed - %s", exc)
+            return [(None, "No se pudo registrar el lote; no se guardó ningún movimiento.")] * len(items)
+
+    def _regla_para_cuotas(self, id_regla: Optional[int]) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """The ReglaCobro a dues run charges: `id_regla` if given (it must be
+        activo), else the only active rule. Returns (regla, None) or
+        (None, error message)."""
+        activas = [r for r in reference_cache.reglas_cobro() if r["estado"] == "activo"]
+        if id_regla is not None:
+            activas = [r for r in activas if r["id_regla"] == id_regla]
+            if not activas:
+                return None, "La regla de cobro indicada no existe o está inactiva."
+        if not activas:
+            return None, "No hay ninguna regla de cobro activa."
+        if len(activas) > 1:
+            return None, "Hay varias reglas de cobro activas; indique cuál aplicar."
+        return activas[0], None
+
+    def generate_cuotas(self, id_periodo: int, id_regla: Optional[int] = None) -> Dict[str, Any]:
+        """Charge the monthly cuota for `id_periodo` to every active family
+        (PLAN.md 2.15b's monthly template sheets, now one action).
+
+        One Cargo per numero_socio whose titular is activo (PLAN.md 2.17:
+        families without a titular are skipped until one is assigned), dated
+        the período's fecha_inicio, with referencia CUOTA_REFERENCIA. The
+        amount is the rule's cuota_mensual minus its descuento, read as a
+        flat amount like the other currency fields (NULL - the default, per
+        PLAN.md's decision to build no discount logic - means none).
+
+        Idempotent per período: families that already have a
+        CUOTA_REFERENCIA Cargo in it are left alone, so a rerun only charges
+        families added since. The rows are built in one pass and written
+        through add_transactions' bulk path (_insert_batch), with one
+        summary Log row and one commit.
+
+        Returns {"creados", "omitidos", "monto", "error"}: `omitidos` counts
+        families skipped as already charged or rejected by validation;
+        `error` is None unless nothing could be attempted (no usable rule or
+        período, or an unexpected failure).
+        """
+        resultado: Dict[str, Any] = {"creados": 0, "omitidos": 0, "monto": None, "error": None}
+        regla, error = self._regla_para_cuotas(id_regla)
+        if error:
+            resultado["error"] = error
+            return resultado
+        monto = Decimal(regla["cuota_mensual"] or 0) - Decimal(regla["descuento"] or 0)
+        if monto <= 0:
+            resultado["error"] = f"La regla '{regla['descripcion']}' no tiene una cuota positiva que cobrar."
+            return resultado
+        resultado["monto"] = monto
+        try:
+            with get_session() as session:
+                periodo = session.get(Periodo, id_periodo)
+                if periodo is None:
+                    resultado["error"] = "El período indicado no existe."
+                    return resultado
+                familias = session.scalars(
+                    select(Socio.numero_socio)
+                    .where(Socio.estado == "activo", Socio.es_titular.is_(True))
+                    .distinct()
+                    .order_by(Socio.numero_socio)
+                ).all()
+                cobradas = set(
+                    session.scalars(
+                        select(Transaccion.numero_socio)
+                        .where(
+                            Transaccion.id_periodo == id_periodo,
+                            Transaccion.tipo == "Cargo",
+                            Transaccion.referencia == CUOTA_REFERENCIA,
+                        )
+                        .distinct()
+                    )
+                )
+                items = [
+                    {
+                        "numero_socio": numero_socio,
+                        "id_periodo": id_periodo,
+                        "id_metodo": None,
+                        "tipo": "Cargo",
+                        "monto": monto,
+                        "fecha": periodo.fecha_inicio,
+                        "referencia": CUOTA_REFERENCIA,
+                    }
+                    for numero_socio in familias
+                    if numero_socio not in cobradas
+                ]
+                _errors, _rows, new_ids = self._insert_batch(session, items)
+                resultado["creados"] = len(new_ids)
+                resultado["omitidos"] = len(familias) - len(new_ids)
+                if new_ids:
+                    record_log(
+                        session,
+                        id_socio=None,
+                        accion="crear",
+                        tabla_afectada="transacciones",
+                        id_registro_afectado=None,
+                        descripcion_cambio=(
+                            f"Generación de cuotas de '{periodo.nombre}': {len(new_ids)} cargo(s) de "
+                            f"{monto}€ (regla '{regla['descripcion']}'), ids {min(new_ids)}-{max(new_ids)}"
+                        ),
+                    )
+            logger.info(
+                "TransactionsService.generate_cuotas: periodo=%s creados=%d omitidos=%d",
+                id_periodo,
+                resultado["creados"],
+                resultado["omitidos"],
+            )
+            return resultado
+        except Exception as exc:
+            logger.exception("TransactionsService.generate_cuotas: failed - %s", exc)
+            return {"creados": 0, "omitidos": 0, "monto": monto, "error": "No se pudieron generar las cuotas."}
+
+    def correct_transaction(
+        self, id_transaccion: int, motivo: Optional[str] = None, id_socio_log: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Reverse movement `id_transaccion` with a contra-entry: same
+        family, tipo, período, método and fecha, negated monto, referencia
+        CORRECCION_REFERENCIA plus its id (and `motivo`, if given).
+
+        Transactions are append-only, so this is how a mistake in an older
+        período gets fixed. The contra-entry is dated into the original's
+        período even when that one is closed - a correction is the one
+        movement a frozen período accepts - and apply_transaction shifts
+        the family's later períodos by the delta with one ranged UPDATE,
+        no rebuild. A movement can be reversed once: a second contra-entry
+        would be an exact duplicate (same fingerprint) of the first.
+
+        Reversing a Pago keeps the refund rule (_validate_transaction)
+        intact: it's rejected while the período's pagos minus reembolsos,
+        from the family's SaldoSocios row, is less than the Pago - the
+        Reembolso that used it has to be corrected first.
+
+        Returns {"id_transaccion", "tocados", "error"}: the contra-entry's
+        id, the (numero_socio, id_periodo) SaldoSocios snapshots it changed
+        (also published through database/saldo_changes.py once committed,
+        and listed in the Log row), and an error message or None.
+        """
+        resultado: Dict[str, Any] = {"id_transaccion": None, "tocados": [], "error": None}
+        try:
+            with get_session() as session:
+                original = session.get(Transaccion, id_transaccion)
+                if original is None:
+                    resultado["error"] = f"No existe el movimiento #{id_transaccion}."
+                    return resultado
+                if original.monto is None or original.monto <= 0:
+                    resultado["error"] = f"El movimiento #{id_transaccion} ya es una corrección."
+                    return resultado
+
+                referencia = f"{CORRECCION_REFERENCIA}{id_transaccion}"
+                if motivo:
+                    referencia = f"{referencia}: {motivo}"
+                data = {
+                    "numero_socio": original.numero_socio,
+                    "id_periodo": original.id_periodo,
+                    "id_metodo": original.id_metodo,
+                    "tipo": original.tipo,
+                    "monto": -original.monto,
+                    "fecha": original.fecha,
+                    "referencia": referencia,
+                }
+                if session.execute(select(exists().where(Transaccion.fingerprint == _fingerprint_of(data)))).scalar():
+                    resultado["error"] = f"El movimiento #{id_transaccion} ya está corregido."
+                    return resultado
+                if original.tipo == "Pago":
+                    saldo = session.execute(
+                        select(SaldoSocios.pagos, SaldoSocios.reembolsos).where(
+                            SaldoSocios.numero_socio == original.numero_socio,
+                            SaldoSocios.id_periodo == original.id_periodo,
+                        )
+                    ).first()
+                    disponible = Decimal(0)
+                    if saldo is not None:
+                        disponible = Decimal(saldo.pagos or 0) - Decimal(saldo.reembolsos or 0)
+                    if disponible < original.monto:
+                        resultado["error"] = (
+                            f"No se puede corregir el pago #{id_transaccion}: solo quedan {disponible}€ sin "
+                            "reembolsar en este período. Corrija antes el reembolso."
+                        )
+                        return resultado
+
+                contra = Transaccion(**data)
+                session.add(contra)
+                session.flush()
+                tocados = apply_transaction(
+                    session,
+                    numero_socio=contra.numero_socio,
+                    id_periodo=contra.id_periodo,
+                    tipo=contra.tipo,
+                    monto=contra.monto,
+                )
+                nombres = reference_cache.periodo_names()
+                record_log(
+                    session,
+                    id_socio=id_socio_log,
+                    accion="corregir",
+                    tabla_afectada="transacciones",
+                    id_registro_afectado=contra.id_transaccion,
+                    descripcion_cambio=(
+                        f"Corrección de #{id_transaccion} ({original.tipo} de {original.monto}€, "
+                        f"numero_socio={original.numero_socio}): contra-movimiento de {contra.monto}€"
+                        + (f" - {motivo}" if motivo else "")
+                        + "; saldos actualizados en "
+                        + ", ".join(f"'{nombres.get(id_periodo, id_periodo)}'" for _numero, id_periodo in tocados)
+                    ),
+                )
+                resultado["id_transaccion"] = contra.id_transaccion
+                resultado["tocados"] = tocados
+            logger.info(
+                "TransactionsService.correct_transaction: reversed id=%s with id=%s, %d snapshot(s) touched",
+                id_transaccion,
+                resultado["id_transaccion"],
+                len(resultado["tocados"]),
+            )
+            return resultado
+        except Exception as exc:
+            logger.exception("TransactionsService.correct_transaction: failed - %s", exc)
+            return {"id_transaccion": None, "tocados": [], "error": "No se pudo registrar la corrección."}
@@ -1,32 +1,42 @@
 """Toolbar for the standalone Transacciones screen.
 
-Only Nuevo movimiento / Refrescar / Exportar (per UI_PROPOSAL.md's mockup)
-- no Editar/Eliminar: once persisted, a transaction is part of the audit
-trail. A correction is a new transaction (e.g. a reembolso), not an edit to
-history, same spirit as the soft-deactivation-only pattern used elsewhere
-in this app but stricter (no state to toggle back either).
+Nuevo movimiento / Refrescar / Exportar (per UI_PROPOSAL.md's mockup),
+plus Generar cuotas for the monthly dues run and Corregir - no
+Editar/Eliminar: once persisted, a transaction is part of the audit trail.
+A correction is a new transaction (Corregir posts the selected movement's
+contra-entry), not an edit to history, same spirit as the
+soft-deactivation-only pattern used elsewhere in this app but stricter (no
+state to toggle back either).
 """
 
 from __future__ import annotations
 
 from typing import Optional, TYPE_CHECKING
 
-from PySide6.QtWidgets import QToolBar, QStyle, QTableView, QMessageBox
+from PySide6.QtWidgets import QToolBar, QStyle, QTableView, QMessageBox, QInputDialog
 from PySide6.QtCore import QSize
-from PySide6.QtGui import QStandardItemModel
 
 if TYPE_CHECKING:
     from PySide6.QtWidgets import QWidget
 
 from .dialog import TransactionDialog
 from .service import TransactionsService
+from common.table_model import RowTableModel
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Column indices in the Transacciones model - TransactionsService's
+# _TRANSACCION_COLUMNS order.
+COL_ID = 0
+COL_SOCIO = 2
+COL_TIPO = 3
+COL_MONTO = 4
+COL_PERIODO = 6
+
 
 class TransactionsToolBar(QToolBar):
-    """Toolbar with Nuevo movimiento/Refrescar/Exportar for Transaccion."""
+    """Toolbar with Nuevo movimiento/Generar cuotas/Corregir/Refrescar/Exportar for Transaccion."""
 
     def __init__(self, parent: Optional["QWidget"] = None, service: Optional[TransactionsService] = None) -> None:
         super().__init__(parent)
@@ -34,7 +44,7 @@ class TransactionsToolBar(QToolBar):
         self.setMovable(False)
         self.setIconSize(QSize(18, 18))
         self.table: Optional[QTableView] = None
-        self.model: Optional[QStandardItemModel] = None
+        self.model: Optional[RowTableModel] = None
         self.service: TransactionsService = service or TransactionsService()
 
         self._setup_actions()
@@ -45,6 +55,16 @@ class TransactionsToolBar(QToolBar):
         act_new.setToolTip("Registrar un cargo, pago o reembolso")
         act_new.triggered.connect(self.on_add_transaction)
 
+        icon_cuotas = self.style().standardIcon(QStyle.SP_FileDialogListView)
+        act_cuotas = self.addAction(icon_cuotas, "Generar cuotas")
+        act_cuotas.setToolTip("Cargar la cuota mensual a todas las familias activas de un período")
+        act_cuotas.triggered.connect(self.on_generate_cuotas)
+
+        icon_correct = self.style().standardIcon(QStyle.SP_ArrowBack)
+        act_correct = self.addAction(icon_correct, "Corregir")
+        act_correct.setToolTip("Anular el movimiento seleccionado con un contra-movimiento")
+        act_correct.triggered.connect(self.on_correct_transaction)
+
         self.addSeparator()
 
         icon_refresh = self.style().standardIcon(QStyle.SP_BrowserReload)
@@ -57,7 +77,7 @@ class TransactionsToolBar(QToolBar):
         act_export.setToolTip("Exportar resultados")
         act_export.triggered.connect(self.on_export)
 
-    def set_table_references(self, table: QTableView, model: QStandardItemModel) -> None:
+    def set_table_references(self, table: QTableView, model: RowTableModel) -> None:
         self.table = table
         self.model = model
 
@@ -88,6 +108,62 @@ class TransactionsToolBar(QToolBar):
             return
         self._refresh_parent()
 
+    def on_generate_cuotas(self) -> None:
+        periodos = self.service.list_periodos()
+        if not periodos:
+            QMessageBox.information(self, "Generar cuotas", "No hay ningún período creado.")
+            return
+        nombres = [p["nombre"] for p in periodos]
+        nombre, ok = QInputDialog.getItem(self, "Generar cuotas", "Período:", nombres, 0, False)
+        if not ok:
+            return
+        id_periodo = periodos[nombres.index(nombre)]["id_periodo"]
+
+        confirm = QMessageBox.question(
+            self,
+            "Generar cuotas",
+            f"¿Cargar la cuota mensual de '{nombre}' a todas las familias activas que aún no la tengan?",
+        )
+        if confirm != QMessageBox.StandardButton.Yes:
+            return
+
+        resultado = self.service.generate_cuotas(id_periodo)
+        if resultado["error"]:
+            QMessageBox.warning(self, "Generar cuotas", resultado["error"])
+            return
+        QMessageBox.information(
+            self,
+            "Generar cuotas",
+            f"{resultado['creados']} cargo(s) de {resultado['monto']}€ generados; "
+            f"{resultado['omitidos']} familia(s) omitidas (ya tenían la cuota o no eran válidas).",
+        )
+        self._refresh_parent()
+
+    def on_correct_transaction(self) -> None:
+        if self.table is None or self.model is None:
+            return
+        rows = self.table.selectionModel().selectedRows()
+        if len(rows) != 1:
+            QMessageBox.information(self, "Corregir", "Seleccione un único movimiento para corregir.")
+            return
+        row = rows[0].row()
+        id_transaccion = int(self.model.text(row, COL_ID))
+        descripcion = (
+            f"#{id_transaccion} - {self.model.text(row, COL_TIPO)} de {self.model.text(row, COL_MONTO)}€ "
+            f"({self.model.text(row, COL_SOCIO)}, {self.model.text(row, COL_PERIODO)})"
+        )
+        motivo, ok = QInputDialog.getText(
+            self, "Corregir", f"Se registrará un contra-movimiento que anula {descripcion}.\n\nMotivo:"
+        )
+        if not ok:
+            return
+
+        resultado = self.service.correct_transaction(id_transaccion, motivo=motivo.strip() or None)
+        if resultado["error"]:
+            QMessageBox.warning(self, "Corregir", resultado["error"])
+            return
+        self._refresh_parent()
+
     def on_refresh(self) -> None:
         self._refresh_parent()
 
@@ -97,7 +173,6 @@ class TransactionsToolBar(QToolBar):
             for r in range(self.model.rowCount()):
                 row_vals = []
                 for c in range(self.model.columnCount()):
-                    item = self.model.item(r, c)
-                    row_vals.append(item.text() if item is not None else "")
+                    row_vals.append(self.model.text(r, c))
                 rows.append(row_vals)
         self.service.export_transactions(rows, destination=None)
@@ -30,13 +30,15 @@ from PySide6.QtWidgets import (
     QHeaderView,
     QAbstractItemView,
 )
-from PySide6.QtGui import QStandardItemModel
-from PySide6.QtCore import Qt, QEvent, QTimer
+from PySide6.QtCore import Qt, QEvent, QTimer, QModelIndex
 
 from .toolbar import TransactionsToolBar
-from .service import TIPOS_TRANSACCION, TransactionsService
+from .service import TIPOS_TRANSACCION, _TRANSACCION_COLUMNS, TransactionsService
+from common.table_model import RowTableModel
+from common.query_runner import QueryRunner
 from features.members.column_fill import ensure_columns_fill as _ensure_columns_fill
 from features.members.table_sort import TableSortMixin
+from features.periodos.service import PeriodosService
 from features.members.table_selection import capture_selected_id, restore_selected_id
 from ui.styles import MEMBERS_MENU_STYLESHEET
 from utils.logger import get_logger
@@ -46,12 +48,50 @@ logger = get_logger(__name__)
 _TODOS = "Todos"
 
 
+class _PagedTransactionsModel(RowTableModel):
+    """RowTableModel that pulls further pages on demand.
+
+    QTableView calls canFetchMore()/fetchMore() as the user scrolls near
+    the bottom, so only the pages actually scrolled into view are queried
+    (TransactionsService.list_transactions_page's keyset tokens). A header
+    sort is part of the filters, so later pages continue it.
+    """
+
+    def __init__(self, service: TransactionsService, parent=None) -> None:
+        super().__init__(_TRANSACCION_COLUMNS, parent)
+        self._service = service
+        self._filters: dict = {}
+        self._next_token: Optional[str] = None
+
+    def load_first_page(self, filters: dict, rows: list, next_token: Optional[str]) -> None:
+        """Replace every loaded row with the first page for `filters` (a
+        list_transactions_page result, fetched off the GUI thread by the
+        view); later pages continue from `next_token`."""
+        self._filters = dict(filters)
+        self._next_token = next_token
+        self.set_rows(_TRANSACCION_COLUMNS, rows)
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        if parent.isValid():
+            return False
+        return self._next_token is not None
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        if parent.isValid() or self._next_token is None:
+            return
+        rows, self._next_token = self._service.list_transactions_page(after=self._next_token, **self._filters)
+        self.append_rows(rows)
+        logger.info("TransactionsView.fetchMore: +%d rows", len(rows))
+
+
 class TransactionsView(QWidget, TableSortMixin):
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
         self.setObjectName("membersMenu")  # reuse Members' paper/table QSS root
         self.main_window = parent
         self._service = TransactionsService()
+        # Runs the search query off the GUI thread (common/query_runner.py).
+        self._query_runner = QueryRunner(self)
 
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(8, 8, 8, 8)
@@ -118,7 +158,7 @@ class TransactionsView(QWidget, TableSortMixin):
         self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.table.setAlternatingRowColors(True)
 
-        self.model = QStandardItemModel(0, 8, self)
+        self.model = _PagedTransactionsModel(self._service, self)
         self.table.setModel(self.model)
 
         header = self.table.horizontalHeader()
@@ -215,8 +255,34 @@ class TransactionsView(QWidget, TableSortMixin):
         # clears the selection explicitly instead (see table_sort.py).
         selected_id = capture_selected_id(self.table, self.model)
 
-        added = self._service.list_transactions(text, tipo=tipo, id_periodo=id_periodo, model=self.model)
-        logger.info("TransactionsView.on_search: %d rows (tipo=%s, id_periodo=%s)", added, tipo, id_periodo)
+        # The query runs off the GUI thread; a newer search supersedes it.
+        # An active header sort is part of the query, so every page of the
+        # filtered result comes back in that order.
+        sort_column = None
+        if self._sort_column is not None and 0 <= self._sort_column < len(_TRANSACCION_COLUMNS):
+            sort_column = _TRANSACCION_COLUMNS[self._sort_column]
+        filters = {
+            "text": text,
+            "tipo": tipo,
+            "id_periodo": id_periodo,
+            "sort_column": sort_column,
+            "descending": self._sort_order == Qt.SortOrder.DescendingOrder,
+        }
+        self._query_runner.submit(
+            self._service.list_transactions_page,
+            on_result=lambda page: self._on_first_page(filters, page, selected_id),
+            **filters,
+        )
+
+    def _on_first_page(self, filters: dict, page: tuple, selected_id: Optional[str]) -> None:
+        rows, next_token = page
+        self.model.load_first_page(filters, rows, next_token)
+        logger.info(
+            "TransactionsView.on_search: first page %d rows (tipo=%s, id_periodo=%s)",
+            len(rows),
+            filters["tipo"],
+            filters["id_periodo"],
+        )
 
         restore_selected_id(self.table, self.model, selected_id)
 
@@ -225,6 +291,21 @@ class TransactionsView(QWidget, TableSortMixin):
         except Exception:
             pass
 
+    def _apply_sort(self) -> None:
+        """Run the header-click sort in the database rather than in memory
+        (same as MembersMenuView): only the loaded pages are in the model,
+        so sorting them alone would be wrong. Reloads from the first page
+        of the sorted query."""
+        if self._sort_column is None or self._sort_order is None:
+            return
+        try:
+            self.on_search()
+            header = self.table.horizontalHeader()
+            header.setSortIndicator(self._sort_column, self._sort_order)
+            header.setSortIndicatorShown(True)
+        except Exception:
+            logger.exception("TransactionsView._apply_sort: failed to apply sort")
+
     def load_table_view(self) -> None:
         """Reload transacciones with the current filters (used on first load
         and by TableSortMixin's sort-clear restoration).
@@ -246,10 +327,17 @@ def show_transactions_view(main_window) -> None:
     if main_window is None:
         raise ValueError("main_window is required")
 
+    # PLAN.md 2.6: make sure today's período exists and is the open one
+    # before the screen picks its default período filter.
+    rolled_to = PeriodosService().rollover()
+
     tv = getattr(main_window, "_transactions_view", None)
     if tv is None:
         tv = TransactionsView(main_window)
         main_window._transactions_view = tv
         main_window._stack.addWidget(tv)
+    elif rolled_to is not None:
+        tv._populate_periodo_filter(select_id=rolled_to)
+        tv.refresh_table()
 
     main_window._stack.setCurrentWidget(tv)
@@ -18,7 +18,8 @@ from PySide6.QtWidgets import (
 	QStackedWidget,
 )
 
-from ui.views.main_menu_widget import MainMenuWidget
+from common.lazy_view import prefetch
+from ui.views.main_menu_widget import MAIN_MENU_PREFETCH, MainMenuWidget
 from ui.views.menu_bar import MainMenuBar
 
 class MainWindow(QMainWindow):
@@ -60,6 +61,9 @@ def run_main_window(argv: Optional[list[str]] = None) -> int:
 	app = QApplication(list(sys.argv))
 	w = MainWindow()
 	w.show()
+	# Screens load on first navigation; warm the likely first ones while
+	# the user is still looking at the menu.
+	prefetch(MAIN_MENU_PREFETCH)
 	return app.exec()
 
 
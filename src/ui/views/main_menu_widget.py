@@ -14,13 +14,21 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QColor
-from features.members.menu_view import show_members_view
-from features.settings.menu_view import show_settings_view
-from features.transactions.view import show_transactions_view
+from common.lazy_view import lazy_view
 from ui.styles import MAIN_MENU_STYLESHEET, TITLE_STYLE, BUTTON_FONT_STYLE
 from utils.logger import get_logger
 logger = get_logger(__name__)
 
+# Feature screens are imported on first navigation, not with the menu -
+# see common/lazy_view.py. MAIN_MENU_PREFETCH is what run_main_window
+# warms in the background once the window is up, most used first.
+show_members_view = lazy_view("features.members.menu_view", "show_members_view")
+show_transactions_view = lazy_view("features.transactions.view", "show_transactions_view")
+show_deudores_view = lazy_view("features.deudores.view", "show_deudores_view")
+show_settings_view = lazy_view("features.settings.menu_view", "show_settings_view")
+
+MAIN_MENU_PREFETCH = ("features.members.menu_view", "features.transactions.view")
+
 
 class MainMenuWidget(QWidget):
 	"""Main menu used as the application's home page."""
@@ -61,6 +69,7 @@ class MainMenuWidget(QWidget):
 		buttons_main_menu = [
 			("miembros", "🧑‍🤝‍🧑 Gestionar Miembros", show_members_view),
 			("transacciones", "🧾 Transacciones", show_transactions_view),
+			("deudores", "💸 Deudores", show_deudores_view),
 			("ajustes", "⚙️ Ajustes", show_settings_view),
 		]
 
@@ -22,3 +22,10 @@ def normalize_for_match(value) -> str:
         return stripped.casefold().strip()
     except Exception:
         return str(value).casefold() if value is not None else ""
+
+
+def like_contains(needle: str) -> str:
+    """Return a SQL LIKE pattern matching `needle` anywhere, with LIKE's
+    wildcards escaped - pair with `escape="\\"` on the .like() call."""
+    escaped = needle.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
@@ -35,6 +35,13 @@ def test_engine(tmp_path, monkeypatch):
     monkeypatch.setattr(session_module, "engine", engine)
     monkeypatch.setattr(session_module, "SessionLocal", session_factory)
 
+    # A new, empty database: nothing cached for the previous test's applies.
+    from database import reference_cache, saldo_changes, socio_labels
+
+    reference_cache.invalidate()
+    saldo_changes.invalidate_all()
+    socio_labels.invalidate_names()
+
     try:
         import common.view_registry as view_registry_module
 
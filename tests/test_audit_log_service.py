@@ -17,11 +17,9 @@ from features.settings.audit_log.service import AuditLogService
 
 
 class _FakeModel:
-    """Minimal stand-in for QStandardItemModel, no QApplication needed.
-
-    Same shape as test_transactions_service.py's _FakeModel -
-    list_logs only calls removeRows/setColumnCount/setRowCount/
-    setHorizontalHeaderLabels/appendRow.
+    """Minimal stand-in for common.table_model.RowTableModel - the services
+    only call set_rows/append_rows, stored here as display strings the
+    same way RowTableModel.text() renders them.
     """
 
     def __init__(self) -> None:
@@ -31,20 +29,12 @@ class _FakeModel:
     def rowCount(self) -> int:
         return len(self.rows)
 
-    def removeRows(self, start: int, count: int) -> None:
-        self.rows = []
-
-    def setColumnCount(self, count: int) -> None:
-        pass
-
-    def setRowCount(self, count: int) -> None:
-        pass
-
-    def setHorizontalHeaderLabels(self, labels: list[str]) -> None:
-        self.headers = list(labels)
+    def set_rows(self, headers, rows) -> None:
+        self.headers = [str(h) for h in headers]
+        self.rows = [["" if v is None else str(v) for v in row] for row in rows]
 
-    def appendRow(self, items) -> None:
-        self.rows.append([item.text() for item in items])
+    def append_rows(self, rows) -> None:
+        self.rows.extend(["" if v is None else str(v) for v in row] for row in rows)
 
 
 def _make_socio(session, **overrides) -> Socio:
@@ -0,0 +1,44 @@
+"""Smoke test for the startup benchmark harness (src/benchmarks/).
+
+Runs the real thing at a tiny size - a generated database and one
+measured startup in a child process - so the harness can't silently rot
+as screens change.
+"""
+
+from __future__ import annotations
+
+from benchmarks import startup
+from benchmarks.startup import PHASES, compare, run_benchmark
+
+
+def test_reports_every_phase(tmp_path):
+    result = run_benchmark([30], repeat=1, db_dir=tmp_path)
+
+    (entry,) = result["results"]
+    assert entry["families"] == 30 and entry["runs"] == 1
+    assert set(entry["phases"]) == set(PHASES)
+    for phase in PHASES:
+        timing = entry["phases"][phase]
+        assert 0 <= timing["min_ms"] <= timing["median_ms"] <= timing["max_ms"]
+
+    lines = compare(result, result)
+    assert len(lines) == len(PHASES) and all("+0.0%" in line for line in lines)
+
+
+def test_runs_write_to_a_copy_of_the_cached_database(tmp_path, monkeypatch):
+    cached = startup._ensure_database(tmp_path, 30, 0)
+    before = cached.read_bytes()
+    seen = []
+
+    def _fake_child(db_path):
+        # Stands in for a run whose rollover writes to its database.
+        seen.append(db_path)
+        with open(db_path, "ab") as handle:
+            handle.write(b"rollover")
+        return {phase: 0.001 for phase in PHASES}
+
+    monkeypatch.setattr(startup, "_run_child", _fake_child)
+    run_benchmark([30], repeat=2, db_dir=tmp_path)
+
+    assert len(seen) == 3 and cached not in seen
+    assert cached.read_bytes() == before
@@ -0,0 +1,79 @@
+"""Tests for the chunked, resumable data migrations
+(database/data_migrations.py)."""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from database.data_migrations import DataMigration, checkpoint, run_data_migration
+from database.models import Log
+
+
+def _seed_logs(engine, count=5):
+    with Session(engine) as session:
+        session.add_all(Log(accion="viejo", tabla_afectada="socios") for _ in range(count))
+        session.commit()
+
+
+def _marcar(conn, desde, hasta):
+    return conn.execute(
+        text("UPDATE logs SET accion = 'nuevo' WHERE id_log > :desde AND id_log <= :hasta AND accion != 'nuevo'"),
+        {"desde": desde, "hasta": hasta},
+    ).rowcount
+
+
+def _acciones(engine):
+    with Session(engine) as session:
+        return [accion for (accion,) in session.query(Log.accion).order_by(Log.id_log)]
+
+
+class TestRunDataMigration:
+    def test_walks_the_table_in_chunks_with_progress(self, test_engine):
+        _seed_logs(test_engine)
+        ranges, progress = [], []
+
+        def _procesar(conn, desde, hasta):
+            ranges.append((desde, hasta))
+            return _marcar(conn, desde, hasta)
+
+        changed = run_data_migration(
+            test_engine, DataMigration("marcar", "logs", _procesar), lambda *p: progress.append(p), chunk_size=2
+        )
+
+        assert changed == 5
+        assert ranges == [(0, 2), (2, 4), (4, 5)]
+        assert progress == [(2, 5), (4, 5), (5, 5)]
+        assert _acciones(test_engine) == ["nuevo"] * 5
+        assert checkpoint(test_engine, "marcar") is None
+
+    def test_resumes_after_the_last_committed_chunk(self, test_engine):
+        _seed_logs(test_engine)
+
+        def _falla_en_el_segundo(conn, desde, hasta):
+            changed = _marcar(conn, desde, hasta)
+            if desde:
+                raise RuntimeError("interrumpido")
+            return changed
+
+        with pytest.raises(RuntimeError):
+            run_data_migration(test_engine, DataMigration("marcar", "logs", _falla_en_el_segundo), chunk_size=2)
+
+        # The first chunk and its checkpoint committed; the failed one rolled back.
+        assert checkpoint(test_engine, "marcar") == 2
+        assert _acciones(test_engine) == ["nuevo", "nuevo", "viejo", "viejo", "viejo"]
+
+        ranges = []
+
+        def _procesar(conn, desde, hasta):
+            ranges.append((desde, hasta))
+            return _marcar(conn, desde, hasta)
+
+        assert run_data_migration(test_engine, DataMigration("marcar", "logs", _procesar), chunk_size=2) == 3
+        assert ranges == [(2, 4), (4, 5)]
+        assert checkpoint(test_engine, "marcar") is None
+
+    def test_empty_table_is_a_noop(self, test_engine):
+        assert run_data_migration(test_engine, DataMigration("marcar", "logs", _marcar)) == 0
+        assert checkpoint(test_engine, "marcar") is None
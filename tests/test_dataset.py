@@ -0,0 +1,109 @@
+"""Tests for the synthetic dataset generator (src/benchmarks/dataset.py)."""
+
+from __future__ import annotations
+
+import datetime
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.dataset import generate
+from database.models import Base
+
+HASTA = datetime.date(2026, 6, 1)
+
+
+def _dump(engine):
+    with engine.connect() as conn:
+        return {
+            table: conn.execute(text(f"SELECT * FROM {table} ORDER BY 1, 2")).all()
+            for table in ("socios", "transacciones", "saldos_socios", "logs", "periodo")
+        }
+
+
+def _saldos(engine):
+    with engine.connect() as conn:
+        return conn.execute(
+            text(
+                "SELECT numero_socio, id_periodo, saldo_anterior, cargos, pagos, reembolsos, devoluciones, "
+                "saldo_actual FROM saldos_socios ORDER BY numero_socio, id_periodo"
+            )
+        ).all()
+
+
+@pytest.fixture()
+def generated(test_engine):
+    written = generate(400, seed=5, hasta=HASTA)
+    return test_engine, written
+
+
+class TestGenerate:
+    def test_same_seed_same_rows(self, generated, tmp_path, monkeypatch):
+        engine, _ = generated
+        other = create_engine(f"sqlite:///{tmp_path / 'other.db'}", future=True)
+        Base.metadata.create_all(bind=other)
+
+        import database.session as session_module
+
+        monkeypatch.setattr(session_module, "engine", other)
+        monkeypatch.setattr(session_module, "SessionLocal", sessionmaker(bind=other))
+        generate(400, seed=5, hasta=HASTA)
+
+        assert _dump(other) == _dump(engine)
+        other.dispose()
+
+    def test_different_seed_differs(self, test_engine):
+        generate(50, seed=1, hasta=HASTA)
+        socios = _dump(test_engine)["socios"]
+        with test_engine.begin() as conn:
+            for table in ("logs", "saldos_socios", "transacciones", "socios", "periodo", "reglas_cobro"):
+                conn.execute(text(f"DELETE FROM {table}"))
+
+        generate(50, seed=2, hasta=HASTA)
+
+        assert _dump(test_engine)["socios"] != socios
+
+    def test_families_have_one_titular(self, generated):
+        engine, written = generated
+        with engine.connect() as conn:
+            titulares = conn.execute(
+                text("SELECT numero_socio, SUM(es_titular) FROM socios GROUP BY numero_socio")
+            ).all()
+
+        assert len(titulares) == 400
+        assert {count for _, count in titulares} == {1}
+        assert written["socios"] > 400
+
+    def test_saldos_match_the_balance_engine(self, generated):
+        from features.saldos.service import rebuild_saldos
+
+        engine, _ = generated
+        before = _saldos(engine)
+
+        rebuild_saldos(include_closed=True)
+
+        assert _saldos(engine) == before
+
+    def test_realistic_content(self, generated):
+        engine, written = generated
+        with engine.connect() as conn:
+            tipos = dict(conn.execute(text("SELECT tipo, COUNT(*) FROM transacciones GROUP BY tipo")).all())
+            estados = dict(conn.execute(text("SELECT estado, COUNT(*) FROM periodo GROUP BY estado")).all())
+            nombres = conn.execute(text("SELECT nombre || apellidos FROM socios")).scalars().all()
+            excesos = conn.execute(text("SELECT COUNT(*) FROM saldos_socios WHERE reembolsos > pagos")).scalar_one()
+            fts = conn.execute(text("SELECT COUNT(*) FROM socios_fts WHERE socios_fts MATCH 'garcia'")).scalar_one()
+            deudores = conn.execute(text("SELECT COUNT(*) FROM deudores")).scalar_one()
+
+        assert set(tipos) == {"Cargo", "Pago", "Devolución", "Reembolso"}
+        assert tipos["Cargo"] > tipos["Pago"] * 0.8
+        assert estados == {"abierto": 1, "cerrado": 11}
+        assert any(ch in "áéíóúñÁÉÍÓÚ" for nombre in nombres for ch in nombre)
+        assert excesos == 0
+        assert fts > 0
+        assert 0 < deudores < 400
+        assert written["transacciones"] == sum(tipos.values())
+
+    def test_refuses_a_populated_database(self, generated):
+        with pytest.raises(ValueError):
+            generate(10, seed=5, hasta=HASTA)
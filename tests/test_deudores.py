@@ -0,0 +1,148 @@
+"""Tests for the maintained debtor index (database/deudores.py) and the
+Deudores screen's service (features/deudores/service.py)."""
+
+from __future__ import annotations
+
+import datetime
+import decimal
+
+from sqlalchemy.orm import Session
+
+from database import deudores
+from database.models import Deudor, Periodo, ReglaCobro, SaldoSocios, Socio
+from features.deudores.service import AVISO_RECIBOS, CUOTA_LEGADO, DeudoresService
+from features.saldos.service import rebuild_saldos
+from features.transactions.service import TransactionsService
+
+D = decimal.Decimal
+
+
+def _setup(engine, numeros=("1001",)) -> int:
+    """Active titulares for `numeros` and a January período; returns its id."""
+    with Session(engine) as session:
+        for numero in numeros:
+            session.add(Socio(numero_socio=numero, nombre="Socio", apellidos=numero, estado="activo", es_titular=True))
+        periodo = Periodo(nombre="Enero", fecha_inicio=datetime.date(2026, 1, 1), fecha_fin=datetime.date(2026, 1, 31))
+        session.add(periodo)
+        session.commit()
+        return periodo.id_periodo
+
+
+def _tx(id_periodo, tipo, monto, numero="1001", dia=5) -> dict:
+    return {
+        "numero_socio": numero,
+        "id_periodo": id_periodo,
+        "id_metodo": None,
+        "tipo": tipo,
+        "monto": D(monto),
+        "fecha": datetime.date(2026, 1, dia),
+        "referencia": None,
+    }
+
+
+def _deudores(engine):
+    with Session(engine) as session:
+        return {d.numero_socio: d.saldo for d in session.query(Deudor)}
+
+
+class TestDebtorIndex:
+    def test_a_charge_flags_the_family(self, test_engine):
+        id_periodo = _setup(test_engine)
+
+        assert TransactionsService().add_transaction(_tx(id_periodo, "Cargo", "45.00")) is not None
+
+        assert _deudores(test_engine) == {"1001": D("45.00")}
+
+    def test_paying_off_clears_the_flag(self, test_engine):
+        id_periodo = _setup(test_engine)
+        service = TransactionsService()
+        service.add_transaction(_tx(id_periodo, "Cargo", "45.00"))
+
+        assert service.add_transaction(_tx(id_periodo, "Pago", "45.00", dia=6)) is not None
+
+        assert _deudores(test_engine) == {}
+
+    def test_batch_cuotas_flag_every_family(self, test_engine):
+        id_periodo = _setup(test_engine, numeros=("1001", "1002"))
+        with Session(test_engine) as session:
+            session.add(ReglaCobro(descripcion="General", cuota_mensual=D("36.00"), plazo_pago=30))
+            session.commit()
+
+        result = TransactionsService().generate_cuotas(id_periodo)
+
+        assert result["error"] is None
+        assert _deudores(test_engine) == {"1001": D("36.00"), "1002": D("36.00")}
+
+    def test_rebuild_restores_a_stale_index(self, test_engine):
+        id_periodo = _setup(test_engine)
+        TransactionsService().add_transaction(_tx(id_periodo, "Cargo", "45.00"))
+        with Session(test_engine) as session:
+            session.query(Deudor).delete()
+            session.commit()
+
+        rebuild_saldos()
+        assert _deudores(test_engine) == {"1001": D("45.00")}
+
+        with test_engine.begin() as conn:
+            conn.execute(Deudor.__table__.delete())
+            assert deudores.rebuild_deudores(conn) == 1
+
+    def test_follows_the_latest_periodo(self, test_engine):
+        id_enero = _setup(test_engine)
+        service = TransactionsService()
+        service.add_transaction(_tx(id_enero, "Cargo", "45.00"))
+        with Session(test_engine) as session:
+            febrero = Periodo(nombre="Febrero", fecha_inicio=datetime.date(2026, 2, 1), fecha_fin=datetime.date(2026, 2, 28))
+            session.add(febrero)
+            session.commit()
+            id_febrero = febrero.id_periodo
+
+        data = _tx(id_febrero, "Pago", "45.00")
+        data["fecha"] = datetime.date(2026, 2, 3)
+        assert service.add_transaction(data) is not None
+
+        with Session(test_engine) as session:
+            assert session.query(SaldoSocios).filter_by(id_periodo=id_enero).one().saldo_actual == D("45.00")
+        assert _deudores(test_engine) == {}
+
+
+class TestListDeudores:
+    def test_largest_debt_first_with_months_and_aviso(self, test_engine):
+        id_periodo = _setup(test_engine, numeros=("1001", "1002"))
+        service = TransactionsService()
+        service.add_transaction(_tx(id_periodo, "Cargo", "40.00"))
+        service.add_transaction(_tx(id_periodo, "Cargo", "108.00", numero="1002"))
+
+        rows = DeudoresService().list_deudores()
+
+        assert [(r[0], r[1], r[2], r[3], r[4]) for r in rows] == [
+            ("1002", "Socio 1002", D("108.00"), 3, AVISO_RECIBOS),
+            ("1001", "Socio 1001", D("40.00"), 1, ""),
+        ]
+
+    def test_solo_aviso_keeps_three_cuotas_or_more(self, test_engine):
+        id_periodo = _setup(test_engine, numeros=("1001", "1002"))
+        service = TransactionsService()
+        service.add_transaction(_tx(id_periodo, "Cargo", "107.99"))
+        service.add_transaction(_tx(id_periodo, "Cargo", "108.00", numero="1002"))
+
+        rows = DeudoresService().list_deudores(solo_aviso=True)
+
+        assert [r[0] for r in rows] == ["1002"]
+
+    def test_cuota_from_the_active_rule(self, test_engine):
+        id_periodo = _setup(test_engine)
+        with Session(test_engine) as session:
+            session.add(
+                ReglaCobro(descripcion="General", cuota_mensual=D("50.00"), descuento=D("10.00"), plazo_pago=30)
+            )
+            session.commit()
+        TransactionsService().add_transaction(_tx(id_periodo, "Cargo", "100.00"))
+
+        service = DeudoresService()
+        assert service.cuota_referencia() == D("40.00")
+        assert service.list_deudores()[0][3] == 2
+        assert service.list_deudores(solo_aviso=True) == []
+
+    def test_legacy_cuota_without_a_rule(self, test_engine):
+        assert DeudoresService().cuota_referencia() == CUOTA_LEGADO
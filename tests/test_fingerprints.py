@@ -0,0 +1,120 @@
+"""Tests for transacciones.fingerprint (database/fingerprints.py) and the
+duplicate/refund checks that read it."""
+
+from __future__ import annotations
+
+import datetime
+import decimal
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from database.fingerprints import backfill_fingerprints, transaccion_fingerprint
+from database.models import Periodo, SaldoSocios, Socio, Transaccion
+from features.transactions.service import TransactionsService
+
+
+def _seed(session) -> int:
+    periodo = Periodo(nombre="Enero", fecha_inicio=datetime.date(2026, 1, 1), fecha_fin=datetime.date(2026, 1, 31))
+    session.add_all([periodo, Socio(numero_socio="1001", nombre="Marta", apellidos="Ruiz", estado="activo")])
+    session.commit()
+    return periodo.id_periodo
+
+
+class TestFingerprint:
+    def test_monto_is_compared_to_the_cent(self):
+        fecha = datetime.date(2026, 1, 5)
+        a = transaccion_fingerprint("1001", "Pago", 45, 1, 2, fecha)
+        b = transaccion_fingerprint("1001", "Pago", decimal.Decimal("45.00"), 1, 2, fecha)
+        c = transaccion_fingerprint("1001", "Pago", "45.01", 1, 2, fecha)
+
+        assert a == b
+        assert a != c
+
+    def test_insert_sets_it_including_the_default_fecha(self, test_engine):
+        with Session(test_engine) as session:
+            id_periodo = _seed(session)
+            transaccion = Transaccion(numero_socio="1001", id_periodo=id_periodo, tipo="Cargo", monto=30)
+            session.add(transaccion)
+            session.commit()
+
+            assert transaccion.fecha == datetime.date.today()
+            assert transaccion.fingerprint == transaccion_fingerprint(
+                "1001", "Cargo", 30, id_periodo, None, datetime.date.today()
+            )
+
+    def test_duplicate_without_fecha_matches_todays_row(self, test_engine):
+        with Session(test_engine) as session:
+            id_periodo = _seed(session)
+        data = {"numero_socio": "1001", "id_periodo": id_periodo, "id_metodo": None, "tipo": "Cargo", "monto": 30}
+        service = TransactionsService()
+
+        assert service.add_transaction(data) is not None
+        assert "idéntica" in service.validate_transaction(data)
+
+    def test_backfill_fills_rows_written_before_the_column_existed(self, test_engine):
+        fecha = datetime.date(2026, 1, 5)
+        with Session(test_engine) as session:
+            id_periodo = _seed(session)
+            session.add(Transaccion(numero_socio="1001", id_periodo=id_periodo, tipo="Cargo", monto=30, fecha=fecha))
+            session.commit()
+        with test_engine.begin() as conn:
+            conn.execute(update(Transaccion.__table__).values(fingerprint=None))
+
+        with test_engine.begin() as conn:
+            assert backfill_fingerprints(conn) == 1
+            assert backfill_fingerprints(conn) == 0
+
+        with Session(test_engine) as session:
+            assert session.query(Transaccion.fingerprint).scalar() == transaccion_fingerprint(
+                "1001", "Cargo", 30, id_periodo, None, fecha
+            )
+
+
+class TestRefundReadsSaldos:
+    def test_available_amount_comes_from_the_saldo_row(self, test_engine):
+        with Session(test_engine) as session:
+            id_periodo = _seed(session)
+            # No Pago movement exists - only the maintained totals say 50 was paid.
+            session.add(
+                SaldoSocios(numero_socio="1001", id_periodo=id_periodo, pagos=50, reembolsos=20, saldo_actual=-30)
+            )
+            session.commit()
+        reembolso = {
+            "numero_socio": "1001",
+            "id_periodo": id_periodo,
+            "id_metodo": None,
+            "tipo": "Reembolso",
+            "fecha": datetime.date(2026, 1, 10),
+        }
+        service = TransactionsService()
+
+        assert service.validate_transaction(dict(reembolso, monto=decimal.Decimal("30.00"))) is None
+        assert "30.00€ disponibles" in service.validate_transaction(dict(reembolso, monto=decimal.Decimal("30.01")))
+
+    def test_legacy_ledger_refund_after_migration(self, test_engine, monkeypatch):
+        import database.init_db as init_db_module
+
+        monkeypatch.setattr(init_db_module, "engine", test_engine)
+        with Session(test_engine) as session:
+            id_periodo = _seed(session)
+            # Written before the balance engine: a Pago and no SaldoSocios row.
+            session.add(Transaccion(numero_socio="1001", id_periodo=id_periodo, tipo="Pago", monto=50))
+            session.commit()
+
+        init_db_module.init_db()
+        new_id = TransactionsService().add_transaction(
+            {
+                "numero_socio": "1001",
+                "id_periodo": id_periodo,
+                "id_metodo": None,
+                "tipo": "Reembolso",
+                "monto": decimal.Decimal("20.00"),
+                "fecha": datetime.date(2026, 1, 10),
+            }
+        )
+
+        assert new_id is not None
+        with Session(test_engine) as session:
+            saldo = session.query(SaldoSocios).one()
+            assert (saldo.pagos, saldo.reembolsos) == (50, 20)
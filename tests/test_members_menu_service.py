@@ -16,12 +16,9 @@ from features.members.menu_service import MembersMenuService
 
 
 class _FakeModel:
-    """Minimal stand-in for QStandardItemModel, no PySide6/QApplication needed.
-
-    _populate_model only calls removeRows/setColumnCount/setRowCount/
-    setHorizontalHeaderLabels/appendRow - QStandardItem itself is still real
-    Qt, but constructing QStandardItem objects doesn't require a running
-    QApplication.
+    """Minimal stand-in for common.table_model.RowTableModel - the services
+    only call set_rows/append_rows, stored here as display strings the
+    same way RowTableModel.text() renders them.
     """
 
     def __init__(self) -> None:
@@ -31,20 +28,12 @@ class _FakeModel:
     def rowCount(self) -> int:
         return len(self.rows)
 
-    def removeRows(self, start: int, count: int) -> None:
-        self.rows = []
-
-    def setColumnCount(self, count: int) -> None:
-        pass
-
-    def setRowCount(self, count: int) -> None:
-        pass
+    def set_rows(self, headers, rows) -> None:
+        self.headers = [str(h) for h in headers]
+        self.rows = [["" if v is None else str(v) for v in row] for row in rows]
 
-    def setHorizontalHeaderLabels(self, labels: list[str]) -> None:
-        self.headers = list(labels)
-
-    def appendRow(self, items) -> None:
-        self.rows.append([item.text() for item in items])
+    def append_rows(self, rows) -> None:
+        self.rows.extend(["" if v is None else str(v) for v in row] for row in rows)
 
 
 def _add_socio(engine, **overrides) -> None:
@@ -143,6 +132,42 @@ class TestSearchMembers:
 
         assert added == 1
 
+    def test_matches_word_prefixes_across_fields(self, test_engine):
+        _add_socio(test_engine, numero_socio="1001", nombre="Marta", apellidos="Fernández Ruiz")
+        _add_socio(test_engine, numero_socio="1002", nombre="Marta", apellidos="Dominguez Pena")
+        service = MembersMenuService()
+        model = _FakeModel()
+
+        added = service.search_members("mar fern", model)
+
+        assert added == 1
+        assert model.rows[0][1] == "1001"
+
+    def test_index_follows_updates_and_deletes(self, test_engine):
+        _add_socio(test_engine, numero_socio="1001", nombre="Marta", email=None)
+        with Session(test_engine) as session:
+            socio = session.query(Socio).one()
+            socio.nombre = "Lucía"
+            session.commit()
+        service = MembersMenuService()
+
+        assert service.search_members("marta", _FakeModel()) == 0
+        assert service.search_members("lucia", _FakeModel()) == 1
+
+        with Session(test_engine) as session:
+            session.delete(session.query(Socio).one())
+            session.commit()
+
+        assert service.search_members("lucia", _FakeModel()) == 0
+
+    def test_fts_syntax_in_the_text_is_treated_as_plain_words(self, test_engine):
+        _add_socio(test_engine, numero_socio="1001", nombre="Marta")
+        service = MembersMenuService()
+
+        assert service.search_members('"marta" OR NEAR(', _FakeModel()) == 0
+        assert service.search_members('marta"', _FakeModel()) == 1
+        assert service.search_members("***", _FakeModel()) == 0
+
     def test_no_match_returns_zero_and_empty_model(self, test_engine):
         _add_socio(test_engine, numero_socio="1001", nombre="Marta")
         service = MembersMenuService()
@@ -227,3 +252,68 @@ class TestSearchMembers:
             "es_titular",
             "observaciones",
         ]
+
+
+class TestListMembersPage:
+    def test_pages_cover_every_row_once(self, test_engine):
+        for i in range(5):
+            _add_socio(test_engine, numero_socio=str(1001 + i), nombre=f"Socio{i}")
+        service = MembersMenuService()
+
+        first, offset = service.list_members_page(page_size=2)
+        second, offset = service.list_members_page(offset=offset, page_size=2)
+        third, offset = service.list_members_page(offset=offset, page_size=2)
+
+        assert [r[1] for r in first + second + third] == ["1001", "1002", "1003", "1004", "1005"]
+        assert offset is None
+
+    def test_sorts_text_columns_accent_insensitively(self, test_engine):
+        _add_socio(test_engine, numero_socio="1001", apellidos="Ruiz")
+        _add_socio(test_engine, numero_socio="1002", apellidos="Álvarez")
+        _add_socio(test_engine, numero_socio="1003", apellidos="Benítez")
+        service = MembersMenuService()
+
+        rows, _ = service.list_members_page(sort_column="apellidos")
+        desc, _ = service.list_members_page(sort_column="apellidos", descending=True)
+
+        assert [r[3] for r in rows] == ["Álvarez", "Benítez", "Ruiz"]
+        assert [r[3] for r in desc] == ["Ruiz", "Benítez", "Álvarez"]
+
+    def test_numero_socio_sorts_numbers_first_by_value(self, test_engine):
+        for numero in ("B-7", "10", "9", "A-1"):
+            _add_socio(test_engine, numero_socio=numero)
+        service = MembersMenuService()
+
+        rows, _ = service.list_members_page(sort_column="numero_socio")
+
+        assert [r[1] for r in rows] == ["9", "10", "A-1", "B-7"]
+
+    def test_matches_the_in_memory_sort_key(self, test_engine):
+        from features.members.table_sort import TableSortMixin
+
+        for numero, email in (("3", "Zoe@x.com"), ("1", None), ("2", "álex@x.com"), ("4", "2@x.com")):
+            _add_socio(test_engine, numero_socio=numero, email=email)
+        service = MembersMenuService()
+        key = TableSortMixin()._make_sort_key
+
+        rows, _ = service.list_members_page(sort_column="email")
+
+        emails = [r[5] for r in rows]
+        assert emails == sorted(emails, key=key)
+
+    def test_sorted_first_page_only(self, test_engine):
+        for i, nombre in enumerate(("Carla", "Ana", "Berta")):
+            _add_socio(test_engine, numero_socio=str(1001 + i), nombre=nombre)
+        service = MembersMenuService()
+
+        rows, offset = service.list_members_page(sort_column="nombre", page_size=2)
+        rest, end = service.list_members_page(sort_column="nombre", offset=offset, page_size=2)
+
+        assert [r[2] for r in rows] == ["Ana", "Berta"]
+        assert [r[2] for r in rest] == ["Carla"]
+        assert end is None
+
+    def test_unknown_sort_column_returns_empty(self, test_engine):
+        _add_socio(test_engine)
+
+        assert MembersMenuService().list_members_page(sort_column="nope") == ([], None)
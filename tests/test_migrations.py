@@ -0,0 +1,124 @@
+"""Tests for the versioned startup migrations (database/migrations.py) and
+init_db()'s use of them."""
+
+from __future__ import annotations
+
+import datetime
+
+import pytest
+from sqlalchemy import event, inspect, text
+from sqlalchemy.orm import Session
+
+import database.init_db as init_db_module
+from database.migrations import Migration, current_version, run_migrations, stamp_version
+from database.models import Deudor, MetodoPago, Periodo, SaldoSocios, Socio, Transaccion
+
+
+@pytest.fixture()
+def init_engine(test_engine, monkeypatch):
+    """test_engine, also bound to init_db's module-level `engine` (imported
+    by name, so the conftest patch doesn't reach it)."""
+    monkeypatch.setattr(init_db_module, "engine", test_engine)
+    return test_engine
+
+
+def _statements(engine, action):
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        action()
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+    return statements
+
+
+class TestInitDb:
+    def test_stamps_the_latest_version(self, init_engine):
+        init_db_module.init_db()
+
+        assert current_version(init_engine) == init_db_module._MIGRATIONS[-1].version
+        with Session(init_engine) as session:
+            assert session.query(MetodoPago).count() > 0
+
+    def test_current_database_costs_one_read(self, init_engine):
+        init_db_module.init_db()
+
+        statements = _statements(init_engine, init_db_module.init_db)
+
+        assert statements == ["PRAGMA user_version"]
+
+    def test_fresh_database_gets_the_whole_schema(self, init_engine):
+        with init_engine.begin() as conn:
+            for table in inspect(conn).get_table_names():
+                conn.execute(text(f"DROP TABLE IF EXISTS {table}"))
+
+        init_db_module.init_db()
+
+        tables = set(inspect(init_engine).get_table_names())
+        assert {"socios", "transacciones", "deudores", "socios_fts"} <= tables
+
+    def test_pre_versioning_database_is_migrated(self, init_engine):
+        with Session(init_engine) as session:
+            session.add(Socio(numero_socio="1001", nombre="Marta", apellidos="Ruiz", es_titular=True))
+            periodo = Periodo(nombre="Enero", fecha_inicio=datetime.date(2026, 1, 1), fecha_fin=datetime.date(2026, 1, 31))
+            session.add(periodo)
+            session.flush()
+            session.add(Transaccion(numero_socio="1001", id_periodo=periodo.id_periodo, tipo="cargo", monto=30))
+            session.commit()
+
+        init_db_module.init_db()
+
+        with Session(init_engine) as session:
+            assert session.query(Transaccion.tipo).scalar() == "Cargo"
+
+    def test_legacy_ledger_gets_its_saldos(self, init_engine):
+        with Session(init_engine) as session:
+            session.add(Socio(numero_socio="1001", nombre="Marta", apellidos="Ruiz", es_titular=True))
+            periodo = Periodo(nombre="Enero", fecha_inicio=datetime.date(2026, 1, 1), fecha_fin=datetime.date(2026, 1, 31))
+            session.add(periodo)
+            session.flush()
+            session.add(Transaccion(numero_socio="1001", id_periodo=periodo.id_periodo, tipo="Cargo", monto=80))
+            session.add(Transaccion(numero_socio="1001", id_periodo=periodo.id_periodo, tipo="Pago", monto=50))
+            session.commit()
+
+        init_db_module.init_db()
+
+        with Session(init_engine) as session:
+            saldo = session.query(SaldoSocios).one()
+            assert (saldo.cargos, saldo.pagos, saldo.saldo_actual) == (80, 50, 30)
+            assert session.query(Deudor.numero_socio).scalar() == "1001"
+
+
+class TestRunMigrations:
+    def test_runs_only_newer_versions_in_order(self, test_engine):
+        ran = []
+        migrations = [Migration(v, f"v{v}", lambda v=v: ran.append(v)) for v in (1, 2, 3)]
+        stamp_version(test_engine, 1)
+
+        assert run_migrations(test_engine, migrations) == [2, 3]
+        assert ran == [2, 3]
+        assert current_version(test_engine) == 3
+
+    def test_failure_keeps_the_last_complete_version(self, test_engine):
+        def _falla():
+            raise RuntimeError("boom")
+
+        migrations = [Migration(1, "ok", lambda: None), Migration(2, "falla", _falla)]
+
+        with pytest.raises(RuntimeError):
+            run_migrations(test_engine, migrations)
+        assert current_version(test_engine) == 1
+
+    def test_newer_database_is_left_alone(self, test_engine):
+        stamp_version(test_engine, 5)
+
+        assert run_migrations(test_engine, [Migration(1, "v1", pytest.fail)]) == []
+        assert current_version(test_engine) == 5
+
+    def test_rejects_out_of_order_versions(self, test_engine):
+        with pytest.raises(ValueError):
+            run_migrations(test_engine, [Migration(2, "b", lambda: None), Migration(1, "a", lambda: None)])
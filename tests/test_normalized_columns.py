@@ -0,0 +1,72 @@
+"""Tests for the persisted `*_norm` shadow columns
+(database/normalized_columns.py)."""
+
+from __future__ import annotations
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from database.models import Log, Socio
+from database.normalized_columns import backfill_normalized_columns
+from features.transactions.service import TransactionsService
+
+
+def _socio(**overrides) -> Socio:
+    data = dict(numero_socio="1001", nombre="Álvaro", apellidos="Muñoz Peña", email="Alvaro@Example.com", estado="activo")
+    data.update(overrides)
+    return Socio(**data)
+
+
+class TestNormalizedColumns:
+    def test_insert_sets_the_norm_columns(self, test_engine):
+        with Session(test_engine) as session:
+            session.add_all([_socio(), Log(accion="crear", descripcion_cambio="Alta de Álvaro")])
+            session.commit()
+            socio = session.query(Socio).one()
+            log = session.query(Log).one()
+
+            assert (socio.nombre_norm, socio.apellidos_norm, socio.email_norm) == ("alvaro", "munoz pena", "alvaro@example.com")
+            assert log.descripcion_norm == "alta de alvaro"
+
+    def test_update_refreshes_the_norm_columns(self, test_engine):
+        with Session(test_engine) as session:
+            socio = _socio()
+            session.add(socio)
+            session.commit()
+
+            socio.nombre = "Íñigo"
+            socio.email = None
+            session.commit()
+
+            assert (socio.nombre_norm, socio.email_norm) == ("inigo", "")
+
+    def test_backfill_fills_rows_written_before_the_columns_existed(self, test_engine):
+        with Session(test_engine) as session:
+            session.add_all([_socio(), Log(accion="crear", descripcion_cambio="Edición")])
+            session.commit()
+        with test_engine.begin() as conn:
+            conn.execute(update(Socio.__table__).values(nombre_norm=None, apellidos_norm=None, email_norm=None))
+            conn.execute(update(Log.__table__).values(descripcion_norm=None))
+
+        with test_engine.begin() as conn:
+            assert backfill_normalized_columns(conn) == 2
+            assert backfill_normalized_columns(conn) == 0
+
+        with Session(test_engine) as session:
+            assert session.query(Socio.apellidos_norm).scalar() == "munoz pena"
+            assert session.query(Log.descripcion_norm).scalar() == "edicion"
+
+    def test_socio_picker_orders_by_folded_apellidos(self, test_engine):
+        with Session(test_engine) as session:
+            session.add_all(
+                [
+                    _socio(numero_socio="1001", nombre="Marta", apellidos="Zapata"),
+                    _socio(numero_socio="1002", nombre="Jorge", apellidos="Álvarez"),
+                    _socio(numero_socio="1003", nombre="Lucía", apellidos="Benítez"),
+                ]
+            )
+            session.commit()
+
+        rows = TransactionsService().list_socios_activos()
+
+        assert [r["apellidos"] for r in rows] == ["Álvarez", "Benítez", "Zapata"]
@@ -0,0 +1,164 @@
+"""Tests for the automatic período rollover (features/periodos/service.py)
+and the closed-período rules it relies on (PLAN.md 2.6)."""
+
+from __future__ import annotations
+
+import datetime
+import decimal
+
+from sqlalchemy.orm import Session
+
+from database import reference_cache
+from database.models import Log, Periodo, SaldoSocios, Socio, Transaccion
+from features.periodos.service import PeriodosService
+from features.saldos.service import rebuild_saldos
+from features.transactions.service import TransactionsService
+
+D = decimal.Decimal
+
+
+def _periodo(session, nombre, inicio, fin, estado="abierto") -> int:
+    periodo = Periodo(nombre=nombre, fecha_inicio=inicio, fecha_fin=fin, estado=estado)
+    session.add(periodo)
+    session.flush()
+    return periodo.id_periodo
+
+
+def _setup(engine) -> int:
+    """One family with a January período; returns its id."""
+    with Session(engine) as session:
+        session.add(Socio(numero_socio="1001", nombre="Marta", apellidos="Ruiz", estado="activo", es_titular=True))
+        id_enero = _periodo(session, "Enero 2026", datetime.date(2026, 1, 1), datetime.date(2026, 1, 31))
+        session.commit()
+        return id_enero
+
+
+def _tx(id_periodo, tipo, monto, fecha) -> dict:
+    return {
+        "numero_socio": "1001",
+        "id_periodo": id_periodo,
+        "id_metodo": None,
+        "tipo": tipo,
+        "monto": D(monto),
+        "fecha": fecha,
+        "referencia": None,
+    }
+
+
+def _periodos(engine):
+    with Session(engine) as session:
+        return [
+            (p.nombre, p.fecha_inicio, p.fecha_fin, p.estado)
+            for p in session.query(Periodo).order_by(Periodo.fecha_inicio)
+        ]
+
+
+class TestPeriodoEn:
+    def test_finds_the_covering_periodo(self, test_engine):
+        id_enero = _setup(test_engine)
+
+        assert reference_cache.periodo_en(datetime.date(2026, 1, 15))["id_periodo"] == id_enero
+        assert reference_cache.periodo_en(datetime.date(2026, 1, 31))["id_periodo"] == id_enero
+        assert reference_cache.periodo_en(datetime.date(2025, 12, 31)) is None
+        assert reference_cache.periodo_en(datetime.date(2026, 2, 1)) is None
+
+    def test_sees_periodos_added_later(self, test_engine):
+        _setup(test_engine)
+        assert reference_cache.periodo_en(datetime.date(2026, 2, 10)) is None
+
+        with Session(test_engine) as session:
+            id_febrero = _periodo(session, "Febrero", datetime.date(2026, 2, 1), datetime.date(2026, 2, 28))
+            session.commit()
+
+        assert reference_cache.periodo_en(datetime.date(2026, 2, 10))["id_periodo"] == id_febrero
+
+
+class TestRollover:
+    def test_noop_while_todays_periodo_is_open(self, test_engine):
+        _setup(test_engine)
+
+        assert PeriodosService().rollover(datetime.date(2026, 1, 20)) is None
+        assert len(_periodos(test_engine)) == 1
+
+    def test_creates_the_next_periodo_and_closes_the_past_one(self, test_engine):
+        id_enero = _setup(test_engine)
+        service = TransactionsService()
+        assert service.add_transaction(_tx(id_enero, "Cargo", "45.00", datetime.date(2026, 1, 5))) is not None
+
+        id_actual = PeriodosService().rollover(datetime.date(2026, 2, 3))
+
+        assert id_actual is not None
+        assert _periodos(test_engine) == [
+            ("Enero 2026", datetime.date(2026, 1, 1), datetime.date(2026, 1, 31), "cerrado"),
+            ("Febrero 2026", datetime.date(2026, 2, 1), datetime.date(2026, 2, 28), "abierto"),
+        ]
+        with Session(test_engine) as session:
+            saldo = session.query(SaldoSocios).filter_by(numero_socio="1001", id_periodo=id_actual).one()
+            assert (saldo.saldo_anterior, saldo.cargos, saldo.saldo_actual) == (D("45.00"), 0, D("45.00"))
+            log = session.query(Log).filter_by(accion="rollover").one()
+            assert "alta de 'Febrero 2026'" in log.descripcion_cambio
+            assert "cierre de 'Enero 2026'" in log.descripcion_cambio
+
+    def test_bridges_several_months(self, test_engine):
+        _setup(test_engine)
+
+        PeriodosService().rollover(datetime.date(2026, 4, 10))
+
+        assert [(nombre, estado) for nombre, _, _, estado in _periodos(test_engine)] == [
+            ("Enero 2026", "cerrado"),
+            ("Febrero 2026", "cerrado"),
+            ("Marzo 2026", "cerrado"),
+            ("Abril 2026", "abierto"),
+        ]
+
+    def test_closes_past_periodos_when_today_is_already_covered(self, test_engine):
+        _setup(test_engine)
+        with Session(test_engine) as session:
+            id_febrero = _periodo(session, "Febrero", datetime.date(2026, 2, 1), datetime.date(2026, 2, 28))
+            session.commit()
+
+        assert PeriodosService().rollover(datetime.date(2026, 2, 10)) == id_febrero
+        assert [estado for *_, estado in _periodos(test_engine)] == ["cerrado", "abierto"]
+
+    def test_first_periodo_starts_this_month(self, test_engine):
+        PeriodosService().rollover(datetime.date(2026, 3, 17))
+
+        assert _periodos(test_engine) == [
+            ("Marzo 2026", datetime.date(2026, 3, 1), datetime.date(2026, 3, 31), "abierto"),
+        ]
+
+
+class TestClosedPeriodos:
+    def _closed(self, engine) -> int:
+        id_enero = _setup(engine)
+        PeriodosService().rollover(datetime.date(2026, 2, 3))
+        return id_enero
+
+    def test_movements_into_a_closed_periodo_are_rejected(self, test_engine):
+        id_enero = self._closed(test_engine)
+        data = _tx(id_enero, "Cargo", "10.00", datetime.date(2026, 1, 5))
+        service = TransactionsService()
+
+        assert "cerrado" in service.validate_transaction(data)
+        results = service.add_transactions([data])
+        assert results[0][0] is None and "cerrado" in results[0][1]
+
+    def test_rebuild_keeps_closed_rows_frozen(self, test_engine):
+        id_enero = _setup(test_engine)
+        assert TransactionsService().add_transaction(_tx(id_enero, "Cargo", "45.00", datetime.date(2026, 1, 5)))
+        id_febrero = PeriodosService().rollover(datetime.date(2026, 2, 3))
+        # A row edited outside the app after the close: the closed snapshot
+        # wins over recomputing it from the ledger.
+        with Session(test_engine) as session:
+            session.query(Transaccion).update({Transaccion.monto: D("99.00")})
+            session.commit()
+
+        rebuild_saldos()
+        with Session(test_engine) as session:
+            saldo = session.query(SaldoSocios).filter_by(id_periodo=id_febrero).one()
+            assert saldo.saldo_anterior == D("45.00")
+
+        rebuild_saldos(include_closed=True)
+        with Session(test_engine) as session:
+            saldo = session.query(SaldoSocios).filter_by(id_periodo=id_febrero).one()
+            assert saldo.saldo_anterior == D("99.00")
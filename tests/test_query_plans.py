@@ -0,0 +1,184 @@
+"""EXPLAIN QUERY PLAN checks for the hot service queries, plus
+database/indexes.py's create-if-missing step.
+
+Each test records the SQL a service call actually runs (an engine
+before_cursor_execute listener), re-runs the statements that read the
+table under test through EXPLAIN QUERY PLAN, and asserts SQLite reads
+that table through an index - a SEARCH, or a SCAN ordered by an index -
+never a plain full-table SCAN.
+"""
+
+from __future__ import annotations
+
+import datetime
+import re
+from contextlib import contextmanager
+
+from sqlalchemy import event, inspect, text
+from sqlalchemy.orm import Session
+
+from database import reference_cache
+from database.indexes import ensure_indexes
+from database.models import Log, Periodo, Socio, Transaccion
+from features.deudores.service import DeudoresService
+from features.members.menu_service import MembersMenuService
+from features.members.toolbar_service import MembersService
+from features.saldos.service import SaldosService
+from features.settings.audit_log.service import AuditLogService
+from features.transactions.service import TransactionsService
+
+
+@contextmanager
+def _recorded_sql(engine):
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+
+def _plans_for(engine, statements, table):
+    """EXPLAIN QUERY PLAN detail lines mentioning `table`, per statement
+    that reads it."""
+    pattern = re.compile(rf"\b(FROM|JOIN)\s+{table}\b", re.IGNORECASE)
+    plans = []
+    raw = engine.raw_connection()
+    try:
+        for statement, parameters in statements:
+            if not pattern.search(statement):
+                continue
+            rows = raw.cursor().execute(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+            plans.append([row[-1] for row in rows if re.search(rf"\b{table}\b", row[-1])])
+    finally:
+        raw.close()
+    return plans
+
+
+def _assert_indexed(engine, statements, table, index=None):
+    plans = _plans_for(engine, statements, table)
+    assert plans, f"no statement read {table}"
+    for lines in plans:
+        assert lines, f"{table} missing from plan"
+        for line in lines:
+            assert "USING" in line, f"full scan: {line}"
+            if index:
+                assert index in line, f"expected {index}: {line}"
+
+
+def _seed(engine) -> int:
+    with Session(engine) as session:
+        periodo = Periodo(nombre="Enero", fecha_inicio=datetime.date(2025, 1, 1), fecha_fin=datetime.date(2025, 1, 31))
+        session.add(periodo)
+        session.add(Socio(numero_socio="1001", nombre="Marta", apellidos="Ruiz", estado="activo", es_titular=True))
+        session.flush()
+        session.add(Transaccion(numero_socio="1001", id_periodo=periodo.id_periodo, tipo="Cargo", monto=30))
+        session.add(Log(accion="crear", tabla_afectada="socios", descripcion_cambio="alta"))
+        session.commit()
+        return periodo.id_periodo
+
+
+class TestHotQueriesUseIndexes:
+    def test_refund_and_duplicate_checks(self, test_engine):
+        id_periodo = _seed(test_engine)
+        data = {
+            "numero_socio": "1001",
+            "id_periodo": id_periodo,
+            "id_metodo": None,
+            "tipo": "Reembolso",
+            "monto": 10,
+            "fecha": datetime.date(2025, 1, 10),
+            "referencia": None,
+        }
+        # The closed-período check reads the cached períodos snapshot;
+        # warm it so only the validation query itself is recorded.
+        reference_cache.periodos()
+        with _recorded_sql(test_engine) as statements:
+            TransactionsService().validate_transaction(data)
+
+        assert len(statements) == 1
+        _assert_indexed(test_engine, statements, "transacciones", "ix_transacciones_fingerprint")
+        _assert_indexed(test_engine, statements, "saldos_socios")
+
+    def test_transactions_list_order(self, test_engine):
+        id_periodo = _seed(test_engine)
+        service = TransactionsService()
+
+        with _recorded_sql(test_engine) as statements:
+            service.list_transactions_page()
+        _assert_indexed(test_engine, statements, "transacciones", "ix_transacciones_fecha_id")
+
+        with _recorded_sql(test_engine) as statements:
+            service.list_transactions_page(id_periodo=id_periodo)
+        _assert_indexed(test_engine, statements, "transacciones", "ix_transacciones_periodo_fecha_id")
+
+    def test_family_ledger(self, test_engine):
+        _seed(test_engine)
+
+        with _recorded_sql(test_engine) as statements:
+            SaldosService().family_ledger_page("1001")
+        _assert_indexed(test_engine, statements, "transacciones", "ix_transacciones_socio_fecha_id")
+
+    def test_debtor_list(self, test_engine):
+        _seed(test_engine)
+        service = DeudoresService()
+
+        with _recorded_sql(test_engine) as statements:
+            service.list_deudores()
+            service.list_deudores(solo_aviso=True)
+        _assert_indexed(test_engine, statements, "deudores", "ix_deudores_saldo")
+
+    def test_titular_lookups(self, test_engine):
+        _seed(test_engine)
+
+        with _recorded_sql(test_engine) as statements:
+            TransactionsService().has_titular("1001")
+            MembersService().get_titular("1001")
+
+        _assert_indexed(test_engine, statements, "socios", "ix_socios_numero_titular")
+
+    def test_active_socio_lists(self, test_engine):
+        _seed(test_engine)
+
+        with _recorded_sql(test_engine) as statements:
+            MembersMenuService().list_members_page()
+            TransactionsService().list_socios_activos()
+
+        _assert_indexed(test_engine, statements, "socios", "ix_socios_estado")
+
+    def test_audit_log_list(self, test_engine):
+        _seed(test_engine)
+        service = AuditLogService()
+
+        with _recorded_sql(test_engine) as statements:
+            service.list_log_rows()
+        _assert_indexed(test_engine, statements, "logs", "ix_logs_fecha_id")
+
+        with _recorded_sql(test_engine) as statements:
+            service.list_log_rows(tabla_afectada="socios")
+            service.list_tablas_afectadas()
+        _assert_indexed(test_engine, statements, "logs", "ix_logs_tabla_fecha_id")
+
+
+class TestEnsureIndexes:
+    def test_creates_missing_indexes_once(self, test_engine):
+        with test_engine.begin() as conn:
+            conn.execute(text("DROP INDEX ix_logs_fecha_id"))
+            conn.execute(text("DROP INDEX ix_socios_estado"))
+
+        assert ensure_indexes(test_engine) == ["ix_socios_estado", "ix_logs_fecha_id"]
+        assert ensure_indexes(test_engine) == []
+        names = {ix["name"] for ix in inspect(test_engine).get_indexes("logs")}
+        assert "ix_logs_fecha_id" in names
+
+    def test_limited_to_the_given_tables(self, test_engine):
+        with test_engine.begin() as conn:
+            conn.execute(text("DROP INDEX ix_logs_fecha_id"))
+            conn.execute(text("DROP INDEX ix_transacciones_fecha_id"))
+
+        assert ensure_indexes(test_engine, [Transaccion.__table__]) == ["ix_transacciones_fecha_id"]
@@ -0,0 +1,71 @@
+"""Tests for common.query_runner.QueryRunner.
+
+Results come back through a queued signal, so these need a Qt event loop:
+a bare QCoreApplication is enough (no widgets, no pytest-qt).
+"""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+from PySide6.QtCore import QCoreApplication
+
+from common.query_runner import QueryRunner
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+def _drain(runner: QueryRunner) -> None:
+    assert runner.wait(5000)
+    QCoreApplication.processEvents()
+
+
+class TestQueryRunner:
+    def test_runs_off_the_calling_thread_and_delivers_on_it(self, app):
+        runner = QueryRunner()
+        results = []
+
+        runner.submit(lambda: threading.get_ident(), on_result=lambda r: results.append((r, threading.get_ident())))
+        _drain(runner)
+
+        [(worker_thread, callback_thread)] = results
+        assert worker_thread != threading.get_ident()
+        assert callback_thread == threading.get_ident()
+        assert not runner.is_busy()
+
+    def test_only_the_latest_request_is_delivered(self, app):
+        runner = QueryRunner()
+        release = threading.Event()
+        results = []
+
+        runner.submit(release.wait, 5, on_result=lambda r: results.append("first"))
+        runner.submit(lambda: "second", on_result=results.append)
+        runner.submit(lambda: "third", on_result=results.append)
+        release.set()
+        _drain(runner)
+
+        assert results == ["third"]
+
+    def test_cancel_drops_the_running_request(self, app):
+        runner = QueryRunner()
+        results = []
+
+        runner.submit(lambda: "rows", on_result=results.append)
+        runner.cancel()
+        _drain(runner)
+
+        assert results == []
+
+    def test_a_failing_query_delivers_nothing(self, app):
+        runner = QueryRunner()
+        results = []
+
+        runner.submit(lambda: 1 / 0, on_result=results.append)
+        _drain(runner)
+
+        assert results == []
+        assert not runner.is_busy()
@@ -0,0 +1,98 @@
+"""Tests for database/reference_cache.py - the process-wide snapshot of
+metodos_pago/periodo/reglas_cobro and its write-through invalidation."""
+
+from __future__ import annotations
+
+import datetime
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from database import reference_cache
+from database.models import MetodoPago, Periodo
+from features.settings.metodos_pago.service import MetodosPagoService
+from features.settings.reglas_cobro.service import ReglasCobroService
+from features.settings.reset.service import ResetService
+from features.transactions.service import TransactionsService
+
+
+def _names(rows, key="nombre"):
+    return [r[key] for r in rows]
+
+
+class TestReferenceCache:
+    def test_serves_a_snapshot_until_invalidated(self, test_engine):
+        with test_engine.begin() as conn:
+            conn.execute(insert(MetodoPago).values(nombre="Efectivo", estado="activo"))
+        assert _names(reference_cache.metodos_pago()) == ["Efectivo"]
+
+        # A Core write bypasses the Session hooks, so the snapshot stays.
+        with test_engine.begin() as conn:
+            conn.execute(insert(MetodoPago).values(nombre="Bizum", estado="activo"))
+        assert _names(reference_cache.metodos_pago()) == ["Efectivo"]
+
+        before = reference_cache.version(reference_cache.METODOS_PAGO)
+        reference_cache.invalidate(reference_cache.METODOS_PAGO)
+
+        assert reference_cache.version(reference_cache.METODOS_PAGO) == before + 1
+        assert _names(reference_cache.metodos_pago()) == ["Bizum", "Efectivo"]
+
+    def test_callers_get_copies(self, test_engine):
+        MetodosPagoService().add_metodo_pago("Efectivo")
+
+        reference_cache.metodos_pago()[0]["nombre"] = "changed"
+
+        assert _names(reference_cache.metodos_pago()) == ["Efectivo"]
+
+    def test_service_writes_invalidate(self, test_engine):
+        metodos = MetodosPagoService()
+        transactions = TransactionsService()
+        assert transactions.list_metodos_pago_activos() == []
+
+        new_id = metodos.add_metodo_pago("Tarjeta")
+        assert _names(transactions.list_metodos_pago_activos()) == ["Tarjeta"]
+
+        metodos.set_metodo_pago_estado(new_id, "inactivo")
+        assert transactions.list_metodos_pago_activos() == []
+
+        reglas = ReglasCobroService()
+        assert reglas.list_reglas_cobro() == []
+        reglas.add_regla_cobro({"descripcion": "Cuota general"})
+        assert _names(reglas.list_reglas_cobro(), "descripcion") == ["Cuota general"]
+
+    def test_create_periodo_rapido_invalidates(self, test_engine):
+        service = TransactionsService()
+        assert service.list_periodos() == []
+
+        service.create_periodo_rapido("Enero", datetime.date(2025, 1, 1))
+
+        assert _names(service.list_periodos()) == ["Enero"]
+
+    def test_direct_orm_commit_invalidates_but_rollback_does_not(self, test_engine):
+        assert reference_cache.periodos() == []
+        version = reference_cache.version(reference_cache.PERIODOS)
+
+        with Session(test_engine) as session:
+            session.add(Periodo(nombre="Enero", fecha_inicio=datetime.date(2025, 1, 1), fecha_fin=datetime.date(2025, 1, 31)))
+            session.flush()
+            session.rollback()
+        assert reference_cache.version(reference_cache.PERIODOS) == version
+
+        with Session(test_engine) as session:
+            session.add(Periodo(nombre="Enero", fecha_inicio=datetime.date(2025, 1, 1), fecha_fin=datetime.date(2025, 1, 31)))
+            session.commit()
+        assert _names(reference_cache.periodos()) == ["Enero"]
+
+    def test_resets_invalidate(self, test_engine):
+        service = TransactionsService()
+        service.create_periodo_rapido("Enero", datetime.date(2025, 1, 1))
+        assert len(service.list_periodos()) == 1
+
+        # scoped_reset deletes with a bulk query().delete()
+        ResetService().scoped_reset()
+        assert service.list_periodos() == []
+
+        service.create_periodo_rapido("Febrero", datetime.date(2025, 2, 1))
+        assert len(service.list_periodos()) == 1
+        ResetService().full_reset()
+        assert service.list_periodos() == []
@@ -14,6 +14,7 @@ import decimal
 
 from sqlalchemy.orm import Session
 
+from database import socio_labels
 from database.models import Log, MetodoPago, Periodo, ReglaCobro, SaldoSocios, Socio, Transaccion
 from database.seed_db import METODOS_PAGO_FIJOS, seed_metodos_pago
 from features.settings.reset.service import ResetService
@@ -85,6 +86,14 @@ class TestFullReset:
             assert logs[0].accion == "reset_completo"
             assert logs[0].id_socio is None
 
+    def test_forgets_cached_family_names(self, test_engine):
+        _seed_full_dataset(test_engine)
+        assert socio_labels.display_name("1001") == "Marta Fernandez"
+
+        ResetService().full_reset()
+
+        assert socio_labels.display_name("1001") != "Marta Fernandez"
+
 
 class TestScopedReset:
     def test_clears_only_transacciones_saldos_and_periodos(self, test_engine):
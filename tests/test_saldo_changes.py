@@ -0,0 +1,49 @@
+"""Tests for database/saldo_changes.py, the SaldoSocios change feed."""
+
+from __future__ import annotations
+
+import datetime
+
+from sqlalchemy.orm import Session
+
+from database import saldo_changes
+from database.models import Periodo, Transaccion
+from features.saldos.service import rebuild_saldos
+
+
+class TestSaldoChanges:
+    def test_published_on_commit_only(self, test_engine):
+        desde = saldo_changes.version()
+        with Session(test_engine) as session:
+            saldo_changes.note_touched(session, [("1001", 1)])
+            session.rollback()
+        assert saldo_changes.touched_since(desde) == set()
+
+        with Session(test_engine) as session:
+            saldo_changes.note_touched(session, [("1001", 1), ("1001", 2)])
+            saldo_changes.note_touched(session, [("1002", 1)])
+            session.commit()
+        assert saldo_changes.touched_since(desde) == {("1001", 1), ("1001", 2), ("1002", 1)}
+
+    def test_wholesale_changes_invalidate_everything(self, test_engine):
+        with Session(test_engine) as session:
+            periodo = Periodo(nombre="Enero", fecha_inicio=datetime.date(2026, 1, 1), fecha_fin=datetime.date(2026, 1, 31))
+            session.add(periodo)
+            session.flush()
+            session.add(Transaccion(numero_socio="1001", id_periodo=periodo.id_periodo, tipo="Cargo", monto=30))
+            session.commit()
+        desde = saldo_changes.version()
+
+        rebuild_saldos()
+
+        assert saldo_changes.touched_since(desde) is None
+
+    def test_reader_behind_the_retained_history_recomputes_everything(self, test_engine):
+        desde = saldo_changes.version()
+        for i in range(saldo_changes._HISTORY + 1):
+            with Session(test_engine) as session:
+                saldo_changes.note_touched(session, [("1001", i)])
+                session.commit()
+
+        assert saldo_changes.touched_since(desde) is None
+        assert saldo_changes.touched_since(saldo_changes.version() - 1) == {("1001", saldo_changes._HISTORY)}
@@ -0,0 +1,290 @@
+"""Tests for the SaldoSocios balance engine (PLAN.md 2.5).
+
+Balances are maintained incrementally by TransactionsService.add_transaction
+(via features/saldos/service.py's apply_transaction), so these tests go
+through add_transaction - the real write path - and then assert the
+resulting SaldoSocios rows.
+"""
+
+from __future__ import annotations
+
+import datetime
+import decimal
+
+from sqlalchemy.orm import Session
+
+from database.models import MetodoPago, Periodo, SaldoSocios, Socio
+from features.saldos.service import SaldosService, rebuild_saldos
+from features.transactions.service import TransactionsService
+
+D = decimal.Decimal
+
+
+def _setup(session, periodos=(("Enero", 1), ("Febrero", 2), ("Marzo", 3))) -> dict:
+    socio = Socio(numero_socio="1001", nombre="Marta", apellidos="Fernandez", estado="activo", es_titular=True)
+    metodo = MetodoPago(nombre="EFECTIVO", estado="activo")
+    session.add_all([socio, metodo])
+    ids = {}
+    for nombre, month in periodos:
+        periodo = Periodo(
+            nombre=nombre,
+            fecha_inicio=datetime.date(2026, month, 1),
+            fecha_fin=datetime.date(2026, month, 28),
+            estado="abierto",
+        )
+        session.add(periodo)
+        session.flush()
+        ids[nombre] = periodo.id_periodo
+    session.commit()
+    return {"id_metodo": metodo.id_metodo, "periodos": ids}
+
+
+def _tx(ctx: dict, periodo: str, tipo: str, monto: str, day: int = 5, numero_socio: str = "1001") -> dict:
+    month = {"Enero": 1, "Febrero": 2, "Marzo": 3}[periodo]
+    return {
+        "numero_socio": numero_socio,
+        "id_periodo": ctx["periodos"][periodo],
+        "id_metodo": ctx["id_metodo"],
+        "tipo": tipo,
+        "monto": D(monto),
+        "fecha": datetime.date(2026, month, day),
+        "referencia": None,
+    }
+
+
+def _saldo(engine, ctx: dict, periodo: str, numero_socio: str = "1001") -> SaldoSocios:
+    with Session(engine) as session:
+        return (
+            session.query(SaldoSocios)
+            .filter_by(numero_socio=numero_socio, id_periodo=ctx["periodos"][periodo])
+            .one_or_none()
+        )
+
+
+class TestApplyTransaction:
+    def test_first_movement_creates_the_saldo_row(self, test_engine):
+        with Session(test_engine) as session:
+            ctx = _setup(session)
+
+        TransactionsService().add_transaction(_tx(ctx, "Enero", "Cargo", "45.00"))
+
+        saldo = _saldo(test_engine, ctx, "Enero")
+        assert saldo is not None
+        assert saldo.saldo_anterior == D("0")
+        assert saldo.cargos == D("45.00")
+        assert saldo.saldo_actual == D("45.00")
+
+    def test_formula_covers_every_tipo(self, test_engine):
+        with Session(test_engine) as session:
+            ctx = _setup(session)
+        service = TransactionsService()
+
+        service.add_transaction(_tx(ctx, "Enero", "Cargo", "45.00", day=1))
+        service.add_transaction(_tx(ctx, "Enero", "Pago", "45.00", day=2))
+        service.add_transaction(_tx(ctx, "Enero", "Reembolso", "5.00", day=3))
+        service.add_transaction(_tx(ctx, "Enero", "Devolución", "45.00", day=4))
+
+        saldo = _saldo(test_engine, ctx, "Enero")
+        assert (saldo.cargos, saldo.pagos, saldo.reembolsos, saldo.devoluciones) == (
+            D("45.00"), D("45.00"), D("5.00"), D("45.00"),
+        )
+        # 0 + 45 - 45 - 5 + 45
+        assert saldo.saldo_actual == D("40.00")
+
+    def test_new_periodo_row_carries_previous_saldo_forward(self, test_engine):
+        with Session(test_engine) as session:
+            ctx = _setup(session)
+        service = TransactionsService()
+
+        service.add_transaction(_tx(ctx, "Enero", "Cargo", "45.00"))
+        service.add_transaction(_tx(ctx, "Marzo", "Cargo", "45.00"))
+
+        marzo = _saldo(test_engine, ctx, "Marzo")
+        assert marzo.saldo_anterior == D("45.00")
+        assert marzo.saldo_actual == D("90.00")
+        # Febrero had no movement, so no row - the chain skips it.
+        assert _saldo(test_engine, ctx, "Febrero") is None
+
+    def test_late_entry_propagates_to_later_periodos(self, test_engine):
+        with Session(test_engine) as session:
+            ctx = _setup(session)
+        service = TransactionsService()
+        service.add_transaction(_tx(ctx, "Enero", "Cargo", "45.00"))
+        service.add_transaction(_tx(ctx, "Febrero", "Cargo", "45.00"))
+        service.add_transaction(_tx(ctx, "Marzo", "Cargo", "45.00"))
+
+        service.add_transaction(_tx(ctx, "Enero", "Pago", "30.00", day=20))
+
+        assert _saldo(test_engine, ctx, "Enero").saldo_actual == D("15.00")
+        febrero = _saldo(test_engine, ctx, "Febrero")
+        assert (febrero.saldo_anterior, febrero.saldo_actual) == (D("15.00"), D("60.00"))
+        marzo = _saldo(test_engine, ctx, "Marzo")
+        assert (marzo.saldo_anterior, marzo.saldo_actual) == (D("60.00"), D("105.00"))
+
+    def test_families_are_independent(self, test_engine):
+        with Session(test_engine) as session:
+            ctx = _setup(session)
+            session.add(Socio(numero_socio="1002", nombre="Jorge", apellidos="Dominguez", estado="activo", es_titular=True))
+            session.commit()
+        service = TransactionsService()
+
+        service.add_transaction(_tx(ctx, "Enero", "Cargo", "45.00"))
+        service.add_transaction(_tx(ctx, "Enero", "Cargo", "30.00", numero_socio="1002"))
+
+        assert _saldo(test_engine, ctx, "Enero").saldo_actual == D("45.00")
+        assert _saldo(test_engine, ctx, "Enero", numero_socio="1002").saldo_actual == D("30.00")
+
+    def test_rejected_transaction_leaves_saldos_untouched(self, test_engine):
+        with Session(test_engine) as session:
+            ctx = _setup(session)
+
+        new_id = TransactionsService().add_transaction(_tx(ctx, "Enero", "Reembolso", "10.00"))
+
+        assert new_id is None
+        assert _saldo(test_engine, ctx, "Enero") is None
+
+
+class TestApplyTransactions:
+    def test_batch_matches_a_full_rebuild(self, test_engine):
+        with Session(test_engine) as session:
+            ctx = _setup(session)
+            session.add(Socio(numero_socio="1002", nombre="Jorge", apellidos="Dominguez", estado="activo", es_titular=True))
+            session.commit()
+        service = TransactionsService()
+        service.add_transaction(_tx(ctx, "Marzo", "Cargo", "45.00", day=1))
+
+        # Late Enero/Febrero entries must shift the existing Marzo row;
+        # 1002 starts from nothing.
+        results = service.add_transactions([
+            _tx(ctx, "Febrero", "Cargo", "20.00"),
+            _tx(ctx, "Enero", "Cargo", "45.00", day=1),
+            _tx(ctx, "Enero", "Pago", "30.00", day=2),
+            _tx(ctx, "Enero", "Reembolso", "5.00", day=3),
+            _tx(ctx, "Febrero", "Cargo", "30.00", numero_socio="1002"),
+            _tx(ctx, "Febrero", "Devolución", "10.00", numero_socio="1002"),
+        ])
+        assert all(error is None for _, error in results)
+        marzo = _saldo(test_engine, ctx, "Marzo")
+        # Enero 45 - 30 - 5 = 10, Febrero +20, carried into Marzo: 30 + 45
+        assert (marzo.saldo_anterior, marzo.saldo_actual) == (D("30.00"), D("75.00"))
+
+        with Session(test_engine) as session:
+            incremental = sorted(
+                (s.numero_socio, s.id_periodo, s.saldo_anterior, s.saldo_actual)
+                for s in session.query(SaldoSocios).all()
+            )
+        rebuild_saldos()
+        with Session(test_engine) as session:
+            rebuilt = sorted(
+                (s.numero_socio, s.id_periodo, s.saldo_anterior, s.saldo_actual)
+                for s in session.query(SaldoSocios).all()
+            )
+        assert incremental == rebuilt
+
+
+class TestRebuildSaldos:
+    def _ledger(self, test_engine) -> dict:
+        with Session(test_engine) as session:
+            ctx = _setup(session)
+            session.add(Socio(numero_socio="1002", nombre="Jorge", apellidos="Dominguez", estado="activo", es_titular=True))
+            session.commit()
+        service = TransactionsService()
+        service.add_transaction(_tx(ctx, "Enero", "Cargo", "45.00", day=1))
+        service.add_transaction(_tx(ctx, "Enero", "Pago", "30.00", day=2))
+        service.add_transaction(_tx(ctx, "Enero", "Reembolso", "5.00", day=3))
+        service.add_transaction(_tx(ctx, "Marzo", "Cargo", "45.00", day=1))
+        service.add_transaction(_tx(ctx, "Febrero", "Cargo", "30.00", numero_socio="1002"))
+        service.add_transaction(_tx(ctx, "Febrero", "Devolución", "10.00", numero_socio="1002"))
+        return ctx
+
+    def _snapshot(self, engine) -> list:
+        with Session(engine) as session:
+            return sorted(
+                (s.numero_socio, s.id_periodo, s.saldo_anterior, s.cargos, s.pagos,
+                 s.reembolsos, s.devoluciones, s.saldo_actual)
+                for s in session.query(SaldoSocios).all()
+            )
+
+    def test_rebuild_matches_incremental_balances(self, test_engine):
+        self._ledger(test_engine)
+        expected = self._snapshot(test_engine)
+        with Session(test_engine) as session:
+            session.query(SaldoSocios).update({SaldoSocios.saldo_actual: D("999"), SaldoSocios.cargos: D("0")})
+            session.commit()
+
+        assert rebuild_saldos(chunk_size=1) == 2
+        assert self._snapshot(test_engine) == expected
+
+    def test_rebuild_recreates_deleted_rows_and_reports_progress(self, test_engine):
+        ctx = self._ledger(test_engine)
+        with Session(test_engine) as session:
+            session.query(SaldoSocios).delete()
+            session.commit()
+        calls = []
+
+        total = SaldosService().rebuild_saldos(progress=lambda done, total: calls.append((done, total)))
+
+        assert total == 2
+        assert calls[-1] == (2, 2)
+        marzo = _saldo(test_engine, ctx, "Marzo")
+        # Enero 45 - 30 - 5 = 10, carried into Marzo: 10 + 45
+        assert (marzo.saldo_anterior, marzo.saldo_actual) == (D("10.00"), D("55.00"))
+        assert _saldo(test_engine, ctx, "Febrero", numero_socio="1002").saldo_actual == D("40.00")
+
+
+class TestFamilyLedger:
+    def _seed(self, engine) -> dict:
+        with Session(engine) as session:
+            ctx = _setup(session)
+            session.add(Socio(numero_socio="1002", nombre="Jorge", apellidos="Gil", estado="activo", es_titular=True))
+            session.commit()
+        service = TransactionsService()
+        for periodo, tipo, monto, day in (
+            ("Enero", "Cargo", "45.00", 5),
+            ("Enero", "Pago", "45.00", 20),
+            ("Febrero", "Cargo", "45.00", 5),
+            ("Febrero", "Devolución", "45.00", 9),
+            ("Marzo", "Pago", "10.00", 3),
+        ):
+            service.add_transaction(_tx(ctx, periodo, tipo, monto, day=day))
+        service.add_transaction(_tx(ctx, "Enero", "Cargo", "99.00", numero_socio="1002"))
+        return ctx
+
+    def test_running_balance_most_recent_first(self, test_engine):
+        ctx = self._seed(test_engine)
+
+        rows, next_token = SaldosService().family_ledger_page("1001")
+
+        assert next_token is None
+        assert [(r[2], r[4]) for r in rows] == [
+            ("Pago", D("80.00")),
+            ("Devolución", D("90.00")),
+            ("Cargo", D("45.00")),
+            ("Pago", D("0.00")),
+            ("Cargo", D("45.00")),
+        ]
+        # Agrees with the SaldoSocios chain's final balance.
+        assert rows[0][4] == _saldo(test_engine, ctx, "Marzo").saldo_actual
+
+    def test_pages_keep_the_balance_of_the_whole_history(self, test_engine):
+        self._seed(test_engine)
+        service = SaldosService()
+
+        first, token = service.family_ledger_page("1001", page_size=2)
+        second, token = service.family_ledger_page("1001", after=token, page_size=2)
+        third, token = service.family_ledger_page("1001", after=token, page_size=2)
+
+        assert token is None
+        assert [r[4] for r in first + second + third] == [r[4] for r in service.family_ledger_page("1001")[0]]
+
+    def test_name_follows_the_current_titular(self, test_engine):
+        self._seed(test_engine)
+        service = SaldosService()
+        assert service.family_name("1001") == "Marta Fernandez"
+
+        with Session(test_engine) as session:
+            session.query(Socio).filter_by(numero_socio="1001").one().es_titular = False
+            session.add(Socio(numero_socio="1001", nombre="Lucia", apellidos="Fernandez", estado="activo", es_titular=True))
+            session.commit()
+
+        assert service.family_name("1001") == "Lucia Fernandez"
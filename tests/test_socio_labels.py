@@ -0,0 +1,121 @@
+"""Tests for the materialized family labels (database/socio_labels.py).
+
+etiquetas_socio is derived from socios by a Session after_flush listener,
+so these tests write Socio rows through a plain Session - no service - and
+check the derived rows follow.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy.orm import Session
+
+from database.models import EtiquetaSocio, Socio
+from database.socio_labels import rebuild_labels
+
+
+def _labels(engine) -> dict:
+    with Session(engine) as session:
+        return {e.numero_socio: (e.nombre, e.etiqueta_norm) for e in session.query(EtiquetaSocio).all()}
+
+
+def _socio(numero_socio: str, nombre: str, apellidos: str, es_titular: bool = False) -> Socio:
+    return Socio(numero_socio=numero_socio, nombre=nombre, apellidos=apellidos, estado="activo", es_titular=es_titular)
+
+
+class TestSocioLabels:
+    def test_insert_creates_an_accent_folded_label(self, test_engine):
+        with Session(test_engine) as session:
+            session.add(_socio("1001", "Álvaro", "Muñoz"))
+            session.commit()
+
+        assert _labels(test_engine) == {"1001": ("Álvaro Muñoz", "1001 · alvaro munoz")}
+
+    def test_titular_wins_over_lower_id(self, test_engine):
+        with Session(test_engine) as session:
+            session.add(_socio("1001", "Jorge", "Fernandez"))
+            session.flush()
+            marta = _socio("1001", "Marta", "Fernandez")
+            session.add(marta)
+            session.commit()
+            assert _labels(test_engine)["1001"][0] == "Jorge Fernandez"
+
+            marta.es_titular = True
+            session.commit()
+
+        assert _labels(test_engine)["1001"][0] == "Marta Fernandez"
+
+    def test_moving_a_socio_refreshes_both_families(self, test_engine):
+        with Session(test_engine) as session:
+            jorge = _socio("1001", "Jorge", "Fernandez")
+            session.add_all([jorge, _socio("1001", "Marta", "Fernandez", es_titular=True)])
+            session.commit()
+            assert _labels(test_engine)["1001"][0] == "Marta Fernandez"
+
+            jorge.numero_socio = "1002"
+            session.commit()
+
+        labels = _labels(test_engine)
+        assert labels["1001"][0] == "Marta Fernandez"
+        assert labels["1002"][0] == "Jorge Fernandez"
+
+    def test_rolled_back_write_leaves_no_label(self, test_engine):
+        with Session(test_engine) as session:
+            session.add(_socio("1001", "Marta", "Fernandez"))
+            session.flush()
+            session.rollback()
+
+        assert _labels(test_engine) == {}
+
+    def test_rebuild_backfills_missing_rows(self, test_engine):
+        with Session(test_engine) as session:
+            session.add(_socio("1001", "Marta", "Fernandez"))
+            session.commit()
+        with test_engine.begin() as conn:
+            conn.execute(EtiquetaSocio.__table__.delete())
+
+        with test_engine.begin() as conn:
+            rebuild_labels(conn)
+
+        assert _labels(test_engine) == {"1001": ("Marta Fernandez", "1001 · marta fernandez")}
+
+
+class TestDisplayNames:
+    def test_index_follows_commits_without_reloading(self, test_engine):
+        from database import socio_labels
+
+        with Session(test_engine) as session:
+            jorge = _socio("1001", "Jorge", "Fernandez")
+            session.add(jorge)
+            session.commit()
+            assert socio_labels.display_names({"1001", "9999"}) == {"1001": "Jorge Fernandez"}
+
+            loaded = socio_labels._names
+            session.add(_socio("1001", "Marta", "Fernandez", es_titular=True))
+            session.add(_socio("1002", "Lucía", "Pena"))
+            session.commit()
+
+            # Patched copy-on-write, so a reader holding the old dict (e.g. a
+            # page load on a worker thread) never sees it change.
+            assert socio_labels._names is not loaded
+            assert loaded == {"1001": "Jorge Fernandez"}
+            assert socio_labels.display_name("1001") == "Marta Fernandez"
+            assert socio_labels.display_name("1002") == "Lucía Pena"
+
+            session.delete(session.query(Socio).filter_by(numero_socio="1002").one())
+            session.commit()
+
+        assert socio_labels.display_name("1002") == ""
+
+    def test_rolled_back_changes_never_reach_the_index(self, test_engine):
+        from database import socio_labels
+
+        with Session(test_engine) as session:
+            session.add(_socio("1001", "Jorge", "Fernandez"))
+            session.commit()
+            assert socio_labels.display_name("1001") == "Jorge Fernandez"
+
+            session.query(Socio).one().nombre = "Pablo"
+            session.flush()
+            session.rollback()
+
+        assert socio_labels.display_name("1001") == "Jorge Fernandez"
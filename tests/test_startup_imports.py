@@ -0,0 +1,95 @@
+"""Startup import budget and the deferred-import helpers
+(common/lazy_view.py).
+
+The main window must come up without importing any feature screen or the
+database layer - those load on first navigation. Checked with
+`python -X importtime` in a fresh interpreter, since this process has
+long since imported everything.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from common.lazy_view import lazy_exports, lazy_view, prefetch
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+# ui.main_window's cumulative import time, as a multiple of bare PySide6's
+# - a ratio, so the budget holds on slow and fast machines alike. About
+# 1.4x today; importing the feature screens eagerly put it near 5x.
+IMPORT_BUDGET_RATIO = 2.5
+
+
+def _importtime(statement: str):
+    """{module: cumulative microseconds} for running `statement` in a
+    fresh interpreter with src/ on the path."""
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen", PYTHONPATH=str(SRC))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=SRC,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestStartupImports:
+    def test_main_window_loads_no_feature_or_database_module(self):
+        times = _importtime("import ui.main_window")
+
+        eager = sorted(name for name in times if name.split(".")[0] in ("features", "database"))
+        assert eager == []
+
+    def test_main_window_import_budget(self):
+        baseline = _importtime("import PySide6.QtCore, PySide6.QtGui, PySide6.QtWidgets")
+        qt = sum(baseline[name] for name in ("PySide6", "PySide6.QtCore", "PySide6.QtGui", "PySide6.QtWidgets"))
+
+        main_window = _importtime("import ui.main_window")["ui.main_window"]
+
+        assert main_window <= IMPORT_BUDGET_RATIO * qt, f"{main_window}us vs PySide6 {qt}us"
+
+
+def _write_module(tmp_path, monkeypatch, name: str) -> None:
+    (tmp_path / f"{name}.py").write_text("def show(main_window):\n    return ('shown', main_window)\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, name, raising=False)
+
+
+class TestLazyView:
+    def test_imports_on_first_call(self, tmp_path, monkeypatch):
+        _write_module(tmp_path, monkeypatch, "lazy_target")
+
+        show = lazy_view("lazy_target", "show")
+
+        assert "lazy_target" not in sys.modules
+        assert show("ventana") == ("shown", "ventana")
+        assert "lazy_target" in sys.modules
+
+    def test_lazy_exports(self, tmp_path, monkeypatch):
+        _write_module(tmp_path, monkeypatch, "lazy_target")
+        getattr_ = lazy_exports("paquete", {"show": "lazy_target"})
+
+        assert getattr_("show")("x") == ("shown", "x")
+        with pytest.raises(AttributeError):
+            getattr_("otro")
+
+    def test_prefetch_imports_in_the_background(self, tmp_path, monkeypatch):
+        _write_module(tmp_path, monkeypatch, "lazy_target")
+
+        prefetch(["lazy_target", "no_such_module_xyz"]).join(timeout=10)
+
+        assert "lazy_target" in sys.modules
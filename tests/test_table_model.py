@@ -0,0 +1,96 @@
+"""Tests for common.table_model.RowTableModel.
+
+A QAbstractTableModel is a plain QObject, so like test_table_sort.py these
+run without a QApplication.
+"""
+
+from __future__ import annotations
+
+from PySide6.QtCore import Qt
+
+from common.table_model import RowTableModel
+
+
+class TestRowTableModel:
+    def test_set_rows_replaces_headers_and_rows(self):
+        model = RowTableModel(["a"])
+        model.set_rows(["id", "nombre"], [(1, "Marta"), (2, "Jorge")])
+
+        assert model.rowCount() == 2
+        assert model.columnCount() == 2
+        assert model.headers() == ["id", "nombre"]
+        assert model.headerData(1, Qt.Orientation.Horizontal) == "nombre"
+
+    def test_cells_render_as_text_with_none_as_empty(self):
+        model = RowTableModel()
+        model.set_rows(["id", "email"], [(7, None)])
+
+        assert model.index(0, 0).data() == "7"
+        assert model.text(0, 1) == ""
+        assert model.text(5, 0) == ""
+
+    def test_append_rows_keeps_existing_rows(self):
+        model = RowTableModel()
+        model.set_rows(["id"], [(1,)])
+        model.append_rows([(2,), (3,)])
+
+        assert [model.text(r, 0) for r in range(model.rowCount())] == ["1", "2", "3"]
+
+    def test_cells_are_not_editable(self):
+        model = RowTableModel()
+        model.set_rows(["id"], [(1,)])
+
+        assert not model.flags(model.index(0, 0)) & Qt.ItemFlag.ItemIsEditable
+
+
+class TestSortRows:
+    @staticmethod
+    def _column(model, column=0):
+        return [model.text(r, column) for r in range(model.rowCount())]
+
+    def test_sorts_view_without_touching_load_order(self):
+        model = RowTableModel()
+        model.set_rows(["apellidos"], [("Ruiz",), ("Álvarez",), ("Pérez",)])
+
+        model.sort_rows(0, str.casefold)
+
+        assert self._column(model) == ["Pérez", "Ruiz", "Álvarez"]
+        model.clear_order()
+        assert self._column(model) == ["Ruiz", "Álvarez", "Pérez"]
+
+    def test_descending_and_stable_on_previous_order(self):
+        model = RowTableModel()
+        model.set_rows(["familia", "nombre"], [("2", "b"), ("1", "a"), ("2", "a"), ("1", "b")])
+
+        model.sort_rows(1, str)
+        model.sort_rows(0, int, descending=True)
+
+        assert [(model.text(r, 0), model.text(r, 1)) for r in range(4)] == [
+            ("2", "a"), ("2", "b"), ("1", "a"), ("1", "b"),
+        ]
+
+    def test_keys_are_cached_until_the_next_load(self):
+        calls = []
+
+        def key(value):
+            calls.append(value)
+            return value
+
+        model = RowTableModel()
+        model.set_rows(["id"], [("b",), ("a",)])
+        model.sort_rows(0, key)
+        model.sort_rows(0, key, descending=True)
+        assert len(calls) == 2
+
+        model.set_rows(["id"], [("c",), ("d",)])
+        assert self._column(model) == ["c", "d"]
+        model.sort_rows(0, key)
+        assert len(calls) == 4
+
+    def test_appended_rows_land_below_the_sorted_rows(self):
+        model = RowTableModel()
+        model.set_rows(["id"], [("2",), ("1",)])
+        model.sort_rows(0, int)
+        model.append_rows([("0",)])
+
+        assert self._column(model) == ["1", "2", "0"]
@@ -185,20 +185,12 @@ class _FakeModel:
     def rowCount(self) -> int:
         return len(self.rows)
 
-    def removeRows(self, start: int, count: int) -> None:
-        self.rows = []
+    def set_rows(self, headers, rows) -> None:
+        self.headers = [str(h) for h in headers]
+        self.rows = [["" if v is None else str(v) for v in row] for row in rows]
 
-    def setColumnCount(self, count: int) -> None:
-        pass
-
-    def setRowCount(self, count: int) -> None:
-        pass
-
-    def setHorizontalHeaderLabels(self, labels: list[str]) -> None:
-        self.headers = list(labels)
-
-    def appendRow(self, items) -> None:
-        self.rows.append([item.text() for item in items])
+    def append_rows(self, rows) -> None:
+        self.rows.extend(["" if v is None else str(v) for v in row] for row in rows)
 
 
 class TestListTransactionsPrefersTitularName:
@@ -1,9 +1,10 @@
 """Tests for TransactionsService (PLAN.md 2.4).
 
 Covers the lookup helpers that back TransactionDialog's dropdowns, the
-minimal período quick-create, and add_transaction's persistence + audit
-log. Integrity validation (refund-without-payment, duplicate detection)
-and balance recalculation get their own tests once those build steps land.
+minimal período quick-create, add_transaction's persistence + audit log,
+add_transactions' batch path, the generate_cuotas dues run,
+correct_transaction's contra-entries, and both integrity rules
+(refund-without-payment, duplicate detection).
 """
 
 from __future__ import annotations
@@ -13,8 +14,9 @@ import decimal
 
 from sqlalchemy.orm import Session
 
-from database.models import Log, MetodoPago, Periodo, Socio, Transaccion
-from features.transactions.service import TransactionsService
+from database import saldo_changes
+from database.models import Log, MetodoPago, Periodo, ReglaCobro, SaldoSocios, Socio, Transaccion
+from features.transactions.service import CORRECCION_REFERENCIA, CUOTA_REFERENCIA, TransactionsService
 
 
 def _make_socio(session, **overrides) -> Socio:
@@ -41,11 +43,9 @@ def _make_metodo(session, **overrides) -> MetodoPago:
 
 
 class _FakeModel:
-    """Minimal stand-in for QStandardItemModel, no QApplication needed.
-
-    Same shape as test_members_menu_service.py's _FakeModel - list_transactions
-    only calls removeRows/setColumnCount/setRowCount/
-    setHorizontalHeaderLabels/appendRow.
+    """Minimal stand-in for common.table_model.RowTableModel - the services
+    only call set_rows/append_rows, stored here as display strings the
+    same way RowTableModel.text() renders them.
     """
 
     def __init__(self) -> None:
@@ -55,20 +55,12 @@ class _FakeModel:
     def rowCount(self) -> int:
         return len(self.rows)
 
-    def removeRows(self, start: int, count: int) -> None:
-        self.rows = []
-
-    def setColumnCount(self, count: int) -> None:
-        pass
-
-    def setRowCount(self, count: int) -> None:
-        pass
+    def set_rows(self, headers, rows) -> None:
+        self.headers = [str(h) for h in headers]
+        self.rows = [["" if v is None else str(v) for v in row] for row in rows]
 
-    def setHorizontalHeaderLabels(self, labels: list[str]) -> None:
-        self.headers = list(labels)
-
-    def appendRow(self, items) -> None:
-        self.rows.append([item.text() for item in items])
+    def append_rows(self, rows) -> None:
+        self.rows.extend(["" if v is None else str(v) for v in row] for row in rows)
 
 
 def _make_periodo(session, **overrides) -> Periodo:
@@ -277,6 +269,284 @@ class TestDuplicateTransactionRejection:
             assert session.query(Transaccion).count() == 1
 
 
+class TestAddTransactions:
+    def _base_data(self, session) -> dict:
+        socio = _make_socio(session)
+        metodo = _make_metodo(session)
+        periodo = _make_periodo(session)
+        session.commit()
+        return {
+            "numero_socio": socio.numero_socio,
+            "id_socio_log": socio.id_socio,
+            "id_periodo": periodo.id_periodo,
+            "id_metodo": metodo.id_metodo,
+            "tipo": "Cargo",
+            "monto": decimal.Decimal("45.00"),
+            "fecha": datetime.date(2026, 1, 5),
+            "referencia": None,
+        }
+
+    def test_returns_a_result_per_item_and_keeps_the_valid_ones(self, test_engine):
+        service = TransactionsService()
+        with Session(test_engine) as session:
+            data = self._base_data(session)
+        existing_id = service.add_transaction(data)
+
+        results = service.add_transactions([
+            dict(data, fecha=datetime.date(2026, 1, 6)),
+            data,
+            dict(data, tipo="Reembolso", monto=decimal.Decimal("10.00")),
+            dict(data, fecha=datetime.date(2026, 1, 7)),
+        ])
+
+        assert [error is None for _, error in results] == [True, False, False, True]
+        assert "idéntica" in results[1][1]
+        assert "reembolsar" in results[2][1]
+        with Session(test_engine) as session:
+            ids = [row[0] for row in session.query(Transaccion.id_transaccion).order_by(Transaccion.id_transaccion)]
+            assert ids == [existing_id, results[0][0], results[3][0]]
+
+    def test_rejects_repeats_within_the_batch(self, test_engine):
+        with Session(test_engine) as session:
+            data = self._base_data(session)
+
+        results = TransactionsService().add_transactions([data, dict(data)])
+
+        assert results[0][1] is None
+        assert "lote repite" in results[1][1]
+        with Session(test_engine) as session:
+            assert session.query(Transaccion).count() == 1
+
+    def test_refund_can_be_covered_by_a_pago_earlier_in_the_batch(self, test_engine):
+        with Session(test_engine) as session:
+            data = self._base_data(session)
+        pago = dict(data, tipo="Pago", monto=decimal.Decimal("45.00"))
+
+        results = TransactionsService().add_transactions([
+            dict(pago, tipo="Reembolso", monto=decimal.Decimal("5.00"), fecha=datetime.date(2026, 1, 4)),
+            pago,
+            dict(pago, tipo="Reembolso", monto=decimal.Decimal("40.00"), fecha=datetime.date(2026, 1, 6)),
+            dict(pago, tipo="Reembolso", monto=decimal.Decimal("5.01"), fecha=datetime.date(2026, 1, 7)),
+        ])
+
+        assert [error is None for _, error in results] == [False, True, True, False]
+        assert "5.00€ disponibles" in results[3][1]
+
+    def test_writes_one_summary_log_row(self, test_engine):
+        with Session(test_engine) as session:
+            data = self._base_data(session)
+
+        results = TransactionsService().add_transactions(
+            [dict(data, fecha=datetime.date(2026, 1, day)) for day in (1, 2, 3)]
+            + [dict(data, tipo="Pago", monto=decimal.Decimal("20.00"))]
+        )
+
+        with Session(test_engine) as session:
+            [log] = session.query(Log).filter_by(tabla_afectada="transacciones").all()
+            assert log.id_socio is None
+            assert log.descripcion_cambio == (
+                f"Alta en lote de 4 movimiento(s), ids {results[0][0]}-{results[3][0]}: "
+                "3 Cargo (135.00€), 1 Pago (20.00€)"
+            )
+
+    def test_nothing_to_write_writes_nothing(self, test_engine):
+        service = TransactionsService()
+        assert service.add_transactions([]) == []
+
+        with Session(test_engine) as session:
+            data = self._base_data(session)
+        results = service.add_transactions([dict(data, monto=None)])
+
+        assert results == [(None, "Faltan el tipo o el monto del movimiento.")]
+        with Session(test_engine) as session:
+            assert session.query(Log).count() == 0
+
+
+class TestGenerateCuotas:
+    def _seed(self, session, cuota="42.00", descuento=None) -> int:
+        _make_socio(session, numero_socio="1001", es_titular=True)
+        _make_socio(session, numero_socio="1001", nombre="Lucia", es_titular=False)
+        _make_socio(session, numero_socio="1002", nombre="Jorge", es_titular=True)
+        _make_socio(session, numero_socio="1003", nombre="Ana", es_titular=True, estado="inactivo")
+        _make_socio(session, numero_socio="1004", nombre="Luis", es_titular=False)
+        session.add(ReglaCobro(descripcion="Cuota general", cuota_mensual=decimal.Decimal(cuota), descuento=descuento, estado="activo"))
+        periodo = _make_periodo(session)
+        session.commit()
+        return periodo.id_periodo
+
+    def _cargos(self, engine) -> list:
+        with Session(engine) as session:
+            return sorted(
+                (t.numero_socio, t.monto, t.fecha, t.referencia)
+                for t in session.query(Transaccion).filter_by(tipo="Cargo")
+            )
+
+    def test_charges_each_active_family_with_a_titular_once(self, test_engine):
+        with Session(test_engine) as session:
+            id_periodo = self._seed(session)
+
+        resultado = TransactionsService().generate_cuotas(id_periodo)
+
+        assert resultado == {"creados": 2, "omitidos": 0, "monto": decimal.Decimal("42.00"), "error": None}
+        fecha = datetime.date(2026, 1, 1)
+        assert self._cargos(test_engine) == [
+            ("1001", decimal.Decimal("42.00"), fecha, CUOTA_REFERENCIA),
+            ("1002", decimal.Decimal("42.00"), fecha, CUOTA_REFERENCIA),
+        ]
+        with Session(test_engine) as session:
+            assert session.query(SaldoSocios).filter_by(numero_socio="1002").one().saldo_actual == decimal.Decimal("42.00")
+            [log] = session.query(Log).all()
+            assert log.descripcion_cambio.startswith("Generación de cuotas de 'Enero 2026': 2 cargo(s) de 42.00€")
+
+    def test_rerun_only_charges_new_families(self, test_engine):
+        with Session(test_engine) as session:
+            id_periodo = self._seed(session)
+        service = TransactionsService()
+        service.generate_cuotas(id_periodo)
+        with Session(test_engine) as session:
+            _make_socio(session, numero_socio="1005", nombre="Eva", es_titular=True)
+            session.commit()
+
+        resultado = service.generate_cuotas(id_periodo)
+
+        assert (resultado["creados"], resultado["omitidos"]) == (1, 2)
+        assert [c[0] for c in self._cargos(test_engine)] == ["1001", "1002", "1005"]
+
+    def test_descuento_is_subtracted(self, test_engine):
+        with Session(test_engine) as session:
+            id_periodo = self._seed(session, descuento=decimal.Decimal("5.00"))
+
+        resultado = TransactionsService().generate_cuotas(id_periodo)
+
+        assert resultado["monto"] == decimal.Decimal("37.00")
+        assert {c[1] for c in self._cargos(test_engine)} == {decimal.Decimal("37.00")}
+
+    def test_needs_a_single_active_rule_or_an_explicit_one(self, test_engine):
+        with Session(test_engine) as session:
+            id_periodo = self._seed(session)
+            reducida = ReglaCobro(descripcion="Cuota reducida", cuota_mensual=decimal.Decimal("20.00"), estado="activo")
+            session.add(reducida)
+            session.commit()
+            id_reducida = reducida.id_regla
+        service = TransactionsService()
+
+        assert "varias reglas" in service.generate_cuotas(id_periodo)["error"]
+        assert self._cargos(test_engine) == []
+
+        assert service.generate_cuotas(id_periodo, id_regla=id_reducida)["creados"] == 2
+        assert {c[1] for c in self._cargos(test_engine)} == {decimal.Decimal("20.00")}
+
+    def test_unknown_periodo(self, test_engine):
+        with Session(test_engine) as session:
+            self._seed(session)
+
+        assert TransactionsService().generate_cuotas(999)["error"] == "El período indicado no existe."
+
+
+class TestCorrectTransaction:
+    def _seed(self, engine) -> dict:
+        """A 45.00 Cargo in a closed January, then a February and March."""
+        with Session(engine) as session:
+            _make_socio(session, es_titular=True)
+            ids = {
+                nombre: _make_periodo(
+                    session, nombre=nombre, fecha_inicio=datetime.date(2026, mes, 1), fecha_fin=datetime.date(2026, mes, 28)
+                ).id_periodo
+                for nombre, mes in (("Enero", 1), ("Febrero", 2), ("Marzo", 3))
+            }
+            session.commit()
+        service = TransactionsService()
+        for nombre, tipo, monto in (("Enero", "Cargo", "45.00"), ("Febrero", "Cargo", "45.00"), ("Marzo", "Pago", "20.00")):
+            service.add_transaction(
+                {
+                    "numero_socio": "1001",
+                    "id_periodo": ids[nombre],
+                    "id_metodo": None,
+                    "tipo": tipo,
+                    "monto": decimal.Decimal(monto),
+                    "fecha": datetime.date(2026, 1, 10),
+                    "referencia": None,
+                }
+            )
+        with Session(engine) as session:
+            session.query(Periodo).filter_by(id_periodo=ids["Enero"]).update({Periodo.estado: "cerrado"})
+            ids["cargo"] = session.query(Transaccion.id_transaccion).filter_by(id_periodo=ids["Enero"]).scalar()
+            session.commit()
+        return ids
+
+    def _saldos(self, engine) -> list:
+        with Session(engine) as session:
+            return [
+                (s.saldo_anterior, s.saldo_actual)
+                for s in session.query(SaldoSocios).join(Periodo).order_by(Periodo.fecha_inicio)
+            ]
+
+    def test_contra_entry_in_a_closed_periodo_shifts_later_saldos(self, test_engine):
+        ids = self._seed(test_engine)
+        assert self._saldos(test_engine)[-1] == (decimal.Decimal("90.00"), decimal.Decimal("70.00"))
+
+        resultado = TransactionsService().correct_transaction(ids["cargo"], motivo="cargo duplicado")
+
+        assert resultado["error"] is None
+        assert sorted(resultado["tocados"]) == sorted(
+            ("1001", ids[nombre]) for nombre in ("Enero", "Febrero", "Marzo")
+        )
+        D = decimal.Decimal
+        assert self._saldos(test_engine) == [(D("0"), D("0")), (D("0"), D("45.00")), (D("45.00"), D("25.00"))]
+        with Session(test_engine) as session:
+            contra = session.get(Transaccion, resultado["id_transaccion"])
+            assert (contra.tipo, contra.monto, contra.id_periodo) == ("Cargo", D("-45.00"), ids["Enero"])
+            assert contra.referencia == f"{CORRECCION_REFERENCIA}{ids['cargo']}: cargo duplicado"
+            log = session.query(Log).filter_by(accion="corregir").one()
+            assert log.descripcion_cambio.startswith(f"Corrección de #{ids['cargo']} (Cargo de 45.00€")
+            assert "'Febrero'" in log.descripcion_cambio and "'Marzo'" in log.descripcion_cambio
+
+    def test_publishes_the_touched_snapshots_on_commit(self, test_engine):
+        ids = self._seed(test_engine)
+        desde = saldo_changes.version()
+
+        resultado = TransactionsService().correct_transaction(ids["cargo"])
+
+        assert saldo_changes.touched_since(desde) == set(resultado["tocados"])
+        assert saldo_changes.touched_since(saldo_changes.version()) == set()
+
+    def test_a_movement_is_reversed_only_once(self, test_engine):
+        ids = self._seed(test_engine)
+        service = TransactionsService()
+        contra = service.correct_transaction(ids["cargo"])
+
+        assert service.correct_transaction(ids["cargo"])["error"] == f"El movimiento #{ids['cargo']} ya está corregido."
+        assert "ya es una corrección" in service.correct_transaction(contra["id_transaccion"])["error"]
+        assert service.correct_transaction(999)["error"] == "No existe el movimiento #999."
+
+    def test_refunded_pago_is_reversed_only_after_its_reembolso(self, test_engine):
+        ids = self._seed(test_engine)
+        service = TransactionsService()
+        id_reembolso = service.add_transaction(
+            {
+                "numero_socio": "1001",
+                "id_periodo": ids["Marzo"],
+                "id_metodo": None,
+                "tipo": "Reembolso",
+                "monto": decimal.Decimal("15.00"),
+                "fecha": datetime.date(2026, 3, 12),
+                "referencia": None,
+            }
+        )
+        with Session(test_engine) as session:
+            id_pago = session.query(Transaccion.id_transaccion).filter_by(tipo="Pago").scalar()
+
+        rechazo = service.correct_transaction(id_pago)
+
+        assert rechazo["id_transaccion"] is None
+        assert "solo quedan 5.00€ sin reembolsar" in rechazo["error"]
+        assert service.correct_transaction(id_reembolso)["error"] is None
+        assert service.correct_transaction(id_pago)["error"] is None
+        with Session(test_engine) as session:
+            saldo = session.query(SaldoSocios).filter_by(id_periodo=ids["Marzo"]).one()
+            assert saldo.pagos - saldo.reembolsos == 0
+
+
 class TestRefundRequiresPriorPayment:
     def _setup_pago(self, session, monto: str = "45.00") -> dict:
         socio = _make_socio(session)
@@ -492,3 +762,146 @@ class TestListTransactions:
         TransactionsService().list_transactions("", model=model)
 
         assert [r[1] for r in model.rows] == ["2026-01-20", "2026-01-01"]
+
+
+class TestListTransactionsPage:
+    def _seed(self, session, fechas) -> None:
+        socio = _make_socio(session)
+        metodo = _make_metodo(session)
+        periodo = _make_periodo(session)
+        session.add_all(
+            [
+                Transaccion(numero_socio=socio.numero_socio, id_periodo=periodo.id_periodo, id_metodo=metodo.id_metodo, tipo="Cargo", monto=decimal.Decimal(i + 1), fecha=fecha)
+                for i, fecha in enumerate(fechas)
+            ]
+        )
+        session.commit()
+
+    def _all_pages(self, page_size: int, **filters) -> list:
+        service = TransactionsService()
+        rows, token = service.list_transactions_page(page_size=page_size, **filters)
+        pages = [rows]
+        while token is not None:
+            rows, token = service.list_transactions_page(after=token, page_size=page_size, **filters)
+            pages.append(rows)
+        return pages
+
+    def test_pages_follow_fecha_then_id_descending_without_gaps(self, test_engine):
+        fechas = [datetime.date(2026, 1, d) for d in (1, 5, 5, 5, 9, 12, 20)]
+        with Session(test_engine) as session:
+            self._seed(session, fechas)
+
+        pages = self._all_pages(page_size=3)
+
+        assert [len(p) for p in pages] == [3, 3, 1]
+        flat = [r for page in pages for r in page]
+        assert [r[0] for r in flat] == [7, 6, 5, 4, 3, 2, 1]
+
+    def test_null_fecha_rows_come_last_and_are_paged(self, test_engine):
+        fechas = [datetime.date(2026, 1, 3)] * 4
+        with Session(test_engine) as session:
+            self._seed(session, fechas)
+            # Transaccion.fecha defaults to today on insert, so legacy
+            # NULLs have to be written afterwards.
+            session.query(Transaccion).filter(Transaccion.id_transaccion.in_([1, 3])).update({Transaccion.fecha: None})
+            session.query(Transaccion).filter_by(id_transaccion=4).update({Transaccion.fecha: datetime.date(2026, 1, 1)})
+            session.commit()
+
+        pages = self._all_pages(page_size=1)
+
+        assert [r[0] for page in pages for r in page] == [2, 4, 3, 1]
+
+    def test_exact_page_size_has_no_continuation_token(self, test_engine):
+        with Session(test_engine) as session:
+            self._seed(session, [datetime.date(2026, 1, 1), datetime.date(2026, 1, 2)])
+
+        rows, token = TransactionsService().list_transactions_page(page_size=2)
+
+        assert len(rows) == 2
+        assert token is None
+
+    def test_search_filters_before_paging(self, test_engine):
+        with Session(test_engine) as session:
+            self._seed(session, [datetime.date(2026, 1, 1)])
+            _make_socio(session, numero_socio="1002", nombre="Jorge", apellidos="Dominguez")
+            session.add(
+                Transaccion(numero_socio="1002", id_periodo=1, id_metodo=1, tipo="Cargo", monto=decimal.Decimal("45.00"), fecha=datetime.date(2026, 1, 2))
+            )
+            session.commit()
+
+        rows, token = TransactionsService().list_transactions_page("marta", page_size=1)
+
+        assert [r[2] for r in rows] == ["1001 · Marta Fernandez"]
+        assert token is None
+
+    def test_search_is_accent_insensitive_and_escapes_wildcards(self, test_engine):
+        with Session(test_engine) as session:
+            self._seed(session, [datetime.date(2026, 1, 1)])
+            _make_socio(session, numero_socio="1002", nombre="Jorge", apellidos="Domínguez")
+            session.add(
+                Transaccion(numero_socio="1002", id_periodo=1, id_metodo=1, tipo="Cargo", monto=decimal.Decimal("45.00"), fecha=datetime.date(2026, 1, 2))
+            )
+            session.commit()
+
+        service = TransactionsService()
+        assert [r[2] for r in service.list_transactions_page("dominguez")[0]] == ["1002 · Jorge Domínguez"]
+        assert service.list_transactions_page("dom%z")[0] == []
+
+    def _seed_for_sort(self, session) -> None:
+        marta = _make_socio(session)
+        _make_socio(session, numero_socio="1002", nombre="Álvaro", apellidos="Núñez")
+        efectivo = _make_metodo(session)
+        remesa = _make_metodo(session, nombre="REMESA")
+        enero = _make_periodo(session)
+        # Alphabetically before "Enero 2026", chronologically after it.
+        abril = Periodo(nombre="Abril 2026", fecha_inicio=datetime.date(2026, 4, 1), fecha_fin=datetime.date(2026, 4, 30))
+        session.add(abril)
+        session.flush()
+        movimientos = [
+            ("1002", enero, remesa, "Pago", "36.00", datetime.date(2026, 1, 3), None),
+            (marta.numero_socio, abril, efectivo, "Cargo", "12.50", datetime.date(2026, 4, 1), "Cuota"),
+            ("1002", abril, None, "Devolución", "36.00", datetime.date(2026, 4, 9), "Banco"),
+            (marta.numero_socio, enero, efectivo, "Reembolso", "5.00", None, "ajuste"),
+            (marta.numero_socio, enero, remesa, "Cargo", "100.00", datetime.date(2026, 1, 1), None),
+        ]
+        for numero, periodo, metodo, tipo, monto, fecha, referencia in movimientos:
+            session.add(
+                Transaccion(
+                    numero_socio=numero,
+                    id_periodo=periodo.id_periodo,
+                    id_metodo=metodo.id_metodo if metodo else None,
+                    tipo=tipo,
+                    monto=decimal.Decimal(monto),
+                    fecha=fecha,
+                    referencia=referencia,
+                )
+            )
+        session.commit()
+        session.query(Transaccion).filter_by(id_transaccion=4).update({Transaccion.fecha: None})
+        session.commit()
+
+    def test_header_sort_covers_every_page(self, test_engine):
+        from features.members.table_sort import TableSortMixin
+        from features.transactions.service import _TRANSACCION_COLUMNS
+
+        with Session(test_engine) as session:
+            self._seed_for_sort(session)
+        key = TableSortMixin()._make_sort_key
+
+        for index, column in enumerate(_TRANSACCION_COLUMNS):
+            if column == "Período":
+                continue
+            for descending in (False, True):
+                pages = self._all_pages(page_size=2, sort_column=column, descending=descending)
+
+                keys = [key(r[index]) for page in pages for r in page]
+                assert len(keys) == 5, column
+                assert keys == sorted(keys, reverse=descending), (column, descending)
+
+    def test_periodo_sort_is_chronological(self, test_engine):
+        with Session(test_engine) as session:
+            self._seed_for_sort(session)
+
+        pages = self._all_pages(page_size=2, sort_column="Período", descending=True)
+
+        assert [r[6] for page in pages for r in page] == ["Abril 2026"] * 2 + ["Enero 2026"] * 3